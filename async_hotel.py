@@ -0,0 +1,53 @@
+import asyncio
+
+from hotel_system import Hotel, Guest, Invoice
+from booking_engine import BookingEngine
+
+
+class AsyncHotel:
+    """Represents an asyncio facade over a Hotel.
+
+    Searches, reservations and cancellations run in worker threads (asyncio.to_thread), so a slow search or a
+    contended room never stalls the event loop. They are serialized per room by BookingEngine's own locks; the
+    facade adds no asyncio locks of its own.
+    """
+
+    def __init__(self, hotel: Hotel):
+        """Initializes the facade around an existing hotel."""
+        self.__engine = BookingEngine(hotel)
+        self.__hotel = hotel
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    # Methods
+    async def search(self, checkIn, checkOut, roomType: str = None):
+        """Returns the rooms free for the whole stay."""
+        return await asyncio.to_thread(self.__hotel.findAvailableRooms, checkIn, checkOut, roomType)
+
+    async def reserve(self, guest: Guest, roomNumber: int, checkIn, checkOut, totalPrice: float = None):
+        """Books a room, or raises BookingConflictError if any night is already taken."""
+        return await asyncio.to_thread(self.__engine.reserve, guest, roomNumber, checkIn, checkOut, totalPrice)
+
+    async def cancel(self, bookingID: int):
+        """Cancels a booking. Returns False if the booking does not exist."""
+        return await asyncio.to_thread(self.__engine.cancel, bookingID)
+
+    async def invoice(self, bookingID: int):
+        """Creates and adds a pending invoice for a booking's total price.
+
+        Returns None if the booking does not exist, is cancelled or already has an invoice. Nothing is awaited, so
+        no other task can invoice the same booking in between the check and the add.
+        """
+        booking = self.__hotel.getBooking(bookingID)
+        if booking is None or not booking.isActive() or self.__hotel.getBookingInvoice(bookingID) is not None:
+            return None
+
+        invoice = Invoice(self.__hotel.getLastInvoiceID() + 1, booking, float(booking.getTotalPrice()))
+        self.__hotel.addInvoice(invoice)
+        return invoice
+
+    def __str__(self):
+        """Returns a string representation of the async facade."""
+        return f"AsyncHotel for {self.__hotel.getName()} | Bookings: {len(self.__hotel.getBookings())}"
@@ -0,0 +1,594 @@
+import asyncio
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import date
+from types import ModuleType
+
+import hotel_system
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Feedback, GuestServiceRequest
+from booking_engine import BookingEngine, BookingConflictError
+from async_hotel import AsyncHotel
+from hotel_journal import HotelJournal
+from pricing_engine import PricingEngine, np
+from hotel_chain import HotelChain
+from invoice_pipeline import InvoicePipeline
+from guest_directory import GuestDirectory
+from loyalty_ledger import LoyaltyLedger
+from service_dispatcher import ServiceDispatcher
+from feedback_store import FeedbackStore
+from instrumentation import percentile
+from room_index import RoomIndex
+from change_feed import ChangeFeed
+from workload import WorkloadGenerator
+
+
+def measureMemory(factory, count: int = 10000):
+    """Returns the average number of bytes allocated per object built by factory."""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    return (used - objects.__sizeof__()) / count
+
+
+def loadBaselineModule(revision: str = "31d4775", path: str = "hotel_system.py"):
+    """Returns a module as it was in a git revision (by default, before any optimization), or None without git."""
+    try:
+        source = subprocess.run(["git", "show", f"{revision}:{path}"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    module = ModuleType(f"baseline_{os.path.splitext(path)[0]}")
+    exec(compile(source, f"{revision}:{path}", "exec"), module.__dict__)
+    return module
+
+
+def _memoryCases(module):
+    """Returns class name -> factory building objects of that class from a version of hotel_system."""
+    amenities = module.Amenities(True, True, False, True)
+    room = module.Room(101, "Deluxe", 150.0, [amenities])
+    guest = module.Guest("John Doe", "johndoe@example.com")
+    booking = module.Booking(1, guest, room, "2025-04-01", "2025-04-05", 600.0)
+    return {
+        "Amenities": lambda i: module.Amenities(True, i % 2 == 0, False, True),
+        "Room": lambda i: module.Room(i, "Deluxe", 150.0, [amenities]),
+        "Guest": lambda i: module.Guest("John Doe", "johndoe@example.com"),
+        "Booking": lambda i: module.Booking(i, guest, room, "2025-04-01", "2025-04-05", 600.0),
+        "Invoice": lambda i: module.Invoice(i, booking, 600.0),
+        "Feedback": lambda i: module.Feedback(5.0, "Great stay!"),
+    }
+
+
+def benchmarkMemory(count: int = 10000, baseline=None):
+    """Compares per-object memory of the current classes against the same classes in the baseline revision.
+
+    Returns class name -> (baseline bytes, current bytes); the baseline figure is None when it cannot be loaded.
+    """
+    baseline = loadBaselineModule() if baseline is None else baseline
+    before = {} if baseline is None else _memoryCases(baseline)
+    results = {}
+    for name, current in _memoryCases(hotel_system).items():
+        results[name] = (measureMemory(before[name], count) if name in before else None, measureMemory(current, count))
+
+    return results
+
+
+def benchmarkConcurrentBookings(threadCount: int = 8, roomCount: int = 50, attemptsPerThread: int = 2000, seed: int = 7):
+    """Hammers a BookingEngine from many threads, checks no room-night was sold twice, and returns reservations/sec."""
+    hotel = Hotel("Stress Hotel", "Benchmark", 4.0, "stress@example.com")
+    amenities = Amenities(True, True, False, True)
+    hotel.addRooms(Room(number, "Standard", 100.0, [amenities]) for number in range(1, roomCount + 1))
+    engine = BookingEngine(hotel)
+    conflicts = [0] * threadCount
+
+    def worker(index: int):
+        rng = random.Random(seed + index)
+        guest = Guest(f"Guest {index}", f"guest{index}@example.com")
+        firstDay = 739000  # An ordinal day in 2024
+        for _ in range(attemptsPerThread):
+            checkIn = firstDay + rng.randrange(365)
+            try:
+                engine.reserve(guest, rng.randint(1, roomCount), checkIn, checkIn + rng.randint(1, 7))
+            except BookingConflictError:
+                conflicts[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(threadCount)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # Verify no two active bookings of the same room share a night
+    byRoom = {}
+    for booking in hotel.getBookings():
+        if booking.isActive():
+            byRoom.setdefault(booking.getRoom().getRoomNumber(), []).append(booking)
+    for bookings in byRoom.values():
+        bookings.sort()
+        for previous, current in zip(bookings, bookings[1:]):
+            assert not previous.overlaps(current), f"Double booking: {previous} / {current}"
+
+    reservations = len(hotel.getBookings())
+    return {"threads": threadCount, "reservations": reservations, "conflicts": sum(conflicts),
+            "seconds": elapsed, "reservationsPerSecond": reservations / elapsed}
+
+
+def benchmarkAsyncClients(clientCount: int = 5000, roomCount: int = 200, seed: int = 11):
+    """Drives many concurrent simulated clients (search then reserve) through AsyncHotel and returns latency percentiles.
+
+    Each latency covers the worker-thread searches and reservations of one client, queued behind the others.
+    """
+    hotel = Hotel("Flash Sale Hotel", "Benchmark", 4.0, "flash@example.com")
+    amenities = Amenities(True, True, False, True)
+    hotel.addRooms(Room(number, "Standard", 100.0, [amenities]) for number in range(1, roomCount + 1))
+    asyncHotel = AsyncHotel(hotel)
+    rng = random.Random(seed)
+    latencies = []
+    outcomes = {"booked": 0, "conflicts": 0}
+
+    async def client(index: int):
+        guest = Guest(f"Guest {index}", f"guest{index}@example.com")
+        checkIn = 739000 + rng.randrange(30)
+        checkOut = checkIn + rng.randint(1, 4)
+        started = time.perf_counter()
+        await asyncio.sleep(0)  # Let every client start before any finishes, like a burst of requests
+        rooms = await asyncHotel.search(checkIn, checkOut)
+        try:
+            if rooms:
+                await asyncHotel.reserve(guest, rooms[rng.randrange(len(rooms))].getRoomNumber(), checkIn, checkOut)
+                outcomes["booked"] += 1
+        except BookingConflictError:
+            outcomes["conflicts"] += 1
+        latencies.append(time.perf_counter() - started)
+
+    async def burst():
+        await asyncio.gather(*(client(i) for i in range(clientCount)))
+
+    started = time.perf_counter()
+    asyncio.run(burst())
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {"clients": clientCount, **outcomes, "seconds": elapsed,
+            "p50": percentile(latencies, 0.50), "p99": percentile(latencies, 0.99)}
+
+
+def benchmarkJournal(bookingCount: int = 100000, roomCount: int = 1000):
+    """Measures recovery time from the journal and from a snapshot; perf_suite times each journaled mutation."""
+    directory = tempfile.mkdtemp()
+    try:
+        hotel = Hotel("Journal Hotel", "Benchmark", 4.0, "journal@example.com")
+        amenities = Amenities(True, True, False, True)
+        rooms = [Room(number, "Standard", 100.0, [amenities]) for number in range(roomCount)]
+        hotel.addRooms(rooms)
+        guest = Guest("Guest", "guest@example.com")
+        hotel.addGuest(guest)
+        firstDay = date(2025, 1, 1).toordinal()
+        bookings = [Booking(i, guest, rooms[i % roomCount], date.fromordinal(firstDay + (i // roomCount) * 3),
+                            date.fromordinal(firstDay + (i // roomCount) * 3 + 2), 200.0) for i in range(bookingCount)]
+
+        journal = HotelJournal(directory)
+        journal.attach(hotel)
+        hotel.addBookings(bookings)
+        for booking in bookings:
+            booking.setTotalPrice(210.0)
+        journal.close()
+
+        started = time.perf_counter()
+        journal = HotelJournal(directory)
+        journal.recover()
+        fromJournal = time.perf_counter() - started
+        journal.checkpoint()
+        journal.close()
+
+        started = time.perf_counter()
+        HotelJournal(directory).recover()
+        fromSnapshot = time.perf_counter() - started
+    finally:
+        shutil.rmtree(directory)
+
+    return {"bookings": bookingCount, "recoverFromJournal": fromJournal, "recoverFromSnapshot": fromSnapshot}
+
+
+def benchmarkPricing(roomCount: int = 500, nights: int = 14, requests: int = 200):
+    """Compares quoting rooms x nights with PricingEngine against a per-room, per-night Python loop."""
+    amenities = Amenities(True, True, False, True)
+    rooms = [Room(number, "Deluxe" if number % 3 else "Standard", 100.0 + number % 50, [amenities])
+             for number in range(roomCount)]
+    dayOfWeek = [1.0, 1.0, 1.0, 1.0, 1.2, 1.2, 1.0]
+    months = [1.0] * 5 + [1.5, 1.5, 1.5] + [1.0] * 4
+    engine = PricingEngine({"Deluxe": 1.2}, dayOfWeek, months)
+    checkIn = date(2025, 6, 1).toordinal()
+    occupancy = [0.5 + 0.03 * night for night in range(nights)]
+
+    def loopQuotes():
+        quotes = []
+        for room in rooms:
+            total = 0.0
+            for night in range(nights):
+                day = date.fromordinal(checkIn + night)
+                surge = 1.0 + 0.5 * min(max((occupancy[night] - 0.7) / 0.3, 0.0), 1.0)
+                total += (room.getPricePerNight() * (1.2 if room.getRoomType() == "Deluxe" else 1.0)
+                          * dayOfWeek[day.weekday()] * months[day.month - 1] * surge)
+            quotes.append(round(total * 0.95, 2))
+        return quotes
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        loopQuotes()
+    loopSeconds = (time.perf_counter() - started) / requests
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        engine.quoteRooms(rooms, checkIn, checkIn + nights, occupancy, 1500)
+    vectorSeconds = (time.perf_counter() - started) / requests
+
+    assert np.allclose(loopQuotes(), engine.quoteRooms(rooms, checkIn, checkIn + nights, occupancy, 1500))
+    return {"rooms": roomCount, "nights": nights, "loopMilliseconds": loopSeconds * 1000,
+            "vectorMilliseconds": vectorSeconds * 1000}
+
+
+def benchmarkChain(workerCounts=(1, 2, 4, 8), hotelCount: int = 200, roomsPerHotel: int = 100,
+                   bookingsPerHotel: int = 1000, searches: int = 50, seed: int = 3):
+    """Measures chain-wide availability searches per second with the hotels sharded over 1, 2, 4 and 8 workers."""
+    rng = random.Random(seed)
+    amenities = Amenities(True, True, False, True)
+    firstDay = date(2025, 1, 1).toordinal()
+    hotels = []
+    for index in range(hotelCount):
+        hotel = Hotel(f"Hotel {index}", "Benchmark", float(rng.randint(2, 5)), f"hotel{index}@example.com")
+        rooms = [Room(number, "Standard" if number % 4 else "Deluxe", float(rng.randint(80, 250)), [amenities])
+                 for number in range(roomsPerHotel)]
+        hotel.addRooms(rooms)
+        guest = Guest("Guest", "guest@example.com")
+        bookings = []
+        for bookingID in range(bookingsPerHotel):
+            checkIn = firstDay + rng.randrange(365)
+            bookings.append(Booking(bookingID, guest, rooms[rng.randrange(roomsPerHotel)], date.fromordinal(checkIn),
+                                    date.fromordinal(checkIn + rng.randint(1, 5)), 200.0))
+        hotel.addBookings(bookings)
+        hotels.append(hotel)
+    searchDays = [firstDay + rng.randrange(365) for _ in range(searches)]
+
+    results = {}
+    for workers in workerCounts:
+        with HotelChain(hotels, workers) as chain:
+            chain.warmUp()
+            started = time.perf_counter()
+            for day in searchDays:
+                chain.search(day, day + 3, limit=50)
+            elapsed = time.perf_counter() - started
+        results[workers] = {"searchesPerSecond": searches / elapsed, "milliseconds": elapsed / searches * 1000}
+
+    return results
+
+
+def benchmarkBilling(bookingCount: int = 200000, roomCount: int = 1000):
+    """Measures invoice generation and payment-file reconciliation rates, and reconciliation's peak memory."""
+    directory = tempfile.mkdtemp()
+    try:
+        hotel = Hotel("Billing Hotel", "Benchmark", 4.0, "billing@example.com")
+        amenities = Amenities(True, True, False, True)
+        rooms = [Room(number, "Standard", 100.0, [amenities]) for number in range(roomCount)]
+        hotel.addRooms(rooms)
+        guest = Guest("Guest", "guest@example.com")
+        firstDay = date(2020, 1, 1).toordinal()
+        hotel.addBookings(Booking(i, guest, rooms[i % roomCount], date.fromordinal(firstDay + (i // roomCount) * 3),
+                                  date.fromordinal(firstDay + (i // roomCount) * 3 + 2), 200.0)
+                          for i in range(bookingCount))
+        pipeline = InvoicePipeline(hotel)
+
+        started = time.perf_counter()
+        generated = pipeline.generateInvoices().getAddedCount()
+        generateSeconds = time.perf_counter() - started
+
+        path = os.path.join(directory, "payments.csv")
+        with open(path, "w") as paymentFile:
+            paymentFile.write("invoiceID,amount\n")
+            for invoice in hotel.getInvoices():
+                paymentFile.write(f"{invoice.getInvoiceID()},{invoice.getAmountDue():.2f}\n")
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        settled = pipeline.reconcile(path).getAddedCount()
+        reconcileSeconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        shutil.rmtree(directory)
+
+    return {"invoices": generated, "settled": settled, "invoicesPerSecond": generated / generateSeconds,
+            "paymentsPerSecond": settled / reconcileSeconds, "reconcilePeakBytes": peak}
+
+
+def benchmarkGuestDirectory(guestCount: int = 500000, duplicateRate: float = 0.1, seed: int = 13):
+    """Measures building the guest directory and merging every duplicate in one pass."""
+    rng = random.Random(seed)
+    hotel = Hotel("Directory Hotel", "Benchmark", 4.0, "directory@example.com")
+    uniqueCount = int(guestCount * (1 - duplicateRate))
+    guests = [Guest(f"Guest {i}", f"guest{i}@example.com") for i in range(uniqueCount)]
+    guests.extend(Guest(f"guest {i}", f"Guest{i}+promo@Example.com")
+                  for i in (rng.randrange(uniqueCount) for _ in range(guestCount - uniqueCount)))
+    hotel.addGuests(guests)
+
+    started = time.perf_counter()
+    directory = GuestDirectory(hotel)
+    buildSeconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    merged = directory.mergeDuplicates()
+    mergeSeconds = time.perf_counter() - started
+    return {"guests": guestCount, "merged": merged, "buildSeconds": buildSeconds,
+            "mergeSeconds": mergeSeconds}
+
+
+def benchmarkLoyalty(memberCount: int = 1000000, entriesPerMember: int = 4, seed: int = 17):
+    """Measures expiring every member's points in one vectorized pass over a year and a half of entries."""
+    rng = random.Random(seed)
+    hotel = Hotel("Loyalty Hotel", "Benchmark", 4.0, "loyalty@example.com")
+    guests = [Guest(f"Guest {i}", f"guest{i}@example.com") for i in range(memberCount)]
+    hotel.addGuests(guests)
+    ledger = LoyaltyLedger(hotel)
+    firstDay = date(2024, 1, 1).toordinal()
+
+    for guest in guests:
+        for _ in range(entriesPerMember):
+            day = firstDay + rng.randrange(540)
+            if rng.random() < 0.75:
+                ledger.earn(guest, rng.randrange(1, 500), day, notify=False)
+            else:
+                ledger.redeem(guest, rng.randrange(1, 300), day, notify=False)
+
+    result = {"members": memberCount, "entries": ledger.getEntryCount()}
+    if np is not None:
+        started = time.perf_counter()
+        result["expired"] = ledger.expirePoints(date(2025, 7, 1))
+        result["expirySeconds"] = time.perf_counter() - started
+    return result
+
+
+def benchmarkDispatcher(roomCount: int = 2000, requestsPerRoom: int = 3, workerCount: int = 50, seed: int = 19):
+    """Measures a peak hour at a full property: staff threads claim and complete every room's requests."""
+    rng = random.Random(seed)
+    serviceTypes = ["Housekeeping", "Room Service", "Maintenance", "Concierge", "Laundry"]
+    hotel = Hotel("Dispatch Hotel", "Benchmark", 4.0, "dispatch@example.com")
+    guests = [Guest(f"Guest {i}", f"guest{i}@example.com") for i in range(roomCount)]
+    hotel.addGuests(guests)
+    dispatcher = ServiceDispatcher(hotel, priorities={"Maintenance": 1, "Room Service": 2})
+    requests = [(guest, GuestServiceRequest(rng.choice(serviceTypes))) for guest in guests for _ in range(requestsPerRoom)]
+    rng.shuffle(requests)
+
+    for guest, request in requests:
+        guest.submitServiceRequest(request)
+
+    def work(worker):
+        while (request := dispatcher.claim(worker)) is not None:
+            dispatcher.complete(request)
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(workerCount)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    workSeconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = sum(1 for guest in guests for request in guest.getServiceRequests() if request.getStatus() == "Completed")
+    scanMilliseconds = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    indexed = len(dispatcher.getRequests("Completed"))
+    indexMilliseconds = (time.perf_counter() - started) * 1000
+    assert scanned == indexed == len(requests)
+    return {"requests": len(requests), "workers": workerCount, "claimsPerSecond": len(requests) / workSeconds, "scanMilliseconds": scanMilliseconds,
+            "indexMilliseconds": indexMilliseconds}
+
+
+def benchmarkFeedback(feedbackCount: int = 200000, roomCount: int = 1000, seed: int = 23):
+    """Measures average rating and keyword search with the feedback store against a walk of every guest."""
+    rng = random.Random(seed)
+    roomTypes = ["Single", "Double", "Deluxe", "Suite"]
+    words = ["clean", "friendly", "slow", "wifi", "noisy", "breakfast", "view", "comfortable", "dirty", "helpful"]
+    hotel = Hotel("Feedback Hotel", "Benchmark", 4.0, "feedback@example.com")
+    rooms = [Room(i, rng.choice(roomTypes), 100.0, []) for i in range(roomCount)]
+    hotel.addRooms(rooms)
+    guests = [Guest(f"Guest {i}", f"guest{i}@example.com") for i in range(feedbackCount // 4)]
+    hotel.addGuests(guests)
+    checkIn = date(2025, 1, 1)
+    stays = [Booking(i, guests[i % len(guests)], rooms[i % roomCount], checkIn, date(2025, 1, 2), 100.0)
+             for i in range(feedbackCount)]
+    store = FeedbackStore(hotel)
+
+    for stay in stays:
+        stay.getGuest().submitFeedback(Feedback(float(rng.randint(1, 5)), " ".join(rng.sample(words, 4)), stay))
+
+    started = time.perf_counter()
+    ratings = [feedback.getRating() for guest in guests for feedback in guest.getFeedbacks()]
+    scanAverage = sum(ratings) / len(ratings)
+    slowWifi = [feedback for guest in guests for feedback in guest.getFeedbacks()
+                if "slow" in feedback.getComment().split() and "wifi" in feedback.getComment().split()]
+    scanMilliseconds = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    storeAverage = store.getStats()["mean"]
+    found = store.search("slow", "wifi")
+    storeMilliseconds = (time.perf_counter() - started) * 1000
+    assert abs(scanAverage - storeAverage) < 1e-9 and len(found) == len(slowWifi)
+    return {"feedback": feedbackCount, "scanMilliseconds": scanMilliseconds, "storeMilliseconds": storeMilliseconds}
+
+
+def benchmarkRoomIndex(roomCount: int = 100000, bookingCount: int = 200000, searches: int = 100, pageSize: int = 20):
+    """Measures a page of multi-criteria stay search with the bitmap index against scanning the rooms in order.
+
+    The common query (Doubles with WiFi and air conditioning, no minibar, under $250) matches early in a scan;
+    the rare one (Singles with a minibar but no WiFi) makes a scan walk most of the hotel.
+    """
+    hotel = WorkloadGenerator(seed=29).buildHotel(roomCount, 1000, bookingCount)
+    started = time.perf_counter()
+    index = RoomIndex(hotel)
+    buildSeconds = time.perf_counter() - started
+    firstDay = date(2025, 1, 1).toordinal()
+    stays = [(firstDay + i * 3, firstDay + i * 3 + 2) for i in range(searches)]
+    queries = {"common": ("Double", Amenities.WIFI | Amenities.AIR_CONDITIONING, Amenities.MINIBAR, 249.99),
+               "rare": ("Single", Amenities.MINIBAR, Amenities.WIFI, None)}
+
+    def scanPage(checkIn, checkOut, roomType, wanted, unwanted, maxPrice):
+        page = []
+        for room in hotel.getRooms():
+            flags = 0
+            for amenities in room.getAmenities():
+                flags |= amenities.getFlags()
+            if (room.getRoomType() == roomType and flags & wanted == wanted and not flags & unwanted
+                    and (maxPrice is None or room.getPricePerNight() <= maxPrice)
+                    and room.isAvailableBetween(checkIn, checkOut)):
+                page.append(room)
+                if len(page) == pageSize:
+                    break
+        return page
+
+    result = {"rooms": roomCount, "buildSeconds": buildSeconds}
+    for name, (roomType, wanted, unwanted, maxPrice) in queries.items():
+        started = time.perf_counter()
+        scanned = [scanPage(checkIn, checkOut, roomType, wanted, unwanted, maxPrice) for checkIn, checkOut in stays]
+        result[f"{name}ScanMicroseconds"] = (time.perf_counter() - started) / searches * 1e6
+
+        started = time.perf_counter()
+        indexed = [index.search(checkIn, checkOut, roomType, wanted, unwanted, maxPrice=maxPrice, limit=pageSize)
+                   for checkIn, checkOut in stays]
+        result[f"{name}IndexMicroseconds"] = (time.perf_counter() - started) / searches * 1e6
+        assert indexed == scanned
+    return result
+
+
+def benchmarkChangeFeed(roomCount: int = 10000, changeCount: int = 200000, polls: int = 20):
+    """Measures following bookings and room availability by diffing hotel snapshots against the change feed.
+
+    A poll walks every booking and room however little changed; the feed costs each change one event.
+    Feed throughput is timed up to close(), so it includes delivering every event.
+    """
+    hotel = WorkloadGenerator(seed=31).buildHotel(roomCount, 1000, roomCount * 5)
+    rooms = hotel.getRooms()
+
+    def snapshot():
+        return ({booking.getBookingID() for booking in hotel.getBookings() if booking.isActive()},
+                {room.getRoomNumber() for room in rooms if room.isAvailable()})
+
+    previous = snapshot()
+    started = time.perf_counter()
+    for _ in range(polls):
+        current = snapshot()
+        _ = len(current[0] ^ previous[0]) + len(current[1] ^ previous[1])
+        previous = current
+    pollMilliseconds = (time.perf_counter() - started) / polls * 1000
+
+    def churn(feed=None):
+        started = time.perf_counter()
+        for i in range(changeCount):
+            room = rooms[(i * 7919) % roomCount]
+            if room.isAvailable():
+                room.bookRoom()
+            else:
+                room.releaseRoom()
+        if feed is not None:
+            feed.close()
+        return changeCount / (time.perf_counter() - started)
+
+    result = {"rooms": roomCount, "changes": changeCount, "pollMilliseconds": pollMilliseconds,
+              "plainPerSecond": churn()}
+    for mode, background in (("sync", False), ("background", True)):
+        delivered = []
+        feed = ChangeFeed(hotel, capacity=4096, batchSize=256, background=background)
+        feed.subscribe(lambda events: delivered.append(len(events)))
+        result[f"{mode}PerSecond"] = churn(feed)
+        assert sum(delivered) == changeCount
+    return result
+
+
+if __name__ == "__main__":
+    print("----- Memory per object (bytes) -----")
+    for name, (before, after) in benchmarkMemory().items():
+        if before is None:
+            print(f"{name:<10} after: {after:8.1f} (baseline revision unavailable)")
+        else:
+            print(f"{name:<10} before: {before:8.1f} | after: {after:8.1f} | saved: {1 - after / before:6.1%}")
+
+    print("\n----- Concurrent bookings -----")
+    for threadCount in (1, 4, 8):
+        result = benchmarkConcurrentBookings(threadCount)
+        print(f"{threadCount} threads: {result['reservations']} reserved, {result['conflicts']} conflicts, "
+              f"{result['reservationsPerSecond']:,.0f} reservations/sec")
+
+    print("\n----- Async clients -----")
+    result = benchmarkAsyncClients()
+    print(f"{result['clients']} clients: {result['booked']} booked, {result['conflicts']} conflicts, "
+          f"p50 {result['p50'] * 1000:.2f} ms, p99 {result['p99'] * 1000:.2f} ms")
+
+    print("\n----- Journal -----")
+    result = benchmarkJournal()
+    print(f"recover {result['bookings']} bookings: "
+          f"{result['recoverFromJournal']:.2f} s from journal, {result['recoverFromSnapshot']:.2f} s from snapshot")
+
+    if np is not None:
+        print("\n----- Pricing -----")
+        result = benchmarkPricing()
+        print(f"{result['rooms']} rooms x {result['nights']} nights: loop {result['loopMilliseconds']:.2f} ms | "
+              f"PricingEngine {result['vectorMilliseconds']:.2f} ms per request")
+
+    print("\n----- Hotel chain search -----")
+    results = benchmarkChain()
+    for workers, result in results.items():
+        print(f"{workers} workers: {result['searchesPerSecond']:,.1f} searches/sec ({result['milliseconds']:.1f} ms) | "
+              f"speed-up {result['searchesPerSecond'] / results[1]['searchesPerSecond']:.2f}x")
+
+    print("\n----- Billing -----")
+    result = benchmarkBilling()
+    print(f"{result['invoices']} invoices: {result['invoicesPerSecond']:,.0f} generated/sec | "
+          f"{result['paymentsPerSecond']:,.0f} payments reconciled/sec | "
+          f"reconcile peak {result['reconcilePeakBytes'] / 2 ** 20:.1f} MiB")
+
+    print("\n----- Guest directory -----")
+    result = benchmarkGuestDirectory()
+    print(f"{result['guests']} guests: index built in {result['buildSeconds']:.2f} s | {result['merged']} duplicates merged in "
+          f"{result['mergeSeconds']:.2f} s")
+
+    print("\n----- Loyalty ledger -----")
+    result = benchmarkLoyalty()
+    if "expirySeconds" in result:
+        print(f"{result['members']} members: {result['expired']} expired over {result['entries']} entries in "
+              f"{result['expirySeconds']:.2f} s")
+    else:
+        print("expiry skipped (NumPy is not installed)")
+
+    print("\n----- Service dispatcher -----")
+    result = benchmarkDispatcher()
+    print(f"{result['requests']} requests, {result['workers']} workers: {result['claimsPerSecond']:,.0f} claimed and completed/sec | by status: scan "
+          f"{result['scanMilliseconds']:.2f} ms, index {result['indexMilliseconds']:.2f} ms")
+
+    print("\n----- Feedback store -----")
+    result = benchmarkFeedback()
+    print(f"{result['feedback']} feedback: average rating and keyword search: walk {result['scanMilliseconds']:.1f} ms, store {result['storeMilliseconds']:.1f} ms")
+
+    print("\n----- Room index -----")
+    result = benchmarkRoomIndex()
+    print(f"{result['rooms']} rooms: index built in {result['buildSeconds']:.2f} s")
+    for name in ("common", "rare"):
+        print(f"{name} query, page of stay search: scan {result[name + 'ScanMicroseconds']:,.0f} us | "
+              f"index {result[name + 'IndexMicroseconds']:,.0f} us")
+
+    print("\n----- Change feed -----")
+    result = benchmarkChangeFeed()
+    print(f"{result['rooms']} rooms: snapshot diff {result['pollMilliseconds']:.1f} ms per poll | {result['changes']} "
+          f"changes, per second: no feed {result['plainPerSecond']:,.0f}, synchronous feed {result['syncPerSecond']:,.0f}, "
+          f"background feed {result['backgroundPerSecond']:,.0f}")
@@ -0,0 +1,93 @@
+import threading
+from datetime import date
+from itertools import count
+
+from hotel_system import Hotel, Guest, Booking, _toOrdinal
+
+
+class BookingConflictError(Exception):
+    """Raised when a room is already booked for some of the requested nights."""
+
+
+class BookingEngine:
+    """Wraps a Hotel and reserves rooms atomically, serializing check-and-reserve per room."""
+
+    def __init__(self, hotel: Hotel, pricingEngine=None):
+        """Initializes the engine; new booking IDs continue after the hotel's highest existing one.
+
+        With a PricingEngine, reservations made without a totalPrice are priced by it instead of nights x rate.
+        """
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__pricingEngine = pricingEngine
+        self.__roomLocks = {}  # Room number -> Lock
+        self.__locksGuard = threading.Lock()  # Guards creation of room locks
+        self.__hotelLock = threading.Lock()  # Guards the hotel-wide booking list and indexes
+        lastID = max((booking.getBookingID() for booking in hotel.getBookings()), default=0)
+        self.__bookingIDs = count(lastID + 1)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getPricingEngine(self):
+        return self.__pricingEngine
+
+    # Methods
+    def __lockFor(self, roomNumber: int):
+        """Returns the lock that serializes reservations of one room."""
+        lock = self.__roomLocks.get(roomNumber)
+        if lock is None:
+            with self.__locksGuard:
+                lock = self.__roomLocks.setdefault(roomNumber, threading.Lock())
+        return lock
+
+    def reserve(self, guest: Guest, roomNumber: int, checkIn, checkOut, totalPrice: float = None):
+        """Books a room for the given stay, or raises BookingConflictError if any night is already taken."""
+        if not isinstance(guest, Guest):
+            raise TypeError("Invalid guest object.")
+
+        room = self.__hotel.getRoom(roomNumber)
+        if room is None:
+            raise ValueError(f"Room {roomNumber} does not exist.")
+
+        start = _toOrdinal(checkIn)
+        end = _toOrdinal(checkOut)
+        if end <= start:
+            raise ValueError("Check-out date must be after check-in date.")
+
+        if totalPrice is None and self.__pricingEngine is not None:
+            totalPrice = self.__pricingEngine.quoteStay(room, start, end, guest)
+        elif totalPrice is None:
+            totalPrice = float(room.getPricePerNight() * (end - start))
+        elif isinstance(totalPrice, (int, float)) and not isinstance(totalPrice, bool):
+            totalPrice = float(totalPrice)  # Booking only accepts floats
+        else:
+            raise TypeError("The total price must be a number.")
+
+        with self.__lockFor(roomNumber):
+            if not room.isAvailableBetween(start, end):
+                raise BookingConflictError(f"Room {roomNumber} is already booked for part of that stay.")
+
+            booking = Booking(next(self.__bookingIDs), guest, room, date.fromordinal(start), date.fromordinal(end), totalPrice)
+            with self.__hotelLock:
+                self.__hotel.addBooking(booking)
+            guest.addReservation(booking)
+
+        return booking
+
+    def cancel(self, bookingID: int):
+        """Cancels a booking under its room's lock. Returns False if the booking does not exist."""
+        booking = self.__hotel.getBooking(bookingID)
+        if booking is None:
+            return False
+
+        with self.__lockFor(booking.getRoom().getRoomNumber()):
+            booking.cancelBooking()
+        return True
+
+    def __str__(self):
+        """Returns a string representation of the booking engine."""
+        return f"BookingEngine for {self.__hotel.getName()} | Rooms locked so far: {len(self.__roomLocks)}"
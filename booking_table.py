@@ -0,0 +1,161 @@
+from datetime import date
+
+from hotel_system import Hotel
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the columnar analytics need it
+    np = None
+
+_EPOCH_DAY = date(1970, 1, 1).toordinal()  # datetime64[D] counts days from the Unix epoch
+
+
+class BookingTable:
+    """Represents a columnar, NumPy-backed copy of a hotel's bookings for vectorized reporting."""
+
+    def __init__(self, bookingIDs, roomNumbers, guestIndexes, checkIns, checkOuts, totalPrices, activeFlags,
+                 roomTypeCodes, roomTypes: list[str]):
+        """Initializes the table from equally long column arrays."""
+        if np is None:
+            raise ImportError("BookingTable requires NumPy to be installed.")
+
+        self.__bookingIDs = np.asarray(bookingIDs, dtype=np.int64)
+        self.__roomNumbers = np.asarray(roomNumbers, dtype=np.int64)
+        self.__guestIndexes = np.asarray(guestIndexes, dtype=np.int64)  # -1 when the guest is not registered
+        self.__checkIns = np.asarray(checkIns, dtype="datetime64[D]")
+        self.__checkOuts = np.asarray(checkOuts, dtype="datetime64[D]")
+        self.__totalPrices = np.asarray(totalPrices, dtype=np.float64)
+        self.__activeFlags = np.asarray(activeFlags, dtype=bool)
+        self.__roomTypeCodes = np.asarray(roomTypeCodes, dtype=np.int32)  # Index into roomTypes
+        self.__roomTypes = roomTypes
+
+    @classmethod
+    def fromHotel(cls, hotel: Hotel):
+        """Builds a table mirroring hotel.getBookings(); guest indexes refer to hotel.getGuests()."""
+        guestPositions = {id(guest): i for i, guest in enumerate(hotel.getGuests())}
+        roomTypeCodes = {}
+        columns = ([], [], [], [], [], [], [], [])
+
+        for booking in hotel.getBookings():
+            room = booking.getRoom()
+            roomType = room.getRoomType()
+            row = (booking.getBookingID(), room.getRoomNumber(), guestPositions.get(id(booking.getGuest()), -1),
+                   booking.getCheckInDay() - _EPOCH_DAY, booking.getCheckOutDay() - _EPOCH_DAY,
+                   booking.getTotalPrice(), booking.isActive(),
+                   roomTypeCodes.setdefault(roomType, len(roomTypeCodes)))
+            for column, value in zip(columns, row):
+                column.append(value)
+
+        bookingIDs, roomNumbers, guestIndexes, checkIns, checkOuts, totalPrices, activeFlags, typeCodes = columns
+        return cls(bookingIDs, roomNumbers, guestIndexes, np.array(checkIns, dtype=np.int64).astype("datetime64[D]"),
+                   np.array(checkOuts, dtype=np.int64).astype("datetime64[D]"), totalPrices, activeFlags, typeCodes,
+                   list(roomTypeCodes))
+
+    # Getters
+    def getBookingIDs(self):
+        return self.__bookingIDs
+
+    def getRoomNumbers(self):
+        return self.__roomNumbers
+
+    def getGuestIndexes(self):
+        return self.__guestIndexes
+
+    def getCheckIns(self):
+        return self.__checkIns
+
+    def getCheckOuts(self):
+        return self.__checkOuts
+
+    def getTotalPrices(self):
+        return self.__totalPrices
+
+    def getActiveFlags(self):
+        return self.__activeFlags
+
+    def getRoomTypeCodes(self):
+        return self.__roomTypeCodes
+
+    def getRoomTypes(self):
+        return self.__roomTypes
+
+    def getNights(self):
+        """Returns the number of nights of every booking."""
+        return (self.__checkOuts - self.__checkIns).astype(np.int64)
+
+    # Filters
+    def activeMask(self):
+        """Returns a mask selecting active bookings."""
+        return self.__activeFlags
+
+    def roomTypeMask(self, roomType: str):
+        """Returns a mask selecting bookings of the given room type."""
+        if roomType not in self.__roomTypes:
+            return np.zeros(len(self), dtype=bool)
+
+        return self.__roomTypeCodes == self.__roomTypes.index(roomType)
+
+    def overlapMask(self, start, end):
+        """Returns a mask selecting bookings that hold at least one night from start up to end."""
+        start, end = np.datetime64(start, "D"), np.datetime64(end, "D")
+        return (self.__checkIns < end) & (self.__checkOuts > start)
+
+    def filter(self, mask):
+        """Returns a new table holding only the rows selected by mask."""
+        return BookingTable(self.__bookingIDs[mask], self.__roomNumbers[mask], self.__guestIndexes[mask],
+                            self.__checkIns[mask], self.__checkOuts[mask], self.__totalPrices[mask],
+                            self.__activeFlags[mask], self.__roomTypeCodes[mask], self.__roomTypes)
+
+    # Aggregates
+    def totalRevenue(self, activeOnly: bool = True):
+        """Returns the summed booking price."""
+        prices = self.__totalPrices[self.__activeFlags] if activeOnly else self.__totalPrices
+        return float(prices.sum())
+
+    def revenueByRoomType(self, activeOnly: bool = True):
+        """Returns a dict of room type -> summed booking price."""
+        weights = np.where(self.__activeFlags, self.__totalPrices, 0.0) if activeOnly else self.__totalPrices
+        totals = np.bincount(self.__roomTypeCodes, weights=weights, minlength=len(self.__roomTypes))
+        return {roomType: float(total) for roomType, total in zip(self.__roomTypes, totals)}
+
+    def occupancyPerNight(self, start, end, activeOnly: bool = True):
+        """Returns (nights, occupied room count per night) for every night from start up to end."""
+        start, end = np.datetime64(start, "D"), np.datetime64(end, "D")
+        days = int((end - start).astype(np.int64))
+        nights = np.arange(start, end, dtype="datetime64[D]")
+        if days <= 0:
+            return nights, np.zeros(0, dtype=np.int64)
+
+        mask = self.overlapMask(start, end)
+        if activeOnly:
+            mask &= self.__activeFlags
+
+        # Each stay adds +1 on its first night in range and -1 after its last one; a running sum gives occupancy
+        first = (np.maximum(self.__checkIns[mask], start) - start).astype(np.int64)
+        last = (np.minimum(self.__checkOuts[mask], end) - start).astype(np.int64)
+        changes = np.bincount(first, minlength=days + 1) - np.bincount(last, minlength=days + 1)
+        return nights, np.cumsum(changes[:days])
+
+    def averageDailyRate(self, start, end, activeOnly: bool = True):
+        """Returns the average revenue per occupied room-night from start up to end (ADR)."""
+        start, end = np.datetime64(start, "D"), np.datetime64(end, "D")
+        mask = self.overlapMask(start, end)
+        if activeOnly:
+            mask &= self.__activeFlags
+
+        checkIns, checkOuts = self.__checkIns[mask], self.__checkOuts[mask]
+        stayNights = (checkOuts - checkIns).astype(np.int64)
+        nightsInRange = (np.minimum(checkOuts, end) - np.maximum(checkIns, start)).astype(np.int64)
+        roomNights = nightsInRange.sum()
+        if roomNights == 0:
+            return 0.0
+
+        revenue = (self.__totalPrices[mask] / np.maximum(stayNights, 1) * nightsInRange).sum()
+        return float(revenue / roomNights)
+
+    def __len__(self):
+        return len(self.__bookingIDs)
+
+    def __str__(self):
+        """Returns a string representation of the booking table."""
+        return f"BookingTable: {len(self)} bookings | Active: {int(self.__activeFlags.sum())} | Room types: {len(self.__roomTypes)}"
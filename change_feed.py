@@ -0,0 +1,418 @@
+import threading
+import time
+
+from hotel_system import Hotel, Room, Booking, Invoice, GuestServiceRequest, _reportError
+
+OVERFLOW_POLICIES = ("block", "dropOldest", "dropNewest")
+
+
+class ChangeEvent:
+    """Represents one change published on a ChangeFeed: what changed, when, and its place in the feed."""
+
+    __slots__ = ("__subject", "__timestamp", "__sequence")
+
+    def __init__(self, subject):
+        self.__subject = subject
+        self.__timestamp = time.time()
+        self.__sequence = None
+
+    # Getters
+    def getSubject(self):
+        return self.__subject
+
+    def getTimestamp(self):
+        return self.__timestamp
+
+    def getSequence(self):
+        return self.__sequence
+
+    # Setters
+    def setSequence(self, sequence: int):
+        """Numbers the event; the feed calls this once when the event is published."""
+        self.__sequence = sequence
+
+    def __str__(self):
+        """Returns a string representation of the change event."""
+        return f"{type(self).__name__} #{self.__sequence} | {self.__subject}"
+
+
+class RoomBooked(ChangeEvent):
+    """A room was marked booked after being available."""
+
+    __slots__ = ()
+
+    def getRoom(self):
+        return self.getSubject()
+
+
+class RoomReleased(ChangeEvent):
+    """A room was marked available after being booked."""
+
+    __slots__ = ()
+
+    def getRoom(self):
+        return self.getSubject()
+
+
+class BookingAdded(ChangeEvent):
+    """A booking was added to the hotel."""
+
+    __slots__ = ()
+
+    def getBooking(self):
+        return self.getSubject()
+
+
+class BookingCancelled(ChangeEvent):
+    """A booking was cancelled."""
+
+    __slots__ = ()
+
+    def getBooking(self):
+        return self.getSubject()
+
+
+class InvoicePaid(ChangeEvent):
+    """An invoice became paid."""
+
+    __slots__ = ("__previousStatus",)
+
+    def __init__(self, invoice: Invoice, previousStatus: str):
+        super().__init__(invoice)
+        self.__previousStatus = previousStatus
+
+    def getInvoice(self):
+        return self.getSubject()
+
+    def getPreviousStatus(self):
+        return self.__previousStatus
+
+
+class ServiceRequestStatusChanged(ChangeEvent):
+    """A guest service request moved from one status to another."""
+
+    __slots__ = ("__previousStatus", "__status")
+
+    def __init__(self, request: GuestServiceRequest, previousStatus: str, status: str):
+        super().__init__(request)
+        self.__previousStatus = previousStatus
+        self.__status = status
+
+    def getRequest(self):
+        return self.getSubject()
+
+    def getPreviousStatus(self):
+        return self.__previousStatus
+
+    def getStatus(self):
+        """Returns the status the request moved to, which it may since have left."""
+        return self.__status
+
+
+class ChangeFeed:
+    """Represents an in-process feed of typed change events from a hotel, delivered to subscribers in batches.
+
+    The feed listens to the hotel and turns room availability flips, added and cancelled bookings, paid invoices
+    and service request status changes into ChangeEvents, numbered in order of publication. Events wait in a
+    bounded ring buffer of capacity slots and reach every subscriber as lists of at most batchSize events, in
+    order, one batch at a time.
+
+    Synchronously, the producer that fills a batch delivers it before its change returns, and partial batches
+    wait for flush(). In the background, a worker thread delivers a batch once it is full or its first event has
+    waited maxDelay seconds. When the buffer is full the overflow policy applies: "block" makes producers wait for
+    room (for at most blockTimeout seconds, then the oldest event is dropped), "dropOldest" overwrites the oldest
+    event and "dropNewest" discards the new one. A subscriber that sees a gap in sequence numbers has missed
+    events and should resync from the hotel's full state.
+
+    Producers publish from inside hotel changes, often while holding a lock such as a BookingEngine's room lock.
+    A background subscriber that waits on such a lock cannot make room for a producer holding it, so a blocked
+    producer gives up after blockTimeout seconds instead of deadlocking. Passing blockTimeout=None waits
+    indefinitely and is only safe when subscribers never wait on locks that producers may hold.
+    """
+
+    def __init__(self, hotel: Hotel, capacity: int = 1024, batchSize: int = 64, background: bool = False,
+                 overflow: str = "block", maxDelay: float = 0.05, blockTimeout: float = 1.0):
+        """Creates the buffer, starts the worker thread when in the background and starts listening to the hotel."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        if capacity < 1:
+            raise ValueError("The capacity must be positive.")
+
+        if not 1 <= batchSize <= capacity:
+            raise ValueError("The batch size must be between 1 and the capacity.")
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}.")
+
+        self.__hotel = hotel
+        self.__capacity = capacity
+        self.__batchSize = batchSize
+        self.__overflow = overflow
+        self.__maxDelay = maxDelay
+        self.__blockTimeout = blockTimeout
+        self.__condition = threading.Condition()
+        self.__buffer = [None] * capacity  # Ring of events waiting for delivery
+        self.__head = 0  # Slot of the oldest waiting event
+        self.__size = 0  # Number of waiting events
+        self.__subscribers = []  # (callback, event types or None); replaced, never changed, so delivery needs no lock
+        self.__nextSequence = 1
+        self.__published = 0
+        self.__delivered = 0
+        self.__dropped = 0
+        self.__delivering = None  # Ident of the thread delivering a batch, if any
+        self.__flushing = 0  # Number of flush calls waiting on the worker
+        self.__closed = False
+
+        self.__worker = None
+        if background:
+            self.__worker = threading.Thread(target=self.__run, name="ChangeFeed", daemon=True)
+            self.__worker.start()
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getCapacity(self):
+        return self.__capacity
+
+    def getBatchSize(self):
+        return self.__batchSize
+
+    def getOverflow(self):
+        return self.__overflow
+
+    def getBlockTimeout(self):
+        return self.__blockTimeout
+
+    def isBackground(self):
+        return self.__worker is not None
+
+    def getPendingCount(self):
+        with self.__condition:
+            return self.__size
+
+    def getDroppedCount(self):
+        with self.__condition:
+            return self.__dropped
+
+    def getStats(self):
+        """Returns the numbers of events published, delivered, dropped and still pending."""
+        with self.__condition:
+            return {"published": self.__published, "delivered": self.__delivered, "dropped": self.__dropped,
+                    "pending": self.__size}
+
+    # Methods
+    def subscribe(self, callback, eventTypes=None):
+        """Registers callback(events) for batches of events, optionally only those of a ChangeEvent type or tuple of types."""
+        if eventTypes is not None:
+            eventTypes = eventTypes if isinstance(eventTypes, tuple) else (eventTypes,)
+            if not all(isinstance(eventType, type) and issubclass(eventType, ChangeEvent) for eventType in eventTypes):
+                raise TypeError("Event types must be ChangeEvent classes.")
+
+        with self.__condition:
+            self.__subscribers = self.__subscribers + [(callback, eventTypes)]
+
+    def unsubscribe(self, callback):
+        """Unregisters a callback added with subscribe. Batches already being delivered may still reach it."""
+        with self.__condition:
+            self.__subscribers = [entry for entry in self.__subscribers if entry[0] != callback]
+
+    def publish(self, event: ChangeEvent):
+        """Numbers an event and queues it for delivery. Returns False if the overflow policy discarded it."""
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("The change feed is closed.")
+
+            event.setSequence(self.__nextSequence)
+            self.__nextSequence += 1
+            self.__published += 1
+            accepted = self.__push(event)
+            ready = self.__size >= self.__batchSize
+            if self.__worker is not None:
+                if ready:
+                    self.__condition.notify_all()
+                return accepted
+
+            deliver = ready and self.__delivering is None
+            if deliver:
+                self.__delivering = threading.get_ident()
+
+        if deliver:
+            self.__drain(False)
+        return accepted
+
+    def flush(self):
+        """Delivers every waiting event before returning. Called from a subscriber, it returns at once instead."""
+        ident = threading.get_ident()
+        with self.__condition:
+            if self.__worker is not None:
+                if self.__worker.ident == ident:
+                    return
+
+                self.__flushing += 1
+                self.__condition.notify_all()
+                while (self.__size or self.__delivering is not None) and self.__worker.is_alive():
+                    self.__condition.wait()
+                self.__flushing -= 1
+                return
+
+            if self.__delivering == ident:
+                return
+
+            while self.__delivering is not None:
+                self.__condition.wait()
+            self.__delivering = ident
+        self.__drain(True)
+
+    def close(self):
+        """Stops listening to the hotel, delivers the waiting events and stops the worker thread."""
+        self.__hotel.removeListener(self.__onChange)
+        self.flush()
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        if self.__worker is not None and self.__worker.ident != threading.get_ident():
+            self.__worker.join()
+
+    def __push(self, event: ChangeEvent):
+        """Adds an event to the ring, applying the overflow policy when it is full. The caller holds the lock."""
+        deadline = None
+        while self.__size == self.__capacity:
+            if self.__overflow == "dropNewest":
+                self.__dropped += 1
+                return False
+
+            if self.__overflow == "block" and self.__canWait():
+                if self.__blockTimeout is None:
+                    self.__condition.notify_all()
+                    self.__condition.wait()
+                    continue
+
+                if deadline is None:
+                    deadline = time.monotonic() + self.__blockTimeout
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self.__condition.notify_all()
+                    self.__condition.wait(remaining)
+                    continue
+
+            # Overwrite the oldest event
+            self.__buffer[self.__head] = None
+            self.__head = (self.__head + 1) % self.__capacity
+            self.__size -= 1
+            self.__dropped += 1
+
+        self.__buffer[(self.__head + self.__size) % self.__capacity] = event
+        self.__size += 1
+        return True
+
+    def __canWait(self):
+        """Whether another thread is able to make room. A thread never waits on a delivery it is making itself."""
+        ident = threading.get_ident()
+        if self.__worker is not None:
+            return self.__worker.is_alive() and self.__worker.ident != ident
+        return self.__delivering is not None and self.__delivering != ident
+
+    def __take(self):
+        """Removes and returns the oldest batch of events. The caller holds the lock."""
+        count = min(self.__size, self.__batchSize)
+        batch = []
+        for _ in range(count):
+            batch.append(self.__buffer[self.__head])
+            self.__buffer[self.__head] = None
+            self.__head = (self.__head + 1) % self.__capacity
+        self.__size -= count
+        self.__condition.notify_all()  # Wake producers waiting for room
+        return batch
+
+    def __deliver(self, batch: list):
+        """Hands a batch to every subscriber, filtered to the types it asked for. Subscriber errors are reported."""
+        for callback, eventTypes in self.__subscribers:
+            events = batch if eventTypes is None else [event for event in batch if isinstance(event, eventTypes)]
+            if events:
+                try:
+                    callback(events)
+                except Exception as e:
+                    _reportError("ChangeFeed.deliver", e)
+
+    def __drain(self, everything: bool):
+        """Delivers full batches, or every waiting event, on the calling thread, which has claimed delivery.
+
+        The claim is given up in the same locked step that finds nothing left to deliver, so a producer filling a
+        batch meanwhile either sees the claim gone and delivers itself, or leaves its batch to this loop.
+        """
+        batch = []
+        try:
+            while True:
+                with self.__condition:
+                    self.__delivered += len(batch)
+                    if not self.__size or (self.__size < self.__batchSize and not everything):
+                        self.__delivering = None
+                        self.__condition.notify_all()
+                        return
+                    batch = self.__take()
+                self.__deliver(batch)
+        except BaseException:
+            with self.__condition:
+                self.__delivering = None
+                self.__condition.notify_all()
+            raise
+
+    def __run(self):
+        """Worker thread: delivers a batch once it is full, has waited maxDelay, or a flush or close asks for it."""
+        condition = self.__condition
+        while True:
+            with condition:
+                while not self.__size and not self.__closed:
+                    condition.wait()
+                if not self.__size:
+                    return
+
+                deadline = time.monotonic() + self.__maxDelay
+                while self.__size < self.__batchSize and not self.__closed and not self.__flushing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    condition.wait(remaining)
+                batch = self.__take()
+                self.__delivering = self.__worker.ident
+
+            self.__deliver(batch)
+            with condition:
+                self.__delivered += len(batch)
+                self.__delivering = None
+                condition.notify_all()
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: publishes the changes downstream consumers follow."""
+        if isinstance(subject, Room):
+            if event not in ("bookRoom", "releaseRoom") or subject.isAvailable() == details[0]:
+                return
+            changeEvent = RoomReleased(subject) if subject.isAvailable() else RoomBooked(subject)
+        elif isinstance(subject, Booking):
+            if event == "addBooking":
+                changeEvent = BookingAdded(subject)
+            elif event == "cancelBooking":
+                changeEvent = BookingCancelled(subject)
+            else:
+                return
+        elif isinstance(subject, Invoice):
+            if event not in ("markAsPaid", "setPaymentStatus") or subject.getPaymentStatus() != "Paid" \
+                    or details[0] == "Paid":
+                return
+            changeEvent = InvoicePaid(subject, details[0])
+        elif isinstance(subject, GuestServiceRequest):
+            if event not in ("setStatus", "markAsCompleted", "cancelRequest") or subject.getStatus() == details[0]:
+                return
+            changeEvent = ServiceRequestStatusChanged(subject, details[0], subject.getStatus())
+        else:
+            return
+
+        self.publish(changeEvent)
+
+    def __str__(self):
+        """Returns a string representation of the change feed."""
+        mode = "background" if self.__worker is not None else "synchronous"
+        return f"ChangeFeed for {self.__hotel.getName()} | {mode} | Pending: {self.__size}/{self.__capacity} | Dropped: {self.__dropped}"
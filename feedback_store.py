@@ -0,0 +1,185 @@
+import math
+import re
+import threading
+
+from hotel_system import Hotel, Room, Guest, Feedback
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(comment: str):
+    """Returns the distinct search tokens of a comment: case folded words, with hyphens joined ("Wi-Fi" -> "wifi")."""
+    return set(_TOKEN.findall(comment.casefold().replace("-", "")))
+
+
+def _star(rating: float):
+    """Returns the histogram bucket of a rating: the nearest whole star, 1 to 5."""
+    return min(5, max(1, int(rating + 0.5)))
+
+
+class FeedbackStore:
+    """Represents a hotel's guest feedback with running rating statistics and a keyword index.
+
+    Every submission or rating change updates, in O(1), the count, mean, variance (Welford's method) and star
+    histogram of the hotel and of the room type of the stay the feedback is about. Comments are indexed by token,
+    so keyword queries read posting lists instead of walking every guest. When a room's type changes, the ratings
+    of its stays move to the new type's statistics. With updateRating, the hotel's rating follows the running mean.
+    """
+
+    def __init__(self, hotel: Hotel, updateRating: bool = True):
+        """Indexes the feedback of the hotel's guests and starts listening to its changes."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__updateRating = updateRating
+        self.__lock = threading.RLock()
+        self.__arrivals = 0
+        self.__indexed = {}  # Feedback -> (arrival number, room type, rating, tokens, room) it is counted under
+        self.__stats = {}  # Room type (None for the whole hotel) -> [count, mean, sum of squared deviations, histogram]
+        self.__postings = {}  # Token -> {Feedback: None}
+        self.__byRoom = {}  # Room -> {Feedback: None} about stays in it
+
+        for guest in hotel.iterGuests():
+            for feedback in guest.iterFeedbacks():
+                self.__add(feedback)
+        self.__publishRating()
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getFeedbackCount(self):
+        return len(self.__indexed)
+
+    def getStats(self, roomType: str = None):
+        """Returns the count, mean, variance and star histogram (index 0 is one star) of a room type or the hotel."""
+        with self.__lock:
+            count, mean, squares, histogram = self.__stats.get(roomType, (0, 0.0, 0.0, [0] * 5))
+            return {"count": count, "mean": mean if count else None,
+                    "variance": squares / count if count else None, "histogram": list(histogram)}
+
+    def getRoomTypes(self):
+        """Returns the room types with feedback about their stays."""
+        return [roomType for roomType in self.__stats if roomType is not None]
+
+    # Methods
+    def search(self, *keywords: str, roomType: str = None, maxRating: float = None):
+        """Returns the feedback whose comment contains every keyword, oldest first, optionally for one room type
+        or with a rating of at most maxRating.
+        """
+        tokens = set().union(*(tokenize(keyword) for keyword in keywords))
+        with self.__lock:
+            postings = sorted((self.__postings.get(token, {}) for token in tokens), key=len)
+            if not postings:
+                return []
+
+            matches = [feedback for feedback in postings[0]
+                       if all(feedback in posting for posting in postings[1:])
+                       and (roomType is None or self.__indexed[feedback][1] == roomType)
+                       and (maxRating is None or self.__indexed[feedback][2] <= maxRating)]
+            return sorted(matches, key=lambda feedback: self.__indexed[feedback][0])
+
+    def close(self):
+        """Stops listening to the hotel."""
+        self.__hotel.removeListener(self.__onChange)
+
+    def __add(self, feedback: Feedback, arrival: int = None):
+        with self.__lock:
+            if feedback in self.__indexed:
+                return
+
+            if arrival is None:
+                arrival, self.__arrivals = self.__arrivals, self.__arrivals + 1
+            booking = feedback.getBooking()
+            room = None if booking is None else booking.getRoom()
+            roomType = None if room is None else room.getRoomType()
+            rating, tokens = feedback.getRating(), tokenize(feedback.getComment())
+            self.__indexed[feedback] = (arrival, roomType, rating, tokens, room)
+            for key in {None, roomType}:
+                self.__count(key, rating, 1)
+            if room is not None:
+                self.__byRoom.setdefault(room, {})[feedback] = None
+            for token in tokens:
+                self.__postings.setdefault(token, {})[feedback] = None
+
+    def __remove(self, feedback: Feedback):
+        with self.__lock:
+            entry = self.__indexed.pop(feedback, None)
+            if entry is None:
+                return None
+
+            _, roomType, rating, tokens, room = entry
+            for key in {None, roomType}:
+                self.__count(key, rating, -1)
+            if room is not None:
+                feedbacks = self.__byRoom[room]
+                del feedbacks[feedback]
+                if not feedbacks:
+                    del self.__byRoom[room]
+            for token in tokens:
+                posting = self.__postings[token]
+                del posting[feedback]
+                if not posting:
+                    del self.__postings[token]
+            return entry
+
+    def __count(self, key: str, rating: float, sign: int):
+        """Adds (sign 1) or removes (sign -1) one rating from a running count, mean, variance and histogram."""
+        stats = self.__stats.get(key)
+        if stats is None:
+            stats = self.__stats[key] = [0, 0.0, 0.0, [0] * 5]
+
+        count, mean, squares, histogram = stats
+        count += sign
+        if count == 0:
+            del self.__stats[key]
+            return
+
+        delta = rating - mean
+        newMean = mean + sign * delta / count
+        stats[0], stats[1] = count, newMean
+        stats[2] = max(0.0, squares + sign * delta * (rating - newMean))
+        histogram[_star(rating) - 1] += sign
+
+    def __retype(self, room: Room):
+        """Moves the ratings of a room's stays from the room type they were counted under to its current one."""
+        with self.__lock:
+            roomType = room.getRoomType()
+            for feedback in self.__byRoom.get(room, ()):
+                arrival, previousType, rating, tokens, _ = self.__indexed[feedback]
+                if previousType != roomType:
+                    self.__count(previousType, rating, -1)
+                    self.__count(roomType, rating, 1)
+                    self.__indexed[feedback] = (arrival, roomType, rating, tokens, room)
+
+    def __publishRating(self):
+        """Sets the hotel's rating to the running mean of its feedback."""
+        if self.__updateRating and None in self.__stats:
+            rating = round(self.__stats[None][1], 2)
+            if not math.isclose(rating, self.__hotel.getRating()):
+                self.__hotel.setRating(rating)
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: keeps the statistics and the index in step with the guests' feedback."""
+        if event == "submitFeedback":
+            self.__add(details[0])
+        elif isinstance(subject, Feedback):
+            entry = self.__remove(subject)
+            if entry is None:
+                return
+            self.__add(subject, entry[0])  # Recounted under its new rating, comment or stay, keeping its age
+        elif event == "removeGuest" and isinstance(subject, Guest):
+            for feedback in subject.iterFeedbacks():
+                self.__remove(feedback)
+        elif event == "setRoomType" and isinstance(subject, Room):
+            self.__retype(subject)
+            return  # The hotel-wide mean is unchanged
+        else:
+            return
+        self.__publishRating()
+
+    def __str__(self):
+        """Returns a string representation of the feedback store."""
+        return f"FeedbackStore for {self.__hotel.getName()} | Feedback: {len(self.__indexed)} | Tokens: {len(self.__postings)}"
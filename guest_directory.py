@@ -0,0 +1,187 @@
+import unicodedata
+from bisect import insort
+from itertools import count
+
+from hotel_system import Hotel, Guest, LoyaltyProgram
+
+
+def normalizeContact(contactInfo: str):
+    """Returns the matching key of contact info: emails lowercased without +tags, phone numbers as digits only.
+
+    Returns None for empty contact info, which matches no one.
+    """
+    contact = contactInfo.strip().casefold()
+    if not contact:
+        return None
+
+    if "@" in contact:
+        local, _, domain = contact.rpartition("@")
+        local = local.split("+", 1)[0]
+        if domain in ("gmail.com", "googlemail.com"):  # Gmail ignores dots in the local part
+            local, domain = local.replace(".", ""), "gmail.com"
+        return f"{local}@{domain}"
+
+    digits = "".join(character for character in contact if character.isdigit())
+    return digits or contact
+
+
+def normalizeName(name: str):
+    """Returns the matching key of a name: accents removed, case folded and whitespace collapsed."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    return " ".join("".join(character for character in decomposed if not unicodedata.combining(character))
+                    .casefold().split())
+
+
+class GuestDirectory:
+    """Represents an index of a hotel's guests by normalized contact info, kept current as guests change.
+
+    resolve finds the guest behind contact info in O(1), so returning guests are found instead of duplicated.
+    With fuzzy enabled, an n-gram index of names also answers findSimilar for misspelled names. The guests under
+    a contact key are kept in registration order and the first is its primary; mergeDuplicates folds every later
+    one into it. When the primary is removed or changes contact, the next guest under the key takes its place.
+    Guests without contact info are never matched or merged.
+    """
+
+    def __init__(self, hotel: Hotel, fuzzy: bool = False, ngramSize: int = 3):
+        """Indexes the hotel's current guests and starts listening to its changes."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__fuzzy = fuzzy
+        self.__ngramSize = ngramSize
+        self.__byContact = {}  # Normalized contact info -> its Guests in registration order, primary first
+        self.__registrations = {}  # Guest -> registration number, ordering the guests under a key
+        self.__nextRegistration = count()
+        self.__byGram = {}  # Name n-gram -> set of Guests whose normalized name contains it (fuzzy only)
+        for guest in hotel.iterGuests():
+            self.__index(guest)
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def isFuzzy(self):
+        return self.__fuzzy
+
+    # Methods
+    def resolve(self, contactInfo: str):
+        """Returns the primary guest with matching contact info, or None."""
+        guests = self.__byContact.get(normalizeContact(contactInfo))
+        return None if guests is None else guests[0]
+
+    def checkIn(self, name: str, contactInfo: str):
+        """Returns the guest behind the contact info, registering a new guest with the hotel if there is none."""
+        guest = self.resolve(contactInfo)
+        if guest is None:
+            guest = Guest(name, contactInfo)
+            self.__hotel.addGuest(guest)
+        return guest
+
+    def findSimilar(self, name: str, limit: int = 5, minScore: float = 0.5):
+        """Returns up to limit (score, guest) pairs whose name shares n-grams with name, best first (fuzzy only)."""
+        if not self.__fuzzy:
+            raise ValueError("findSimilar needs a directory built with fuzzy=True.")
+
+        grams = self.__grams(normalizeName(name))
+        shared = {}
+        for gram in grams:
+            for guest in self.__byGram.get(gram, ()):
+                shared[guest] = shared.get(guest, 0) + 1
+
+        matches = []
+        for guest, count in shared.items():
+            score = 2.0 * count / (len(grams) + len(self.__grams(normalizeName(guest.getName()))))  # Dice coefficient
+            if score >= minScore:
+                matches.append((score, guest))
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return matches[:limit]
+
+    def mergeDuplicates(self):
+        """Merges every guest sharing a contact key with an earlier guest into that primary, in one pass.
+
+        Bookings move to the primary, which takes over reservations, service requests, feedback and loyalty
+        points; a duplicate's loyalty program points are added to the primary's program. The duplicates are then
+        removed from the hotel. Returns the number of duplicates merged.
+        """
+        hotel = self.__hotel
+        primaries = {}  # Duplicate Guest -> primary Guest
+        for guest in hotel.iterGuests():
+            primary = self.resolve(guest.getContactInfo())
+            if primary is not None and primary is not guest:
+                primaries[guest] = primary
+        if not primaries:
+            return 0
+
+        for booking in hotel.iterBookings():
+            primary = primaries.get(booking.getGuest())
+            if primary is not None:
+                booking.setGuest(primary)
+
+        for duplicate, primary in primaries.items():
+            primary.mergeFrom(duplicate)
+            duplicateProgram = hotel.getLoyaltyProgram(duplicate)
+            if duplicateProgram is not None:
+                primaryProgram = hotel.getLoyaltyProgram(primary)
+                if primaryProgram is None:
+                    primaryProgram = LoyaltyProgram(primary)
+                    hotel.addLoyaltyProgram(primaryProgram)
+                primaryProgram.addPoints(duplicateProgram.getPoints())
+
+        hotel.removeGuests(primaries)
+        return len(primaries)
+
+    def close(self):
+        """Stops listening to the hotel."""
+        self.__hotel.removeListener(self.__onChange)
+
+    def __grams(self, text: str):
+        padded = f" {text} "
+        return {padded[i:i + self.__ngramSize] for i in range(max(1, len(padded) - self.__ngramSize + 1))}
+
+    def __index(self, guest: Guest, contactInfo: str = None, name: str = None):
+        key = normalizeContact(guest.getContactInfo() if contactInfo is None else contactInfo)
+        if key is not None:
+            if guest not in self.__registrations:
+                self.__registrations[guest] = next(self.__nextRegistration)
+            insort(self.__byContact.setdefault(key, []), guest, key=self.__registrations.get)
+        if self.__fuzzy:
+            for gram in self.__grams(normalizeName(guest.getName() if name is None else name)):
+                self.__byGram.setdefault(gram, set()).add(guest)
+
+    def __unindex(self, guest: Guest, contactInfo: str = None, name: str = None):
+        key = normalizeContact(guest.getContactInfo() if contactInfo is None else contactInfo)
+        guests = self.__byContact.get(key)
+        if guests is not None and guest in guests:
+            guests.remove(guest)  # The next guest in registration order becomes the primary
+            if not guests:
+                del self.__byContact[key]
+        if self.__fuzzy:
+            for gram in self.__grams(normalizeName(guest.getName() if name is None else name)):
+                guests = self.__byGram.get(gram)
+                if guests is not None:
+                    guests.discard(guest)
+                    if not guests:
+                        del self.__byGram[gram]
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: keeps the indexes in step with added, removed and renamed guests."""
+        if not isinstance(subject, Guest):
+            return
+
+        if event == "addGuest":
+            self.__index(subject)
+        elif event == "removeGuest":
+            self.__unindex(subject)
+            self.__registrations.pop(subject, None)
+        elif event == "setContactInfo" and subject.getHotel() is self.__hotel:
+            self.__unindex(subject, contactInfo=details[0])
+            self.__index(subject)
+        elif event == "setName" and subject.getHotel() is self.__hotel:
+            self.__unindex(subject, name=details[0])
+            self.__index(subject)
+
+    def __str__(self):
+        """Returns a string representation of the guest directory."""
+        return f"GuestDirectory for {self.__hotel.getName()} | Contact keys: {len(self.__byContact)} | Fuzzy: {self.__fuzzy}"
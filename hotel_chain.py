@@ -0,0 +1,254 @@
+import heapq
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from itertools import islice
+
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, _toOrdinal
+
+_STAY_EVENTS = frozenset(("addBooking", "cancelBooking", "setCheckInDate", "setCheckOutDate"))
+_RECORD_ORDER = {"rating": 0, "room": 1, "booking": 2}  # Rooms are in place before their bookings
+
+_shard = []  # (position in the chain, Hotel) pairs held by this worker process
+_shardPricing = None  # The chain's PricingEngine, or None to price stays at nights x rate
+
+
+def _loadShard(hotels: list, pricingEngine):
+    """Worker initializer: keeps the shard's hotels in the worker process for the lifetime of the chain."""
+    global _shard, _shardPricing
+    _shard = hotels
+    _shardPricing = pricingEngine
+
+
+def _applyChanges(changes: list):
+    """Worker task: applies (position, records) pairs describing what changed to the shard's copies of hotels.
+
+    A record holds the current values of one object: ("rating", rating), ("room", number, type, price, flags) or
+    ("booking", ID, room number, check-in day, check-out day, active). Rooms come before the bookings of a hotel.
+    """
+    hotels = dict(_shard)
+    for position, records in changes:
+        hotel = hotels[position]
+        for record in records:
+            if record[0] == "rating":
+                hotel.setRating(record[1])
+            elif record[0] == "room":
+                _applyRoom(hotel, *record[1:])
+            else:
+                _applyBooking(hotel, *record[1:])
+
+
+def _applyRoom(hotel: Hotel, roomNumber: int, roomType: str, pricePerNight: float, amenityFlags: list):
+    amenities = [Amenities.fromFlags(flags) for flags in amenityFlags]
+    room = hotel.getRoom(roomNumber)
+    if room is None:
+        hotel.addRoom(Room(roomNumber, roomType, pricePerNight, amenities))
+        return
+
+    if room.getRoomType() != roomType:
+        room.setRoomType(roomType)
+    room.setPricePerNight(pricePerNight)
+    room.setAmenities(amenities)
+
+
+def _applyBooking(hotel: Hotel, bookingID: int, roomNumber: int, checkInDay: int, checkOutDay: int, isActive: bool):
+    booking = hotel.getBooking(bookingID)
+    if booking is None:
+        if isActive:  # Only the nights it holds matter to a search, so the copy gets a stand-in guest
+            hotel.addBooking(Booking(bookingID, Guest("", ""), hotel.getRoom(roomNumber), date.fromordinal(checkInDay),
+                                     date.fromordinal(checkOutDay), 0.0))
+        return
+
+    if not isActive:
+        booking.cancelBooking()
+    elif checkInDay >= booking.getCheckOutDay():  # Moving later: check-out first, so the stay stays valid
+        booking.setCheckOutDate(checkOutDay)
+        booking.setCheckInDate(checkInDay)
+    else:
+        booking.setCheckInDate(checkInDay)
+        booking.setCheckOutDate(checkOutDay)
+
+
+def _searchShard(start: int, end: int, roomType: str, loyaltyPoints: int, limit: int):
+    """Returns this shard's offers as (price, -rating, position, room number, room type) tuples, best first."""
+    offers = []
+    for position, hotel in _shard:
+        rooms = hotel.findAvailableRooms(start, end, roomType)
+        if not rooms:
+            continue
+
+        if _shardPricing is None:
+            prices = [room.getPricePerNight() * (end - start) for room in rooms]
+        else:
+            prices = _shardPricing.quoteRooms(rooms, start, end, loyaltyPoints=loyaltyPoints).tolist()
+        negativeRating = -hotel.getRating()
+        offers.extend((price, negativeRating, position, room.getRoomNumber(), room.getRoomType())
+                      for room, price in zip(rooms, prices))
+
+    offers.sort()
+    return offers if limit is None else offers[:limit]
+
+
+class ChainOffer:
+    """Represents one room free for a stay somewhere in a hotel chain, with its price."""
+
+    __slots__ = ("__hotelName", "__rating", "__roomNumber", "__roomType", "__totalPrice")
+
+    def __init__(self, hotelName: str, rating: float, roomNumber: int, roomType: str, totalPrice: float):
+        """Initializes an offer."""
+        self.__hotelName = hotelName
+        self.__rating = rating
+        self.__roomNumber = roomNumber
+        self.__roomType = roomType
+        self.__totalPrice = totalPrice
+
+    # Getters
+    def getHotelName(self):
+        return self.__hotelName
+
+    def getRating(self):
+        return self.__rating
+
+    def getRoomNumber(self):
+        return self.__roomNumber
+
+    def getRoomType(self):
+        return self.__roomType
+
+    def getTotalPrice(self):
+        return self.__totalPrice
+
+    def __str__(self):
+        """Returns a string representation of the offer."""
+        return f"{self.__hotelName} ({self.__rating}) | Room {self.__roomNumber}: {self.__roomType} | ${self.__totalPrice:.2f}"
+
+
+class HotelChain:
+    """Represents many hotels searched together, sharded across worker processes.
+
+    Each shard is a single-process executor that receives its hotels once, when it starts, and keeps them for
+    the lifetime of the chain, so a search only ships the query and the best offers between processes. Hotels
+    are spread so every shard holds about the same number of rooms. The workers hold copies, so the chain listens
+    to its hotels and collects the rooms, bookings and ratings that changed; before the next search (or on
+    refresh()) their current values, not whole hotels, are applied to the copies. Changes that cannot affect a
+    search, such as those of guests or invoices, are not sent.
+    """
+
+    def __init__(self, hotels: list, workers: int = 4, pricingEngine=None):
+        """Initializes the chain and starts one worker process per shard."""
+        hotels = list(hotels)
+        if not all(isinstance(hotel, Hotel) for hotel in hotels):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotelNames = [hotel.getName() for hotel in hotels]
+        self.__roomCount = sum(len(hotel.getRooms()) for hotel in hotels)
+
+        # Largest hotels first, each to the shard with the fewest rooms so far
+        shards = [[] for _ in range(max(1, min(workers, len(hotels))))]
+        shardRooms = [(0, index) for index in range(len(shards))]
+        for position in sorted(range(len(hotels)), key=lambda i: len(hotels[i].getRooms()), reverse=True):
+            rooms, index = heapq.heappop(shardRooms)
+            shards[index].append((position, hotels[position]))
+            heapq.heappush(shardRooms, (rooms + len(hotels[position].getRooms()), index))
+
+        self.__executors = [ProcessPoolExecutor(max_workers=1, initializer=_loadShard, initargs=(shard, pricingEngine))
+                            for shard in shards]
+        self.__hotels = hotels
+        self.__shardOf = {position: index for index, shard in enumerate(shards) for position, _ in shard}
+        self.__changed = {}  # Position -> {key: changed hotel, room or booking} since the worker last heard
+        self.__changedLock = threading.Lock()
+        self.__listeners = [partial(self.__onChange, position) for position in range(len(hotels))]
+        for hotel, listener in zip(hotels, self.__listeners):
+            hotel.addListener(listener)
+
+    # Getters
+    def getHotelNames(self):
+        return list(self.__hotelNames)
+
+    def getWorkerCount(self):
+        return len(self.__executors)
+
+    def getRoomCount(self):
+        return self.__roomCount
+
+    # Methods
+    def search(self, checkIn, checkOut, roomType: str = None, loyaltyPoints: int = 0, limit: int = None):
+        """Returns offers for rooms free for the whole stay across the chain, cheapest first, then best rated."""
+        start, end = _toOrdinal(checkIn), _toOrdinal(checkOut)
+        if end <= start:
+            raise ValueError("Check-out date must be after check-in date.")
+
+        self.refresh()
+        futures = [executor.submit(_searchShard, start, end, roomType, loyaltyPoints, limit)
+                   for executor in self.__executors]
+        merged = heapq.merge(*(future.result() for future in futures))
+        return [ChainOffer(self.__hotelNames[position], -negativeRating, roomNumber, roomType, price)
+                for price, negativeRating, position, roomNumber, roomType in islice(merged, limit)]
+
+    def refresh(self):
+        """Applies the changes made since the last refresh to the workers' copies and waits until they have."""
+        with self.__changedLock:
+            changed, self.__changed = self.__changed, {}
+        byShard = {}
+        for position, subjects in sorted(changed.items()):
+            records = sorted((self.__record(subject) for subject in subjects.values()),
+                             key=lambda record: _RECORD_ORDER[record[0]])
+            byShard.setdefault(self.__shardOf[position], []).append((position, records))
+        futures = [self.__executors[index].submit(_applyChanges, changes) for index, changes in byShard.items()]
+        for future in futures:
+            future.result()  # Raises a worker's failure here instead of leaving its copies stale
+
+    def warmUp(self):
+        """Starts every worker process now instead of on the first search."""
+        for future in [executor.submit(len, ()) for executor in self.__executors]:
+            future.result()
+
+    def close(self):
+        """Stops listening to the hotels and stops the worker processes."""
+        for hotel, listener in zip(self.__hotels, self.__listeners):
+            hotel.removeListener(listener)
+        for executor in self.__executors:
+            executor.shutdown()
+
+    def __onChange(self, position: int, event: str, subject, *details):
+        """Hotel listener: notes the hotel, room or booking at a position whose change a search could see."""
+        hotel = self.__hotels[position]
+        if subject is hotel:
+            if event == "setName":
+                self.__hotelNames[position] = hotel.getName()
+            if event != "setRating":
+                return
+            key = "rating"
+        elif isinstance(subject, Room):
+            key = ("room", subject.getRoomNumber())
+            if event == "addRoom":
+                self.__roomCount += 1
+        elif isinstance(subject, Booking) and event in _STAY_EVENTS:
+            key = ("booking", subject.getBookingID())
+        else:
+            return
+
+        with self.__changedLock:
+            self.__changed.setdefault(position, {})[key] = subject
+
+    @staticmethod
+    def __record(subject):
+        """Returns the record of a changed hotel, room or booking that _applyChanges applies to a worker's copy."""
+        if isinstance(subject, Room):
+            return ("room", subject.getRoomNumber(), subject.getRoomType(), subject.getPricePerNight(),
+                    [amenities.getFlags() for amenities in subject.getAmenities()])
+        if isinstance(subject, Booking):
+            return ("booking", subject.getBookingID(), subject.getRoom().getRoomNumber(), subject.getCheckInDay(),
+                    subject.getCheckOutDay(), subject.isActive())
+        return ("rating", subject.getRating())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exceptionInfo):
+        self.close()
+
+    def __str__(self):
+        """Returns a string representation of the hotel chain."""
+        return f"HotelChain: {len(self.__hotelNames)} hotels | Rooms: {self.__roomCount} | Workers: {len(self.__executors)}"
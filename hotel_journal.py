@@ -0,0 +1,578 @@
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from datetime import date
+
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, LoyaltyProgram, GuestServiceRequest, Feedback
+from loyalty_ledger import LoyaltyLedger
+
+_RECORD_HEADER = struct.Struct("<II")  # Record length, CRC32 of the record
+_SNAPSHOT_VERSION = 1
+
+
+class HotelJournal:
+    """Persists a hotel as periodic binary snapshots plus an append-only journal of the mutations since the last one.
+
+    Rooms, guests and bookings are referred to by journal keys (their position in the order the journal first saw
+    them), so objects that were never added to the hotel, such as the guest of a booking, are persisted as well.
+    Records store resulting values rather than deltas, so replaying one twice is harmless. A hotel's loyalty
+    ledger is persisted entry by entry, so recovery rebuilds it with every entry's original day.
+
+    Records are group-committed: a record reaches disk once syncEvery records are waiting, or at the latest
+    syncInterval seconds after it was appended, from a timer if no later record arrives. A crash can thus lose at
+    most the last syncInterval seconds of changes; call sync() when a change must be durable before moving on.
+    """
+
+    def __init__(self, directory: str, syncEvery: int = 256, syncInterval: float = 0.05):
+        """Initializes a journal in a directory; fsync runs every syncEvery records or within syncInterval seconds."""
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__syncEvery = syncEvery
+        self.__syncInterval = syncInterval
+        self.__hotel = None
+        self.__ledger = None  # LoyaltyLedger of the hotel whose entries are journaled
+        self.__file = None
+        self.__sequence = 0
+        self.__unsynced = 0
+        self.__lastSync = time.monotonic()
+        self.__syncTimer = None  # Pending threading.Timer that syncs records left waiting by an idle hotel
+        self.__lock = threading.RLock()
+        self.__rooms = []  # Journal key -> Room (also keeps id() values stable)
+        self.__guests = []  # Journal key -> Guest
+        self.__bookings = []  # Journal key -> Booking
+        self.__roomKeys = {}  # id(Room) -> journal key
+        self.__guestKeys = {}  # id(Guest) -> journal key
+        self.__bookingKeys = {}  # id(Booking) -> journal key
+        self.__pendingReservations = []  # (guest key, Booking) pairs of newly declared guests still to journal
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getSequence(self):
+        """Returns the number of the current snapshot/journal pair."""
+        return self.__sequence
+
+    # Methods
+    def attach(self, hotel: Hotel):
+        """Starts persisting a hotel: writes a snapshot of its current state and journals every later change."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        with self.__lock:
+            if self.__hotel is not None:
+                self.__hotel.removeListener(self.record)
+            self.__hotel = hotel
+            self.__sequence = self.__latestSequence()
+            self.checkpoint()
+            hotel.addListener(self.record)
+            self.__watchLedger(hotel.getLoyaltyLedger())
+
+    def recover(self):
+        """Loads the latest snapshot, replays its journal and keeps journaling. Returns None if nothing was saved."""
+        sequence = self.__latestSequence()
+        if sequence == 0:
+            return None
+
+        with self.__lock:
+            with open(self.__path("snapshot", sequence), "rb") as snapshotFile:
+                hotel = self.__restore(pickle.load(snapshotFile))
+
+            journalPath = self.__path("journal", sequence)
+            validLength = self.__replay(journalPath, hotel) if os.path.exists(journalPath) else 0
+
+            self.__sequence = sequence
+            self.__hotel = hotel
+            self.__file = open(journalPath, "ab")
+            self.__file.truncate(validLength)  # Drop a record torn by a crash
+            hotel.addListener(self.record)
+            self.__watchLedger(hotel.getLoyaltyLedger())
+            return hotel
+
+    def checkpoint(self):
+        """Writes a compact snapshot of the whole hotel, starts a new journal and deletes the older files."""
+        with self.__lock:
+            self.__closeFile()
+            self.__sequence += 1
+            snapshot = self.__capture()
+            temporaryPath = self.__path("snapshot", self.__sequence) + ".tmp"
+            with open(temporaryPath, "wb") as snapshotFile:
+                pickle.dump(snapshot, snapshotFile, protocol=pickle.HIGHEST_PROTOCOL)
+                snapshotFile.flush()
+                os.fsync(snapshotFile.fileno())
+            os.replace(temporaryPath, self.__path("snapshot", self.__sequence))
+
+            self.__file = open(self.__path("journal", self.__sequence), "ab")
+            self.__removeOlderFiles()
+
+    def sync(self):
+        """Flushes buffered records and forces them to disk."""
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.flush()
+                os.fsync(self.__file.fileno())
+            self.__unsynced = 0
+            self.__lastSync = time.monotonic()
+            if self.__syncTimer is not None:
+                self.__syncTimer.cancel()
+                self.__syncTimer = None
+
+    def close(self):
+        """Syncs and closes the journal and stops listening to the hotel."""
+        with self.__lock:
+            if self.__hotel is not None:
+                self.__hotel.removeListener(self.record)
+            self.__watchLedger(None)
+            self.__closeFile()
+
+    def record(self, event: str, subject, *details):
+        """Hotel listener: appends one journal record describing the change."""
+        with self.__lock:
+            ledger = self.__hotel.getLoyaltyLedger()
+            if ledger is not self.__ledger:  # Created since the last change; its entries so far go in one record
+                self.__append(("newLedger",) + self.__ledgerState(ledger))
+                self.__watchLedger(ledger)
+
+            if event in ("addRoom", "addGuest", "addBooking"):
+                keyOf = {"addRoom": self.__roomKey, "addGuest": self.__guestKey, "addBooking": self.__bookingKey}[event]
+                self.__append((event, keyOf(subject)))
+            elif event in ("setName", "setLocation", "setRating", "setContactInfo") and subject is self.__hotel:
+                self.__append(("setHotel", subject.getName(), subject.getLocation(), subject.getRating(),
+                               subject.getContactInfo()))
+            elif isinstance(subject, Room):
+                self.__append(("setRoom", self.__roomKey(subject), self.__roomRow(subject)))
+            elif isinstance(subject, Booking) and event == "setGuest":
+                self.__append(("setBookingGuest", self.__bookingKey(subject), self.__guestKey(subject.getGuest())))
+            elif isinstance(subject, Booking):
+                self.__append(("setBooking", self.__bookingKey(subject), subject.getCheckInDay(),
+                               subject.getCheckOutDay(), subject.getTotalPrice(), subject.isActive()))
+            elif isinstance(subject, Guest):
+                self.__recordGuestChange(event, subject, details)
+            elif isinstance(subject, GuestServiceRequest):
+                guest = subject.getGuest()
+                self.__append(("setServiceRequest", self.__guestKey(guest), guest.getServiceRequests().index(subject),
+                               subject.getServiceType(), subject.getStatus()))
+            elif isinstance(subject, Feedback):
+                guest = subject.getGuest()
+                self.__append(("setFeedback", self.__guestKey(guest), guest.getFeedbacks().index(subject),
+                               subject.getRating(), subject.getComment(), self.__stayKey(subject)))
+            elif isinstance(subject, Invoice):
+                if event == "addInvoice":
+                    self.__append(("addInvoice", subject.getInvoiceID(), self.__bookingKey(subject.getBooking()),
+                                   subject.getAmountDue(), subject.getPaymentStatus()))
+                else:
+                    self.__append(("setInvoice", subject.getInvoiceID(), subject.getAmountDue(),
+                                   subject.getPaymentStatus()))
+            elif isinstance(subject, LoyaltyProgram):
+                kind = "addLoyaltyProgram" if event == "addLoyaltyProgram" else "setPoints"
+                self.__append((kind, self.__guestKey(subject.getGuest()), subject.getPoints()))
+
+            self.__flushPendingReservations()
+
+    def recordEntry(self, guest: Guest, day: int, kind: int, points: int, bookingID: int = None):
+        """Loyalty ledger entry listener: appends the record of one posted entry."""
+        with self.__lock:
+            self.__append(("ledgerEntry", self.__guestKey(guest), day, kind, points, bookingID))
+            self.__flushPendingReservations()
+
+    def __watchLedger(self, ledger):
+        """Starts journaling the entries of a ledger, and stops journaling those of the one watched before."""
+        if self.__ledger is not None:
+            self.__ledger.removeEntryListener(self.recordEntry)
+        self.__ledger = ledger
+        if ledger is not None:
+            ledger.addEntryListener(self.recordEntry)
+
+    def __flushPendingReservations(self):
+        """Journals the reservations of newly declared guests once their bookings can be declared too."""
+        position = 0
+        while position < len(self.__pendingReservations):
+            guestKey, booking = self.__pendingReservations[position]
+            self.__append(("addReservation", guestKey, self.__bookingKey(booking)))
+            position += 1
+        self.__pendingReservations.clear()
+
+    def __recordGuestChange(self, event: str, guest: Guest, details: tuple):
+        """Appends the journal record for a change made through a Guest method."""
+        key = self.__guestKey(guest)
+        if event == "addReservation":
+            self.__append(("addReservation", key, self.__bookingKey(details[0])))
+        elif event == "submitServiceRequest":
+            self.__append(("submitServiceRequest", key, details[0].getServiceType(), details[0].getStatus()))
+        elif event == "submitFeedback":
+            self.__append(("submitFeedback", key, details[0].getRating(), details[0].getComment(),
+                           self.__stayKey(details[0])))
+        elif event == "mergeFrom":
+            self.__append(("mergeGuest", key, self.__guestKey(details[0])))
+        elif event == "removeGuest":
+            self.__append(("removeGuest", key))
+        else:
+            self.__append(("setGuest", key, guest.getName(), guest.getContactInfo(), guest.getLoyaltyPoints()))
+
+    def __append(self, record: tuple):
+        """Writes one length-prefixed, checksummed record and fsyncs once a batch is full or old enough."""
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__file.write(_RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data)
+        self.__unsynced += 1
+        if self.__unsynced >= self.__syncEvery or time.monotonic() - self.__lastSync >= self.__syncInterval:
+            self.sync()
+        elif self.__syncTimer is None:
+            self.__syncTimer = threading.Timer(self.__syncInterval, self.__syncWaiting)
+            self.__syncTimer.daemon = True
+            self.__syncTimer.start()
+
+    def __syncWaiting(self):
+        """Timer callback: syncs the records appended since the last sync, if a later append has not already."""
+        with self.__lock:
+            if self.__syncTimer is not threading.current_thread():
+                return
+            self.__syncTimer = None
+            if self.__unsynced and self.__file is not None:
+                self.sync()
+
+    # Journal keys
+    def __roomKey(self, room: Room):
+        """Returns the journal key of a room, declaring the room in the journal the first time it is seen."""
+        key = self.__roomKeys.get(id(room))
+        if key is None:
+            key = self.__assignKey(room, self.__rooms, self.__roomKeys)
+            if self.__file is not None:
+                self.__append(("newRoom", key, self.__roomRow(room)))
+        return key
+
+    def __guestKey(self, guest: Guest):
+        """Returns the journal key of a guest, declaring the guest and their reservations the first time."""
+        key = self.__guestKeys.get(id(guest))
+        if key is None:
+            key = self.__assignKey(guest, self.__guests, self.__guestKeys)
+            if self.__file is not None:
+                self.__append(("newGuest", key, self.__guestRow(guest)))
+                # A reservation may be the booking being declared right now, so journal them afterwards
+                self.__pendingReservations.extend((key, booking) for booking in guest.getReservations())
+        return key
+
+    def __bookingKey(self, booking: Booking):
+        """Returns the journal key of a booking, declaring the booking the first time it is seen."""
+        key = self.__bookingKeys.get(id(booking))
+        if key is None:
+            key = self.__assignKey(booking, self.__bookings, self.__bookingKeys)
+            if self.__file is not None:
+                self.__append(("newBooking", key, self.__bookingRow(booking)))
+        return key
+
+    def __stayKey(self, feedback: Feedback):
+        """Returns the journal key of the booking a feedback is about, or None."""
+        booking = feedback.getBooking()
+        return None if booking is None else self.__bookingKey(booking)
+
+    @staticmethod
+    def __assignKey(item, items: list, keys: dict):
+        """Gives an object the next free journal key."""
+        key = keys[id(item)] = len(items)
+        items.append(item)
+        return key
+
+    # Rows
+    @staticmethod
+    def __roomRow(room: Room):
+        return (room.getRoomNumber(), room.getRoomType(), room.getPricePerNight(),
+                tuple(amenities.getFlags() for amenities in room.getAmenities()), room.isAvailable())
+
+    @staticmethod
+    def __guestRow(guest: Guest):
+        return (guest.getName(), guest.getContactInfo(), guest.getLoyaltyPoints(),
+                [(request.getServiceType(), request.getStatus()) for request in guest.getServiceRequests()],
+                [(feedback.getRating(), feedback.getComment()) for feedback in guest.getFeedbacks()])
+
+    def __bookingRow(self, booking: Booking):
+        return (booking.getBookingID(), self.__guestKey(booking.getGuest()), self.__roomKey(booking.getRoom()),
+                booking.getCheckInDay(), booking.getCheckOutDay(), booking.getTotalPrice(), booking.isActive())
+
+    # Snapshots
+    def __capture(self):
+        """Builds the snapshot of the attached hotel and resets the journal keys to match it."""
+        hotel = self.__hotel
+        self.__rooms, self.__guests, self.__bookings = [], [], []
+        self.__roomKeys, self.__guestKeys, self.__bookingKeys = {}, {}, {}
+
+        hotelRooms = [self.__roomKey(room) for room in hotel.getRooms()]
+        hotelGuests = [self.__guestKey(guest) for guest in hotel.getGuests()]
+        hotelBookings = [self.__bookingKey(booking) for booking in hotel.getBookings()]
+        invoices = [(invoice.getInvoiceID(), self.__bookingKey(invoice.getBooking()), invoice.getAmountDue(),
+                     invoice.getPaymentStatus()) for invoice in hotel.getInvoices()]
+        loyalty = [(self.__guestKey(program.getGuest()), program.getPoints()) for program in hotel.getLoyaltyPrograms()]
+        ledger = hotel.getLoyaltyLedger()
+        ledgerState = None if ledger is None else self.__ledgerState(ledger)
+
+        # Booking rows and reservations can pull in guests, rooms and bookings the hotel never registered
+        bookingRows, reservations, feedbackStays = [], [], []
+        while len(bookingRows) < len(self.__bookings) or len(reservations) < len(self.__guests):
+            while len(bookingRows) < len(self.__bookings):
+                bookingRows.append(self.__bookingRow(self.__bookings[len(bookingRows)]))
+            while len(reservations) < len(self.__guests):
+                guest = self.__guests[len(reservations)]
+                reservations.append([self.__bookingKey(booking) for booking in guest.getReservations()])
+                feedbackStays.append([(index, self.__stayKey(feedback)) for index, feedback
+                                      in enumerate(guest.getFeedbacks()) if feedback.getBooking() is not None])
+
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "hotel": (hotel.getName(), hotel.getLocation(), hotel.getRating(), hotel.getContactInfo()),
+            "rooms": [self.__roomRow(room) for room in self.__rooms],
+            "guests": [self.__guestRow(guest) for guest in self.__guests],
+            "bookings": bookingRows,
+            "reservations": reservations,
+            "feedbackStays": feedbackStays,
+            "hotelRooms": hotelRooms,
+            "hotelGuests": hotelGuests,
+            "hotelBookings": hotelBookings,
+            "invoices": invoices,
+            "loyalty": loyalty,
+            "ledger": ledgerState,
+        }
+
+    def __restore(self, snapshot: dict):
+        """Rebuilds a hotel and the journal keys from a snapshot."""
+        if snapshot.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {snapshot.get('version')}.")
+
+        name, location, rating, contactInfo = snapshot["hotel"]
+        hotel = Hotel(name, location, float(rating), contactInfo)
+        self.__rooms, self.__guests, self.__bookings = [], [], []
+        self.__roomKeys, self.__guestKeys, self.__bookingKeys = {}, {}, {}
+
+        for row in snapshot["rooms"]:
+            self.__assignKey(self.__buildRoom(row), self.__rooms, self.__roomKeys)
+        for row in snapshot["guests"]:
+            self.__assignKey(self.__buildGuest(row), self.__guests, self.__guestKeys)
+        for row in snapshot["bookings"]:
+            self.__assignKey(self.__buildBooking(row), self.__bookings, self.__bookingKeys)
+        for guest, bookingKeys in zip(self.__guests, snapshot["reservations"]):
+            for key in bookingKeys:
+                guest.addReservation(self.__bookings[key])
+        for guest, stays in zip(self.__guests, snapshot.get("feedbackStays", ())):
+            for index, key in stays:
+                guest.getFeedbacks()[index].setBooking(self.__bookings[key])
+        for room, row in zip(self.__rooms, snapshot["rooms"]):
+            self.__applyAvailability(room, row[4])  # Creating bookings marked their rooms as booked
+
+        hotel.addRooms(self.__rooms[key] for key in snapshot["hotelRooms"])
+        hotel.addGuests(self.__guests[key] for key in snapshot["hotelGuests"])
+        hotel.addBookings(self.__bookings[key] for key in snapshot["hotelBookings"])
+        for invoiceID, bookingKey, amountDue, paymentStatus in snapshot["invoices"]:
+            self.__restoreInvoice(hotel, invoiceID, bookingKey, amountDue, paymentStatus)
+        if snapshot.get("ledger") is not None:
+            self.__restoreLedger(hotel, *snapshot["ledger"])
+        for guestKey, points in snapshot["loyalty"]:
+            self.__restoreLoyaltyProgram(hotel, guestKey, points)
+
+        return hotel
+
+    def __replay(self, journalPath: str, hotel: Hotel):
+        """Applies every intact record of a journal file to the hotel. Returns the length of the intact prefix."""
+        validLength = 0
+        with open(journalPath, "rb") as journalFile:
+            data = journalFile.read()
+
+        while validLength + _RECORD_HEADER.size <= len(data):
+            length, checksum = _RECORD_HEADER.unpack_from(data, validLength)
+            start = validLength + _RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+
+            self.__apply(pickle.loads(payload), hotel)
+            validLength = start + length
+
+        return validLength
+
+    def __apply(self, record: tuple, hotel: Hotel):
+        """Applies a single journal record."""
+        kind = record[0]
+        if kind == "newRoom":
+            self.__assignKey(self.__buildRoom(record[2]), self.__rooms, self.__roomKeys)
+        elif kind == "newGuest":
+            self.__assignKey(self.__buildGuest(record[2]), self.__guests, self.__guestKeys)
+        elif kind == "newBooking":
+            booking = self.__buildBooking(record[2])
+            self.__assignKey(booking, self.__bookings, self.__bookingKeys)
+        elif kind == "addRoom":
+            room = self.__rooms[record[1]]
+            if hotel.getRoom(room.getRoomNumber()) is not room:
+                hotel.addRoom(room)
+        elif kind == "addGuest":
+            guest = self.__guests[record[1]]
+            if guest.getHotel() is not hotel:
+                hotel.addGuest(guest)
+        elif kind == "addBooking":
+            booking = self.__bookings[record[1]]
+            if hotel.getBooking(booking.getBookingID()) is not booking:
+                hotel.addBooking(booking)
+        elif kind == "addInvoice":
+            self.__restoreInvoice(hotel, *record[1:])
+        elif kind == "addLoyaltyProgram":
+            self.__restoreLoyaltyProgram(hotel, record[1], record[2])
+        elif kind == "newLedger":
+            self.__restoreLedger(hotel, *record[1:])
+        elif kind == "ledgerEntry":
+            hotel.getLoyaltyLedger().restore([(self.__guests[record[1]], record[2], record[3], record[4])],
+                                             () if record[5] is None else (record[5],))
+        elif kind == "setHotel":
+            hotel.setName(record[1])
+            hotel.setLocation(record[2])
+            hotel.setRating(record[3])
+            hotel.setContactInfo(record[4])
+        elif kind == "setRoom":
+            self.__applyRoom(self.__rooms[record[1]], record[2])
+        elif kind == "setBooking":
+            self.__applyBooking(self.__bookings[record[1]], *record[2:])
+        elif kind == "setBookingGuest":
+            booking, guest = self.__bookings[record[1]], self.__guests[record[2]]
+            if booking.getGuest() is not guest:
+                booking.setGuest(guest)
+        elif kind == "mergeGuest":
+            self.__guests[record[1]].mergeFrom(self.__guests[record[2]])
+        elif kind == "removeGuest":
+            hotel.removeGuests([self.__guests[record[1]]])
+        elif kind == "setGuest":
+            guest = self.__guests[record[1]]
+            guest.setName(record[2])
+            guest.setContactInfo(record[3])
+            guest.setLoyaltyPoints(record[4])
+        elif kind == "addReservation":
+            guest, booking = self.__guests[record[1]], self.__bookings[record[2]]
+            if booking not in guest.getReservations():
+                guest.addReservation(booking)
+        elif kind == "submitServiceRequest":
+            self.__guests[record[1]].submitServiceRequest(self.__buildServiceRequest(record[2], record[3]))
+        elif kind == "submitFeedback":
+            stay = self.__bookings[record[4]] if len(record) > 4 and record[4] is not None else None
+            self.__guests[record[1]].submitFeedback(Feedback(float(record[2]), record[3], stay))
+        elif kind == "setServiceRequest":
+            request = self.__guests[record[1]].getServiceRequests()[record[2]]
+            request.setServiceType(record[3])
+            request.setStatus(record[4])
+        elif kind == "setFeedback":
+            feedback = self.__guests[record[1]].getFeedbacks()[record[2]]
+            feedback.setRating(record[3])
+            feedback.setComment(record[4])
+            stay = self.__bookings[record[5]] if len(record) > 5 and record[5] is not None else None
+            if len(record) > 5 and feedback.getBooking() is not stay:
+                feedback.setBooking(stay)
+        elif kind == "setInvoice":
+            invoice = hotel.getInvoice(record[1])
+            invoice.setAmountDue(record[2])
+            invoice.setPaymentStatus(record[3])
+        elif kind == "setPoints":
+            hotel.getLoyaltyProgram(self.__guests[record[1]]).setPoints(record[2])
+
+    # Object builders
+    @staticmethod
+    def __buildRoom(row: tuple):
+        roomNumber, roomType, pricePerNight, flags, isAvailable = row
+        room = Room(roomNumber, roomType, float(pricePerNight), [Amenities.fromFlags(flag) for flag in flags])
+        HotelJournal.__applyAvailability(room, isAvailable)
+        return room
+
+    @staticmethod
+    def __buildGuest(row: tuple):
+        name, contactInfo, points, requests, feedbacks = row
+        guest = Guest(name, contactInfo)
+        guest.setLoyaltyPoints(points)
+        for serviceType, status in requests:
+            guest.submitServiceRequest(HotelJournal.__buildServiceRequest(serviceType, status))
+        for rating, comment in feedbacks:
+            guest.submitFeedback(Feedback(float(rating), comment))
+        return guest
+
+    @staticmethod
+    def __buildServiceRequest(serviceType: str, status: str):
+        request = GuestServiceRequest(serviceType)
+        request.setStatus(status)
+        return request
+
+    def __buildBooking(self, row: tuple):
+        bookingID, guestKey, roomKey, checkInDay, checkOutDay, totalPrice, isActive = row
+        booking = Booking(bookingID, self.__guests[guestKey], self.__rooms[roomKey], date.fromordinal(checkInDay),
+                          date.fromordinal(checkOutDay), float(totalPrice))
+        if not isActive:
+            booking.cancelBooking()
+        return booking
+
+    def __restoreInvoice(self, hotel: Hotel, invoiceID: int, bookingKey: int, amountDue: float, paymentStatus: str):
+        if hotel.getInvoice(invoiceID) is None:
+            invoice = Invoice(invoiceID, self.__bookings[bookingKey], float(amountDue))
+            invoice.setPaymentStatus(paymentStatus)
+            hotel.addInvoice(invoice)
+
+    def __restoreLoyaltyProgram(self, hotel: Hotel, guestKey: int, points: int):
+        guest = self.__guests[guestKey]
+        if hotel.getLoyaltyProgram(guest) is None:
+            program = LoyaltyProgram(guest)
+            if hotel.getLoyaltyLedger() is None:  # Otherwise the ledger's entries already hold the points
+                program.setPoints(points)
+            hotel.addLoyaltyProgram(program)
+
+    def __ledgerState(self, ledger: LoyaltyLedger):
+        """Returns the settings, entries (guest key, day, kind, points) and accrued bookings of a ledger."""
+        entries = [(self.__guestKey(guest), day, kind, points) for guest, day, kind, points in ledger.iterEntries()]
+        return (ledger.getPointsPerCurrency(), ledger.getExpiryDays(), ledger.getOpeningDay(), entries,
+                sorted(ledger.getAccruedBookings()))
+
+    def __restoreLedger(self, hotel: Hotel, pointsPerCurrency: float, expiryDays: int, openingDay, entries: list,
+                        accruedBookings: list):
+        ledger = LoyaltyLedger(hotel, pointsPerCurrency, expiryDays, openingDay, carryOver=False)
+        ledger.restore([(self.__guests[key], day, kind, points) for key, day, kind, points in entries], accruedBookings)
+
+    @staticmethod
+    def __applyRoom(room: Room, row: tuple):
+        _, roomType, pricePerNight, flags, isAvailable = row
+        room.setRoomType(roomType)
+        room.setPricePerNight(pricePerNight)
+        if tuple(amenities.getFlags() for amenities in room.getAmenities()) != tuple(flags):
+            room.setAmenities([Amenities.fromFlags(flag) for flag in flags])
+        HotelJournal.__applyAvailability(room, isAvailable)
+
+    @staticmethod
+    def __applyAvailability(room: Room, isAvailable: bool):
+        if isAvailable:
+            room.releaseRoom()
+        else:
+            room.bookRoom()
+
+    @staticmethod
+    def __applyBooking(booking: Booking, checkInDay: int, checkOutDay: int, totalPrice: float, isActive: bool):
+        booking.setCheckInDate(checkInDay)
+        booking.setCheckOutDate(checkOutDay)
+        booking.setTotalPrice(totalPrice)
+        if booking.isActive() and not isActive:
+            booking.cancelBooking()
+
+    # Files
+    def __path(self, kind: str, sequence: int):
+        extension = "bin" if kind == "snapshot" else "log"
+        return os.path.join(self.__directory, f"{kind}-{sequence:08d}.{extension}")
+
+    def __latestSequence(self):
+        """Returns the number of the newest complete snapshot, or 0 if there is none."""
+        sequences = [int(name[9:17]) for name in os.listdir(self.__directory)
+                     if name.startswith("snapshot-") and name.endswith(".bin")]
+        return max(sequences, default=0)
+
+    def __removeOlderFiles(self):
+        for name in os.listdir(self.__directory):
+            if name.startswith(("snapshot-", "journal-")) and int(name[name.index("-") + 1:][:8]) < self.__sequence:
+                os.remove(os.path.join(self.__directory, name))
+
+    def __closeFile(self):
+        if self.__file is not None:
+            self.sync()
+            self.__file.close()
+            self.__file = None
+
+    def __str__(self):
+        """Returns a string representation of the journal."""
+        return f"HotelJournal at {self.__directory} | Snapshot: {self.__sequence} | Unsynced records: {self.__unsynced}"
@@ -1,5 +1,129 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import date, datetime
+from itertools import islice
+
+_logger = logging.getLogger("hotel_system")
+
+
+# Events that change the hotel's running totals
+_COUNTED_EVENTS = frozenset(("addRoom", "setRoomType", "bookRoom", "releaseRoom", "addBooking", "cancelBooking",
+                             "setTotalPrice", "addInvoice", "setAmountDue", "setPaymentStatus", "markAsPaid"))
+
+
+def _toOrdinal(day):
+    """Converts an ISO date string, date or ordinal day number into an ordinal day number."""
+    if isinstance(day, int):
+        return day
+
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+
+    if not isinstance(day, date):
+        raise TypeError("Dates must be ISO strings, date objects or ordinal day numbers.")
+
+    return day.toordinal()
+
+
+def _page(items: list, start: int, limit: int, matches):
+    """Lazily yields up to limit items from start onwards that pass matches, without copying the list."""
+    return islice(filter(matches, islice(items, start, None)), limit)
+
+
+class ErrorLog:
+    """Represents a bounded, rate-limited record of the errors that entity methods report instead of raising.
+
+    Each record is a dict of time, source (e.g. "Hotel.addRoom"), error type and message. Every source may store
+    up to ratePerSecond records a second (a token bucket allowing bursts of the same size); errors beyond that
+    are only counted, so a failing hot path cannot flood the log. Stored records are also passed to the
+    "hotel_system" logger as warnings.
+    """
+
+    def __init__(self, capacity: int = 1000, ratePerSecond: float = 10.0, clock=time.monotonic):
+        """Initializes an empty log keeping the newest capacity records."""
+        self.__records = deque(maxlen=capacity)
+        self.__ratePerSecond = ratePerSecond
+        self.__clock = clock
+        self.__buckets = {}  # Source -> [tokens left, time of the last refill]
+        self.__counts = {}  # Source -> errors reported, stored or not
+        self.__suppressed = 0
+        self.__lock = threading.Lock()
+
+    # Getters
+    def getRecords(self, source: str = None):
+        """Returns the stored records, oldest first, optionally from one source only."""
+        with self.__lock:
+            return [record for record in self.__records if source is None or record["source"] == source]
+
+    def getCount(self, source: str):
+        """Returns the number of errors a source has reported, including suppressed ones."""
+        return self.__counts.get(source, 0)
+
+    def getCounts(self):
+        with self.__lock:
+            return dict(self.__counts)
+
+    def getSuppressedCount(self):
+        return self.__suppressed
+
+    # Methods
+    def record(self, source: str, error: Exception):
+        """Counts an error and stores its record unless the source is over its rate. Returns True if stored."""
+        now = self.__clock()
+        with self.__lock:
+            self.__counts[source] = self.__counts.get(source, 0) + 1
+            bucket = self.__buckets.get(source)
+            if bucket is None:
+                bucket = self.__buckets[source] = [self.__ratePerSecond, now]
+            bucket[0] = min(self.__ratePerSecond, bucket[0] + (now - bucket[1]) * self.__ratePerSecond)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                self.__suppressed += 1
+                return False
+
+            bucket[0] -= 1.0
+            entry = {"time": datetime.now().isoformat(timespec="milliseconds"), "source": source,
+                     "type": type(error).__name__, "message": str(error)}
+            self.__records.append(entry)
+
+        _logger.warning("%s: %s", source, error, extra={"errorRecord": entry})
+        return True
+
+    def clear(self):
+        """Drops every record, count and rate limit."""
+        with self.__lock:
+            self.__records.clear()
+            self.__buckets.clear()
+            self.__counts.clear()
+            self.__suppressed = 0
+
+    def __str__(self):
+        """Returns a string representation of the error log."""
+        return f"ErrorLog | Records: {len(self.__records)} | Errors: {sum(self.__counts.values())} | Suppressed: {self.__suppressed}"
+
+
+# The errors reported by every entity method in this process
+errorLog = ErrorLog()
+
+
+def _reportError(source: str, error: Exception):
+    """Records an error an entity method handled instead of raising."""
+    errorLog.record(source, error)
+
+
 class Amenities:
-    """Represents the amenities available in a hotel room."""
+    """Represents the amenities available in a hotel room, packed into a single bit-flag integer."""
+
+    __slots__ = ("__flags",)
+
+    # Bit flags
+    WIFI = 1
+    TV = 2
+    MINIBAR = 4
+    AIR_CONDITIONING = 8
 
     def __init__(self, hasWiFi: bool, hasTV: bool, hasMinibar: bool, hasAirConditioning: bool):
         """Initializes amenities for a room."""
@@ -7,49 +131,66 @@ class Amenities:
             if not isinstance(hasWiFi, bool) or not isinstance(hasTV, bool) or not isinstance(hasMinibar, bool) or not isinstance(hasAirConditioning, bool):
                 raise TypeError("Make sure all values have the right type!")
 
-            self.__hasWiFi = hasWiFi
-            self.__hasTV = hasTV
-            self.__hasMinibar = hasMinibar
-            self.__hasAirConditioning = hasAirConditioning
+            self.__flags = ((Amenities.WIFI if hasWiFi else 0) | (Amenities.TV if hasTV else 0)
+                            | (Amenities.MINIBAR if hasMinibar else 0) | (Amenities.AIR_CONDITIONING if hasAirConditioning else 0))
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Amenities.__init__", e)
+
+    @classmethod
+    def fromFlags(cls, flags: int):
+        """Builds amenities directly from a bit-flag integer."""
+        amenities = cls.__new__(cls)
+        amenities.__flags = flags
+        return amenities
 
     # Getters
+    def getFlags(self):
+        return self.__flags
+
     def getHasWiFi(self):
-        return self.__hasWiFi
+        return bool(self.__flags & Amenities.WIFI)
 
     def getHasTV(self):
-        return self.__hasTV
+        return bool(self.__flags & Amenities.TV)
 
     def getHasMinibar(self):
-        return self.__hasMinibar
+        return bool(self.__flags & Amenities.MINIBAR)
 
     def getHasAirConditioning(self):
-        return self.__hasAirConditioning
+        return bool(self.__flags & Amenities.AIR_CONDITIONING)
 
     # Setters
     def setHasWiFi(self, hasWiFi: bool) :
-        self.__hasWiFi = hasWiFi
+        self.__setFlag(Amenities.WIFI, hasWiFi)
 
     def setHasTV(self, hasTV: bool):
-        self.__hasTV = hasTV
+        self.__setFlag(Amenities.TV, hasTV)
 
     def setHasMinibar(self, hasMinibar: bool):
-        self.__hasMinibar = hasMinibar
+        self.__setFlag(Amenities.MINIBAR, hasMinibar)
 
     def setHasAirConditioning(self, hasAirConditioning: bool) :
-        self.__hasAirConditioning = hasAirConditioning
+        self.__setFlag(Amenities.AIR_CONDITIONING, hasAirConditioning)
 
     # Methods
+    def __setFlag(self, flag: int, value: bool):
+        """Sets or clears one amenity bit."""
+        if value:
+            self.__flags |= flag
+        else:
+            self.__flags &= ~flag
+
     def __str__(self):
         """Returns a string representation of the room amenities."""
-        return f"Amenities - WiFi: {self.__hasWiFi}, TV: {self.__hasTV}, Mini-Bar: {self.__hasMinibar}, Air Conditioning: {self.__hasAirConditioning}"
+        return f"Amenities - WiFi: {self.getHasWiFi()}, TV: {self.getHasTV()}, Mini-Bar: {self.getHasMinibar()}, Air Conditioning: {self.getHasAirConditioning()}"
 
 
 class Room:
     """Represents a hotel room with amenities and availability status."""
 
+    __slots__ = ("__roomNumber", "__roomType", "__pricePerNight", "__isAvailable", "__amenities", "__bookedNights", "__nightCounts", "__stays", "__hotel")
+
     def __init__(self, roomNumber: int, roomType: str, pricePerNight: float, amenities: list[Amenities]):
         try:
             if not isinstance(roomNumber, int) or not isinstance(roomType, str) or not isinstance(pricePerNight, float):
@@ -63,9 +204,13 @@ class Room:
             self.__pricePerNight = pricePerNight
             self.__isAvailable = True
             self.__amenities = amenities  # expects a list of amenities
+            self.__bookedNights = None  # Sorted ordinal days held by active bookings, created on first booking
+            self.__nightCounts = None  # Ordinal day -> number of bookings holding it
+            self.__stays = None  # Booking -> (first night, check-out day) it holds
+            self.__hotel = None  # Hotel the room was added to
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Room.__init__", e)
 
     # Getters
     def getRoomNumber(self):
@@ -83,29 +228,117 @@ class Room:
     def getAmenities(self):
         return self.__amenities
 
+    def getHotel(self):
+        return self.__hotel
+
     # Setters
     def setRoomType(self, roomType: str):
+        previousType = self.__roomType
         self.__roomType = roomType
+        self.__notify("setRoomType", previousType)
 
     def setPricePerNight(self, pricePerNight: float):
         self.__pricePerNight = pricePerNight
+        self.__notify("setPricePerNight")
 
     def setAmenities(self, amenities: list):
         self.__amenities = amenities
+        self.__notify("setAmenities")
+
+    def setHotel(self, hotel):
+        """Links the room to the hotel it was added to so the hotel's listeners hear about its changes."""
+        self.__hotel = hotel
 
     # Methods
+    def __notify(self, event: str, *details):
+        """Reports a change of this room to the owning hotel's listeners."""
+        if self.__hotel is not None:
+            self.__hotel.notifyListeners(event, self, *details)
+
     def bookRoom(self):
         """Marks the room as booked."""
+        wasAvailable = self.__isAvailable
         self.__isAvailable = False
+        self.__notify("bookRoom", wasAvailable)
 
     def releaseRoom(self):
         """Marks the room as available again after checkout."""
+        wasAvailable = self.__isAvailable
         self.__isAvailable = True
+        self.__notify("releaseRoom", wasAvailable)
+
+    def reserveDates(self, booking):
+        """Adds the nights of a booking to the room's availability index."""
+        if self.__stays is None:
+            self.__bookedNights = []
+            self.__nightCounts = {}
+            self.__stays = {}
+        elif booking in self.__stays:
+            return
+
+        start = booking.getCheckInDay()
+        end = booking.getCheckOutDay()
+        self.__stays[booking] = (start, end)
+
+        for night in range(start, end):
+            count = self.__nightCounts.get(night, 0)
+            if count == 0:
+                insort(self.__bookedNights, night)
+            self.__nightCounts[night] = count + 1
+
+    def releaseDates(self, booking):
+        """Removes the nights of a booking from the availability index. Returns True if it was indexed."""
+        stay = self.__stays.pop(booking, None) if self.__stays else None
+        if stay is None:
+            return False
+
+        for night in range(*stay):
+            count = self.__nightCounts[night] - 1
+            if count:
+                self.__nightCounts[night] = count
+            else:
+                del self.__nightCounts[night]
+                del self.__bookedNights[bisect_left(self.__bookedNights, night)]
+
+        return True
+
+    def isAvailableBetween(self, checkIn, checkOut):
+        """Checks whether no booking holds any night from checkIn up to (not including) checkOut."""
+        if not self.__bookedNights:
+            return True
+
+        i = bisect_left(self.__bookedNights, _toOrdinal(checkIn))
+        return i == len(self.__bookedNights) or self.__bookedNights[i] >= _toOrdinal(checkOut)
 
     def __str__(self):
         return f"Room {self.__roomNumber}: {self.__roomType}, ${self.__pricePerNight}/night, Available: {self.__isAvailable}"
 
 
+class BulkLoadReport:
+    """Summarizes a bulk load: how many items were added and which rows were rejected."""
+
+    def __init__(self, addedCount: int, rejected: list, rejectedCount: int = None):
+        """rejectedCount counts every rejected row when only some of them were kept in rejected."""
+        self.__addedCount = addedCount
+        self.__rejected = rejected  # List of (position, item, reason) tuples
+        self.__rejectedCount = len(rejected) if rejectedCount is None else rejectedCount
+
+    # Getters
+    def getAddedCount(self):
+        return self.__addedCount
+
+    def getRejected(self):
+        return self.__rejected
+
+    def getRejectedCount(self):
+        return self.__rejectedCount
+
+    # Methods
+    def __str__(self):
+        """Returns a string representation of the load report."""
+        return f"Bulk load - Added: {self.__addedCount} | Rejected: {self.__rejectedCount}"
+
+
 class Hotel:
     """Represents a hotel with rooms, guests, and bookings."""
 
@@ -121,9 +354,26 @@ class Hotel:
             self.__rooms = []  # List of Room objects
             self.__guests = []  # List of Guest objects
             self.__bookings = []  # List of Booking objects
+            self.__roomIndex = {}  # Room number -> position in __rooms
+            self.__guestIndex = {}  # Contact info -> Guest
+            self.__guestPositions = {}  # Guest -> first position in __guests
+            self.__bookingIndex = {}  # Booking ID -> position in __bookings
+            self.__invoices = []  # List of Invoice objects
+            self.__invoiceIndex = {}  # Invoice ID -> Invoice
+            self.__bookingInvoices = {}  # Booking ID -> first Invoice added for that booking
+            self.__lastInvoiceID = 0  # Highest invoice ID added, so new IDs are found without scanning
+            self.__loyaltyPrograms = {}  # Guest -> LoyaltyProgram
+            self.__listeners = []  # Callables run as listener(event, subject, *details) after each change
+            self.__availableByType = {}  # Room type -> number of rooms currently marked available
+            self.__availableRooms = 0
+            self.__activeBookings = 0
+            self.__bookedRevenue = 0.0  # Total price of the active bookings
+            self.__invoiceTotals = {}  # Payment status -> total amount due of the invoices in that status
+            self.__countersLock = threading.Lock()
+            self.__loyaltyLedger = None  # LoyaltyLedger holding the points of the hotel's guests, if one was created
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Hotel.__init__", e)
 
     # Getters
     def getName(self):
@@ -147,34 +397,174 @@ class Hotel:
     def getBookings(self):
         return self.__bookings
 
+    def getRoom(self, roomNumber: int):
+        """Returns the room with the given number, or None if the hotel has no such room."""
+        position = self.__roomIndex.get(roomNumber)
+        return None if position is None else self.__rooms[position]
+
+    def getGuest(self, contactInfo: str):
+        """Returns the first guest registered with the given contact info, or None."""
+        return self.__guestIndex.get(contactInfo)
+
+    def getBooking(self, bookingID: int):
+        """Returns the booking with the given ID, or None if there is no such booking."""
+        position = self.__bookingIndex.get(bookingID)
+        return None if position is None else self.__bookings[position]
+
+    def getInvoices(self):
+        return self.__invoices
+
+    def getInvoice(self, invoiceID: int):
+        """Returns the invoice with the given ID, or None if there is no such invoice."""
+        return self.__invoiceIndex.get(invoiceID)
+
+    def getBookingInvoice(self, bookingID: int):
+        """Returns the first invoice added for a booking, or None if the booking has not been invoiced."""
+        return self.__bookingInvoices.get(bookingID)
+
+    def getLastInvoiceID(self):
+        """Returns the highest invoice ID added so far, or 0 if the hotel has no invoices."""
+        return self.__lastInvoiceID
+
+    def getLoyaltyPrograms(self):
+        return list(self.__loyaltyPrograms.values())
+
+    def getLoyaltyProgram(self, guest):
+        """Returns the loyalty program of a guest, or None if the guest has not joined."""
+        return self.__loyaltyPrograms.get(guest)
+
+    def getLoyaltyLedger(self):
+        return self.__loyaltyLedger
+
+    def getAvailableRoomCount(self, roomType: str = None):
+        """Returns how many rooms (of one type, or in total) are marked available, without scanning them."""
+        if roomType is None:
+            return self.__availableRooms
+
+        return self.__availableByType.get(roomType, 0)
+
+    def getActiveBookingCount(self):
+        return self.__activeBookings
+
+    def getBookedRevenue(self):
+        """Returns the total price of the active bookings."""
+        return self.__bookedRevenue
+
+    def getInvoiceTotal(self, paymentStatus: str):
+        """Returns the total amount due of the invoices with a payment status ('Paid', 'Pending' or 'Cancelled')."""
+        return self.__invoiceTotals.get(paymentStatus, 0.0)
+
     # Setters
     def setName(self, name: str):
         self.__name = name
+        self.notifyListeners("setName", self)
 
     def setLocation(self, location: str):
         self.__location = location
+        self.notifyListeners("setLocation", self)
 
     def setRating(self, rating: float):
         self.__rating = rating
+        self.notifyListeners("setRating", self)
 
     def setContactInfo(self, contactInfo: str):
         self.__contactInfo = contactInfo
+        self.notifyListeners("setContactInfo", self)
+
+    def setLoyaltyLedger(self, ledger):
+        """Makes a LoyaltyLedger the record of the points of the hotel's guests and loyalty programs."""
+        self.__loyaltyLedger = ledger
 
     # Methods
+    def addListener(self, listener):
+        """Registers a callable run as listener(event, subject, *details) after every change to the hotel or its objects."""
+        self.__listeners.append(listener)
+
+    def removeListener(self, listener):
+        """Unregisters a listener added with addListener."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def notifyListeners(self, event: str, subject, *details):
+        """Passes a change (named after the method that made it) to the running totals and every registered listener."""
+        if event in _COUNTED_EVENTS:
+            self.__updateCounters(event, subject, details)
+        elif event == "setContactInfo" and isinstance(subject, Guest):
+            self.__reindexGuest(subject, details[0])
+        for listener in self.__listeners:
+            listener(event, subject, *details)
+
+    def __updateCounters(self, event: str, subject, details: tuple):
+        """Applies one change to the running totals in O(1). details carry the value the change replaced."""
+        with self.__countersLock:
+            if event == "addRoom":
+                if subject.isAvailable():
+                    self.__countAvailable(subject.getRoomType(), 1)
+            elif event == "setRoomType":
+                if subject.isAvailable():
+                    self.__countAvailable(details[0], -1)
+                    self.__countAvailable(subject.getRoomType(), 1)
+            elif event in ("bookRoom", "releaseRoom"):
+                if subject.isAvailable() != details[0]:
+                    self.__countAvailable(subject.getRoomType(), 1 if subject.isAvailable() else -1)
+            elif event == "addBooking":
+                if subject.isActive():
+                    self.__activeBookings += 1
+                    self.__bookedRevenue += subject.getTotalPrice()
+            elif event == "cancelBooking":
+                self.__activeBookings -= 1
+                self.__bookedRevenue -= subject.getTotalPrice()
+            elif event == "setTotalPrice":
+                if subject.isActive():
+                    self.__bookedRevenue += subject.getTotalPrice() - details[0]
+            elif event == "addInvoice":
+                self.__countInvoice(subject.getPaymentStatus(), subject.getAmountDue())
+            elif event == "setAmountDue":
+                self.__countInvoice(subject.getPaymentStatus(), subject.getAmountDue() - details[0])
+            else:  # setPaymentStatus or markAsPaid
+                self.__countInvoice(details[0], -subject.getAmountDue())
+                self.__countInvoice(subject.getPaymentStatus(), subject.getAmountDue())
+
+    def __reindexGuest(self, guest, previousContactInfo: str):
+        """Re-keys a guest whose contact info changed, keeping each key on the first guest added with it."""
+        position = self.__guestPositions.get(guest)
+        if position is None:
+            return
+
+        if self.__guestIndex.get(previousContactInfo) is guest:
+            del self.__guestIndex[previousContactInfo]
+            for other in self.__guests:  # Only when the indexed guest itself moved away
+                if other.getContactInfo() == previousContactInfo:
+                    self.__guestIndex[previousContactInfo] = other
+                    break
+
+        current = self.__guestIndex.get(guest.getContactInfo())
+        if current is None or position < self.__guestPositions[current]:
+            self.__guestIndex[guest.getContactInfo()] = guest
+
+    def __countAvailable(self, roomType: str, change: int):
+        self.__availableByType[roomType] = self.__availableByType.get(roomType, 0) + change
+        self.__availableRooms += change
+
+    def __countInvoice(self, paymentStatus: str, amount: float):
+        self.__invoiceTotals[paymentStatus] = self.__invoiceTotals.get(paymentStatus, 0.0) + amount
+
     def addRoom(self, room):
         """Adds a room to the hotel's room list."""
         try:
             if not isinstance(room, Room):
                 raise TypeError("Invalid room object.")
 
-            for r in self.__rooms:
-                if r.getRoomNumber() == room.getRoomNumber():
-                    raise ValueError(f"Room {room.getRoomNumber()} already exists.")
+            if room.getRoomNumber() in self.__roomIndex:
+                raise ValueError(f"Room {room.getRoomNumber()} already exists.")
 
+            self.__roomIndex[room.getRoomNumber()] = len(self.__rooms)
             self.__rooms.append(room)
+            room.setHotel(self)
+            self.notifyListeners("addRoom", room)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Hotel.addRoom", e)
 
     def addGuest(self, guest):
         """Adds a guest to the hotel's guest list."""
@@ -182,10 +572,16 @@ class Hotel:
             if not isinstance(guest, Guest):
                 raise TypeError("Invalid guest object.")
 
+            self.__guestPositions.setdefault(guest, len(self.__guests))
             self.__guests.append(guest)
+            self.__guestIndex.setdefault(guest.getContactInfo(), guest)
+            if self.__loyaltyLedger is not None:
+                self.__loyaltyLedger.open(guest)
+            guest.setHotel(self)
+            self.notifyListeners("addGuest", guest)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Hotel.addGuest", e)
 
     def addBooking(self, booking):
         """Adds a booking to the hotel's booking list."""
@@ -193,10 +589,271 @@ class Hotel:
             if not isinstance(booking, Booking):
                 raise TypeError("Invalid booking object.")
 
+            if booking.getBookingID() in self.__bookingIndex:
+                raise ValueError(f"Booking {booking.getBookingID()} already exists.")
+
+            self.__bookingIndex[booking.getBookingID()] = len(self.__bookings)
             self.__bookings.append(booking)
+            booking.setHotel(self)
+
+            if booking.isActive():
+                booking.getRoom().reserveDates(booking)
+
+            self.notifyListeners("addBooking", booking)
+
+        except TypeError as e:
+            _reportError("Hotel.addBooking", e)
+
+    def addInvoice(self, invoice):
+        """Adds an invoice to the hotel's invoice list."""
+        try:
+            if not isinstance(invoice, Invoice):
+                raise TypeError("Invalid invoice object.")
+
+            if invoice.getInvoiceID() in self.__invoiceIndex:
+                raise ValueError(f"Invoice {invoice.getInvoiceID()} already exists.")
+
+            self.__invoices.append(invoice)
+            self.__invoiceIndex[invoice.getInvoiceID()] = invoice
+            self.__bookingInvoices.setdefault(invoice.getBooking().getBookingID(), invoice)
+            self.__lastInvoiceID = max(self.__lastInvoiceID, invoice.getInvoiceID())
+            invoice.setHotel(self)
+            self.notifyListeners("addInvoice", invoice)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Hotel.addInvoice", e)
+
+    def addLoyaltyProgram(self, program):
+        """Registers a guest's loyalty program with the hotel (one program per guest)."""
+        try:
+            if not isinstance(program, LoyaltyProgram):
+                raise TypeError("Invalid loyalty program object.")
+
+            if program.getGuest() in self.__loyaltyPrograms:
+                raise ValueError(f"{program.getGuest().getName()} already has a loyalty program.")
+
+            if self.__loyaltyLedger is not None:
+                self.__loyaltyLedger.adjust(program.getGuest(), program.getPoints(), notify=False)
+            self.__loyaltyPrograms[program.getGuest()] = program
+            program.setHotel(self)
+            self.notifyListeners("addLoyaltyProgram", program)
+
+        except TypeError as e:
+            _reportError("Hotel.addLoyaltyProgram", e)
+
+    def addRooms(self, rooms):
+        """Adds every room from an iterable in one pass and reports the rejected ones instead of printing them."""
+        roomList = self.__rooms
+        roomIndex = self.__roomIndex
+        rejected = []
+        added = 0
+
+        for position, room in enumerate(rooms):
+            if not isinstance(room, Room):
+                rejected.append((position, room, "Invalid room object."))
+                continue
+
+            roomNumber = room.getRoomNumber()
+            if roomNumber in roomIndex:
+                rejected.append((position, room, f"Room {roomNumber} already exists."))
+                continue
+
+            roomIndex[roomNumber] = len(roomList)
+            roomList.append(room)
+            room.setHotel(self)
+            if self.__listeners:
+                self.notifyListeners("addRoom", room)
+            else:
+                self.__updateCounters("addRoom", room, ())
+            added += 1
+
+        return BulkLoadReport(added, rejected)
+
+    def addGuests(self, guests):
+        """Adds every guest from an iterable in one pass and reports the rejected ones instead of printing them."""
+        guestList = self.__guests
+        guestIndex = self.__guestIndex
+        guestPositions = self.__guestPositions
+        rejected = []
+        added = 0
+
+        for position, guest in enumerate(guests):
+            if not isinstance(guest, Guest):
+                rejected.append((position, guest, "Invalid guest object."))
+                continue
+
+            guestPositions.setdefault(guest, len(guestList))
+            guestList.append(guest)
+            guestIndex.setdefault(guest.getContactInfo(), guest)
+            if self.__loyaltyLedger is not None:
+                self.__loyaltyLedger.open(guest)
+            guest.setHotel(self)
+            if self.__listeners:
+                self.notifyListeners("addGuest", guest)
+            added += 1
+
+        return BulkLoadReport(added, rejected)
+
+    def addBookings(self, bookings):
+        """Adds every booking from an iterable in one pass and reports the rejected ones instead of printing them."""
+        bookingList = self.__bookings
+        bookingIndex = self.__bookingIndex
+        rejected = []
+        added = 0
+
+        for position, booking in enumerate(bookings):
+            if not isinstance(booking, Booking):
+                rejected.append((position, booking, "Invalid booking object."))
+                continue
+
+            bookingID = booking.getBookingID()
+            if bookingID in bookingIndex:
+                rejected.append((position, booking, f"Booking {bookingID} already exists."))
+                continue
+
+            bookingIndex[bookingID] = len(bookingList)
+            bookingList.append(booking)
+            booking.setHotel(self)
+            if booking.isActive():
+                booking.getRoom().reserveDates(booking)
+            if self.__listeners:
+                self.notifyListeners("addBooking", booking)
+            else:
+                self.__updateCounters("addBooking", booking, ())
+            added += 1
+
+        return BulkLoadReport(added, rejected)
+
+    def removeGuests(self, guests):
+        """Removes guests (e.g. merged duplicates) and their loyalty programs in one pass. Returns how many were removed."""
+        removing = {guest for guest in guests if guest in self.__guestPositions}
+        if not removing:
+            return 0
+
+        self.__guests = [guest for guest in self.__guests if guest not in removing]
+        self.__guestPositions = {}
+        self.__guestIndex = {}
+        for position, guest in enumerate(self.__guests):
+            self.__guestPositions.setdefault(guest, position)
+            self.__guestIndex.setdefault(guest.getContactInfo(), guest)
+
+        for guest in removing:
+            self.__loyaltyPrograms.pop(guest, None)
+            self.notifyListeners("removeGuest", guest)
+            points = guest.getLoyaltyPoints()
+            guest.setHotel(None)
+            guest.setLoyaltyPoints(points)  # A guest leaving the ledger keeps its balance
+
+        return len(removing)
+
+    def addInvoices(self, invoices):
+        """Adds every invoice from an iterable in one pass and reports the rejected ones instead of printing them."""
+        invoiceList = self.__invoices
+        invoiceIndex = self.__invoiceIndex
+        bookingInvoices = self.__bookingInvoices
+        rejected = []
+        added = 0
+
+        for position, invoice in enumerate(invoices):
+            if not isinstance(invoice, Invoice):
+                rejected.append((position, invoice, "Invalid invoice object."))
+                continue
+
+            invoiceID = invoice.getInvoiceID()
+            if invoiceID in invoiceIndex:
+                rejected.append((position, invoice, f"Invoice {invoiceID} already exists."))
+                continue
+
+            invoiceList.append(invoice)
+            invoiceIndex[invoiceID] = invoice
+            bookingInvoices.setdefault(invoice.getBooking().getBookingID(), invoice)
+            if invoiceID > self.__lastInvoiceID:
+                self.__lastInvoiceID = invoiceID
+            invoice.setHotel(self)
+            if self.__listeners:
+                self.notifyListeners("addInvoice", invoice)
+            else:
+                self.__updateCounters("addInvoice", invoice, ())
+            added += 1
+
+        return BulkLoadReport(added, rejected)
+
+    def findAvailableRooms(self, checkIn, checkOut, roomType: str = None):
+        """Returns the rooms that are free for every night from checkIn up to checkOut."""
+        try:
+            start = _toOrdinal(checkIn)
+            end = _toOrdinal(checkOut)
+            if end <= start:
+                raise ValueError("Check-out date must be after check-in date.")
+
+            return [room for room in self.__rooms
+                    if (roomType is None or room.getRoomType() == roomType) and room.isAvailableBetween(start, end)]
+
+        except (TypeError, ValueError) as e:
+            _reportError("Hotel.findAvailableRooms", e)
+            return []
+
+    def iterRooms(self, roomType: str = None, available: bool = None, limit: int = None, after: int = None):
+        """Yields rooms in the order they were added, resuming behind room number `after` when it is given."""
+        start = self.__resumeAt(self.__roomIndex, after, "room")
+
+        def matches(room):
+            return ((roomType is None or room.getRoomType() == roomType)
+                    and (available is None or room.isAvailable() == available))
+
+        return _page(self.__rooms, start, limit, matches)
+
+    def iterGuests(self, name: str = None, contactInfo: str = None, minLoyaltyPoints: int = None, limit: int = None,
+                   after=None):
+        """Yields guests in the order they were added, resuming behind the Guest object `after` when it is given."""
+        start = self.__resumeAt(self.__guestPositions, after, "guest")
+
+        def matches(guest):
+            return ((name is None or guest.getName() == name)
+                    and (contactInfo is None or guest.getContactInfo() == contactInfo)
+                    and (minLoyaltyPoints is None or guest.getLoyaltyPoints() >= minLoyaltyPoints))
+
+        return _page(self.__guests, start, limit, matches)
+
+    def iterBookings(self, active: bool = None, since=None, until=None, roomType: str = None, limit: int = None,
+                     after: int = None):
+        """Yields bookings in the order they were added, resuming behind booking ID `after` when it is given.
+
+        since and until keep the bookings whose stay overlaps that window; either may be left open.
+        """
+        start = self.__resumeAt(self.__bookingIndex, after, "booking")
+        sinceDay = None if since is None else _toOrdinal(since)
+        untilDay = None if until is None else _toOrdinal(until)
+
+        def matches(booking):
+            return ((active is None or booking.isActive() == active)
+                    and (sinceDay is None or booking.getCheckOutDay() > sinceDay)
+                    and (untilDay is None or booking.getCheckInDay() < untilDay)
+                    and (roomType is None or booking.getRoom().getRoomType() == roomType))
+
+        return _page(self.__bookings, start, limit, matches)
+
+    @staticmethod
+    def __resumeAt(positions: dict, after, kind: str):
+        """Returns the list position just behind a pagination cursor, or 0 when there is no cursor."""
+        if after is None:
+            return 0
+
+        if after not in positions:
+            raise ValueError(f"Unknown {kind} cursor: {after}")
+
+        return positions[after] + 1
+
+    def __getstate__(self):
+        """Pickles the hotel without its listeners and lock, which belong to the process that registered them."""
+        state = self.__dict__.copy()
+        state["_Hotel__listeners"] = []
+        del state["_Hotel__countersLock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__countersLock = threading.Lock()
 
     def __str__(self):
         """Returns a string representation of the hotel."""
@@ -206,6 +863,8 @@ class Hotel:
 class GuestServiceRequest:
     """Represents a guest's request for additional hotel services."""
 
+    __slots__ = ("__serviceType", "__status", "__guest")
+
     def __init__(self, serviceType: str):
         """Initializes a service request with necessary details."""
         try:
@@ -214,9 +873,10 @@ class GuestServiceRequest:
 
             self.__serviceType = serviceType
             self.__status = "Pending"  # Default status is "Pending"
+            self.__guest = None  # Guest who submitted the request
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("GuestServiceRequest.__init__", e)
 
     # Getters
     def getServiceType(self):
@@ -225,24 +885,45 @@ class GuestServiceRequest:
     def getStatus(self):
         return self.__status
 
+    def getGuest(self):
+        return self.__guest
+
     # Setters
     def setServiceType(self, serviceType: str):
+        previousType = self.__serviceType
         self.__serviceType = serviceType
+        self.__notify("setServiceType", previousType)
 
     def setStatus(self, status: str):
         """Updates the request status (e.g., 'Pending', 'Completed', 'Cancelled')."""
         validStatuses = ["Pending", "Completed", "Cancelled"]
         if status in validStatuses:
+            previousStatus = self.__status
             self.__status = status
+            self.__notify("setStatus", previousStatus)
+
+    def setGuest(self, guest):
+        """Links the request to the guest who submitted it."""
+        self.__guest = guest
 
     # Methods
+    def __notify(self, event: str, *details):
+        """Reports a change of this request to the listeners of the guest's hotel."""
+        hotel = self.__guest.getHotel() if self.__guest is not None else None
+        if hotel is not None:
+            hotel.notifyListeners(event, self, *details)
+
     def markAsCompleted(self):
         """Marks the service request as completed."""
+        previousStatus = self.__status
         self.__status = "Completed"
+        self.__notify("markAsCompleted", previousStatus)
 
     def cancelRequest(self):
         """Cancels the service request."""
+        previousStatus = self.__status
         self.__status = "Cancelled"
+        self.__notify("cancelRequest", previousStatus)
 
     def __str__(self):
         """Returns a string representation of the service request."""
@@ -252,17 +933,21 @@ class GuestServiceRequest:
 class Feedback:
     """Represents feedback provided by a guest after their stay."""
 
-    def __init__(self, rating: float, comment: str):
-        """Initializes a feedback entry with a guest, rating, and comment."""
+    __slots__ = ("__rating", "__comment", "__guest", "__booking")
+
+    def __init__(self, rating: float, comment: str, booking=None):
+        """Initializes a feedback entry with a rating, a comment and optionally the stay (Booking) it is about."""
         try:
             if not isinstance(rating, float) or not isinstance(comment, str):
                 raise TypeError("Make sure all values have the right type!")
 
             self.__rating = rating  # Rating should be between 1.0 and 5.0
             self.__comment = comment
+            self.__guest = None  # Guest who submitted the feedback
+            self.__booking = booking  # Stay the feedback is about, if known
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Feedback.__init__", e)
 
     # Getters
     def getRating(self):
@@ -271,17 +956,41 @@ class Feedback:
     def getComment(self):
         return self.__comment
 
+    def getGuest(self):
+        return self.__guest
+
+    def getBooking(self):
+        return self.__booking
+
     # Setters
     def setRating(self, rating: float):
         """Sets the guest's rating (ensures it is between 1.0 and 5.0)."""
         if 1.0 <= rating <= 5.0:
             self.__rating = rating
+            self.__notify("setRating")
 
     def setComment(self, comment: str):
         """Updates the guest's comment."""
         self.__comment = comment
+        self.__notify("setComment")
+
+    def setGuest(self, guest):
+        """Links the feedback to the guest who submitted it."""
+        self.__guest = guest
+
+    def setBooking(self, booking):
+        """Links the feedback to the stay it is about."""
+        previousBooking = self.__booking
+        self.__booking = booking
+        self.__notify("setBooking", previousBooking)
 
     # Methods
+    def __notify(self, event: str, *details):
+        """Reports a change of this feedback to the listeners of the guest's hotel."""
+        hotel = self.__guest.getHotel() if self.__guest is not None else None
+        if hotel is not None:
+            hotel.notifyListeners(event, self, *details)
+
     def __str__(self) :
         """Returns a string representation of the feedback."""
         return f"Feedback:- Rating: {self.__rating}/5.0 | Comment: {self.__comment}"
@@ -290,6 +999,9 @@ class Feedback:
 class Guest:
     """Represents a hotel guest with personal details and reservation history."""
 
+    __slots__ = ("__name", "__contactInfo", "__loyaltyPoints", "__reservations", "__serviceRequests", "__feedbacks", "__hotel",
+                 "__storeKey")
+
     def __init__(self, name: str, contactInfo: str):
         """Initializes a guest with name, contact info, and loyalty points."""
         try:
@@ -302,9 +1014,11 @@ class Guest:
             self.__reservations = []  # List of Booking objects
             self.__serviceRequests = []  # List of GuestServiceRequest objects
             self.__feedbacks = []  # List of Feedback objects
+            self.__hotel = None  # Hotel the guest was added to
+            self.__storeKey = None  # (store, row key) given by the persistent store that saved the guest, if any
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Guest.__init__", e)
 
     # Getters
     def getName(self) :
@@ -314,7 +1028,9 @@ class Guest:
         return self.__contactInfo
 
     def getLoyaltyPoints(self):
-        return self.__loyaltyPoints
+        """Returns the guest's points; with a loyalty ledger on the guest's hotel, this is the ledger balance."""
+        ledger = self.__ledger()
+        return self.__loyaltyPoints if ledger is None else ledger.getBalance(self)
 
     def getReservations(self):
         return self.__reservations
@@ -325,18 +1041,54 @@ class Guest:
     def getFeedbacks(self):
         return self.__feedbacks
 
+    def getHotel(self):
+        return self.__hotel
+
+    def getStoreKey(self, store):
+        """Returns the key of the guest's row in a persistent store (e.g. a SQLite file path), or None."""
+        if self.__storeKey is None or self.__storeKey[0] != store:
+            return None
+
+        return self.__storeKey[1]
+
     # Setters
     def setName(self, name: str):
+        previousName = self.__name
         self.__name = name
+        self.__notify("setName", previousName)
 
     def setContactInfo(self, contactInfo: str):
+        previousContactInfo = self.__contactInfo
         self.__contactInfo = contactInfo
+        self.__notify("setContactInfo", previousContactInfo)
 
     def setLoyaltyPoints(self, points: int):
         if points >= 0:
-            self.__loyaltyPoints = points
+            ledger = self.__ledger()
+            if ledger is None:
+                self.__loyaltyPoints = points
+            else:
+                ledger.setBalance(self, points, notify=False)
+            self.__notify("setLoyaltyPoints")
+
+    def setHotel(self, hotel):
+        """Links the guest to the hotel they were added to so the hotel's listeners hear about their changes."""
+        self.__hotel = hotel
+
+    def setStoreKey(self, store, key):
+        """Records the key of the guest's row in a persistent store; a guest is keyed in one store at a time."""
+        self.__storeKey = (store, key)
 
     # Methods
+    def __ledger(self):
+        """Returns the loyalty ledger of the guest's hotel, or None while the guest keeps its own points."""
+        return None if self.__hotel is None else self.__hotel.getLoyaltyLedger()
+
+    def __notify(self, event: str, *details):
+        """Reports a change of this guest to the owning hotel's listeners."""
+        if self.__hotel is not None:
+            self.__hotel.notifyListeners(event, self, *details)
+
     def addReservation(self, booking):
         """Adds a booking to the guest's reservation history."""
         try:
@@ -344,9 +1096,54 @@ class Guest:
                 raise TypeError("Invalid booking object.")
 
             self.__reservations.append(booking)
+            self.__notify("addReservation", booking)
+
+        except TypeError as e:
+            _reportError("Guest.addReservation", e)
+
+    def iterReservations(self, active: bool = None, limit: int = None):
+        """Yields the guest's bookings in the order they were made, optionally only active or cancelled ones."""
+        return _page(self.__reservations, 0, limit, lambda booking: active is None or booking.isActive() == active)
+
+    def iterServiceRequests(self, status: str = None, limit: int = None):
+        """Yields the guest's service requests in the order they were submitted, optionally only one status."""
+        return _page(self.__serviceRequests, 0, limit, lambda request: status is None or request.getStatus() == status)
+
+    def iterFeedbacks(self, minRating: float = None, limit: int = None):
+        """Yields the guest's feedback in the order it was submitted, optionally only ratings of at least minRating."""
+        return _page(self.__feedbacks, 0, limit,
+                     lambda feedback: minRating is None or feedback.getRating() >= minRating)
+
+    def mergeFrom(self, other):
+        """Takes over a duplicate guest's reservations, service requests, feedback and loyalty points, leaving it empty."""
+        try:
+            if not isinstance(other, Guest) or other is self:
+                raise TypeError("Invalid guest object.")
+
+            known = set(map(id, self.__reservations))
+            for booking in other.__reservations:
+                if booking.getGuest() is other:
+                    booking.setGuest(self)
+                if id(booking) not in known:
+                    self.__reservations.append(booking)
+            for request in other.__serviceRequests:
+                request.setGuest(self)
+            for feedback in other.__feedbacks:
+                feedback.setGuest(self)
+            self.__serviceRequests.extend(other.__serviceRequests)
+            self.__feedbacks.extend(other.__feedbacks)
+            ledger = self.__ledger()
+            if ledger is None:
+                self.__loyaltyPoints += other.__loyaltyPoints
+            else:
+                ledger.transfer(other, self, notify=False)
+
+            other.__reservations, other.__serviceRequests, other.__feedbacks = [], [], []
+            other.__loyaltyPoints = 0
+            self.__notify("mergeFrom", other)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Guest.mergeFrom", e)
 
     def redeemLoyaltyPoints(self, points: int):
         """Redeems loyalty points if the guest has enough."""
@@ -354,14 +1151,21 @@ class Guest:
             if not isinstance(points, int):
                 raise TypeError("Points must be in integer form.")
 
-            if points <= self.__loyaltyPoints:
+            ledger = self.__ledger()
+            if ledger is not None:
+                redeemed = points >= 0 and ledger.redeem(self, points, notify=False)
+            elif points <= self.__loyaltyPoints:
                 self.__loyaltyPoints -= points
-                return True
+                redeemed = True
+            else:
+                redeemed = False
 
-            return False
+            if redeemed:
+                self.__notify("redeemLoyaltyPoints", points)
+            return redeemed
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Guest.redeemLoyaltyPoints", e)
 
     def submitServiceRequest(self, request: GuestServiceRequest):
         """Submits a guest service request."""
@@ -370,9 +1174,11 @@ class Guest:
                 raise TypeError("Request must be of type GuestServiceRequest.")
 
             self.__serviceRequests.append(request)
+            request.setGuest(self)
+            self.__notify("submitServiceRequest", request)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Guest.submitServiceRequest", e)
 
     def submitFeedback(self, feedback: Feedback):
         """Submits feedback after a stay."""
@@ -381,35 +1187,45 @@ class Guest:
                 raise TypeError("Feedback must be of type Feedback.")
 
             self.__feedbacks.append(feedback)
+            feedback.setGuest(self)
+            self.__notify("submitFeedback", feedback)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Guest.submitFeedback", e)
 
     def __str__(self):
         """Returns a string representation of the guest."""
-        return f"Guest: {self.__name}, Contact: {self.__contactInfo}, Points: {self.__loyaltyPoints}"
+        return f"Guest: {self.__name}, Contact: {self.__contactInfo}, Points: {self.getLoyaltyPoints()}"
 
 
 class Booking:
     """Represents a booking made by a guest for a hotel room."""
 
+    __slots__ = ("__bookingID", "__guest", "__room", "__checkInDay", "__checkOutDay", "__totalPrice", "__isActive", "__hotel")
+
     def __init__(self, bookingID: int, guest: Guest, room: Room, checkInDate: str, checkOutDate: str, totalPrice: float):
-        """Initializes a booking with necessary details."""
+        """Initializes a booking with necessary details. Dates may be ISO strings or date objects."""
         try:
-            if not isinstance(bookingID, int) or not isinstance(guest, Guest) or not isinstance(room, Room) or not isinstance(checkInDate, str) or not isinstance(checkOutDate, str) or not isinstance(totalPrice, float):
+            if not isinstance(bookingID, int) or not isinstance(guest, Guest) or not isinstance(room, Room) or not isinstance(checkInDate, (str, date)) or not isinstance(checkOutDate, (str, date)) or not isinstance(totalPrice, float):
                 raise TypeError("Make sure all values have the right type!")
 
+            checkInDay = _toOrdinal(checkInDate)
+            checkOutDay = _toOrdinal(checkOutDate)
+            if checkOutDay <= checkInDay:
+                raise ValueError("Check-out date must be after check-in date.")
+
             self.__bookingID = bookingID
             self.__guest = guest
             self.__room = room
-            self.__checkInDate = checkInDate
-            self.__checkOutDate = checkOutDate
+            self.__checkInDay = checkInDay  # Stored as ordinal day numbers, parsed once
+            self.__checkOutDay = checkOutDay
             self.__totalPrice = totalPrice
             self.__isActive = True  # Booking is active when created
+            self.__hotel = None  # Hotel the booking was added to
             self.__room.bookRoom() # Room is booked
 
-        except TypeError as e:
-            print(f"Error: {e}")
+        except (TypeError, ValueError) as e:
+            _reportError("Booking.__init__", e)
 
     # Getters
     def getBookingID(self):
@@ -422,10 +1238,23 @@ class Booking:
         return self.__room
 
     def getCheckInDate(self):
-        return self.__checkInDate
+        """Returns the check-in date as an ISO string."""
+        return date.fromordinal(self.__checkInDay).isoformat()
 
     def getCheckOutDate(self):
-        return self.__checkOutDate
+        """Returns the check-out date as an ISO string."""
+        return date.fromordinal(self.__checkOutDay).isoformat()
+
+    def getCheckInDay(self):
+        """Returns the check-in date as an ordinal day number."""
+        return self.__checkInDay
+
+    def getCheckOutDay(self):
+        """Returns the check-out date as an ordinal day number."""
+        return self.__checkOutDay
+
+    def getNights(self):
+        return self.__checkOutDay - self.__checkInDay
 
     def getTotalPrice(self):
         return self.__totalPrice
@@ -433,32 +1262,90 @@ class Booking:
     def isActive(self):
         return self.__isActive
 
-    # Setters
-    def setCheckInDate(self, checkInDate: str):
-        self.__checkInDate = checkInDate
+    def getHotel(self):
+        return self.__hotel
 
-    def setCheckOutDate(self, checkOutDate: str):
-        self.__checkOutDate = checkOutDate
+    # Setters
+    def setCheckInDate(self, checkInDate):
+        """Moves the check-in date (ISO string, date or ordinal day) and re-indexes the room's nights."""
+        previousDay = self.__checkInDay
+        self.__moveStay(_toOrdinal(checkInDate), self.__checkOutDay)
+        self.__notify("setCheckInDate", previousDay)
+
+    def setCheckOutDate(self, checkOutDate):
+        """Moves the check-out date (ISO string, date or ordinal day) and re-indexes the room's nights."""
+        previousDay = self.__checkOutDay
+        self.__moveStay(self.__checkInDay, _toOrdinal(checkOutDate))
+        self.__notify("setCheckOutDate", previousDay)
+
+    def setGuest(self, guest: Guest):
+        """Moves the booking to another guest, e.g. when duplicate guests are merged."""
+        previousGuest = self.__guest
+        self.__guest = guest
+        self.__notify("setGuest", previousGuest)
 
     def setTotalPrice(self, totalPrice: float):
+        previousPrice = self.__totalPrice
         self.__totalPrice = totalPrice
+        self.__notify("setTotalPrice", previousPrice)
+
+    def setHotel(self, hotel):
+        """Links the booking to the hotel it was added to so the hotel's listeners hear about its changes."""
+        self.__hotel = hotel
 
     # Methods
+    def __notify(self, event: str, *details):
+        """Reports a change of this booking to the owning hotel's listeners."""
+        if self.__hotel is not None:
+            self.__hotel.notifyListeners(event, self, *details)
+
+    def __moveStay(self, checkInDay: int, checkOutDay: int):
+        """Moves the stay to new days, raising ValueError (and keeping the old stay) if they are invalid or taken."""
+        if checkOutDay <= checkInDay:
+            raise ValueError("Check-out date must be after check-in date.")
+
+        wasIndexed = self.__room.releaseDates(self)
+        if wasIndexed and not self.__room.isAvailableBetween(checkInDay, checkOutDay):
+            self.__room.reserveDates(self)
+            raise ValueError(f"Room {self.__room.getRoomNumber()} is already booked for part of that stay.")
+
+        self.__checkInDay = checkInDay
+        self.__checkOutDay = checkOutDay
+        if wasIndexed:
+            self.__room.reserveDates(self)
+
+    def overlaps(self, other):
+        """Checks whether this booking and another one share at least one night."""
+        return self.__checkInDay < other.getCheckOutDay() and other.getCheckInDay() < self.__checkOutDay
+
+    def includesNight(self, day):
+        """Checks whether the guest stays the night starting on the given day."""
+        return self.__checkInDay <= _toOrdinal(day) < self.__checkOutDay
+
+    def __lt__(self, other):
+        """Orders bookings by check-in date, then check-out date, then booking ID."""
+        return ((self.__checkInDay, self.__checkOutDay, self.__bookingID)
+                < (other.getCheckInDay(), other.getCheckOutDay(), other.getBookingID()))
+
     def cancelBooking(self):
         """Cancels the booking and releases the room."""
         if self.__isActive:
             self.__isActive = False
             self.__room.releaseRoom()
+            self.__room.releaseDates(self)
+            self.__notify("cancelBooking")
 
     def __str__(self) -> str:
         """Returns a string representation of the booking."""
         status = "Active" if self.__isActive else "Cancelled"
-        return f"Booking {self.__bookingID}: {self.__guest.getName()} | Room {self.__room.getRoomNumber()} | {self.__checkInDate} to {self.__checkOutDate} | {status}"
+        return f"Booking {self.__bookingID}: {self.__guest.getName()} | Room {self.__room.getRoomNumber()} | {self.getCheckInDate()} to {self.getCheckOutDate()} | {status}"
 
 
 class Invoice:
     """Represents an invoice for a booking, detailing charges and payments."""
 
+    __slots__ = ("__invoiceID", "__booking", "__amountDue", "__paymentStatus", "__hotel")
+
     def __init__(self, invoiceID: int, booking: Booking, amountDue: float):
         """Initializes an invoice with necessary details."""
         try:
@@ -469,9 +1356,10 @@ class Invoice:
             self.__booking = booking
             self.__amountDue = amountDue
             self.__paymentStatus = "Pending"  # Default status is "Pending"
+            self.__hotel = None  # Hotel the invoice was added to
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("Invoice.__init__", e)
 
     # Getters
     def getInvoiceID(self):
@@ -486,20 +1374,38 @@ class Invoice:
     def getPaymentStatus(self):
         return self.__paymentStatus
 
+    def getHotel(self):
+        return self.__hotel
+
     # Setters
     def setAmountDue(self, amountDue: float) :
+        previousAmount = self.__amountDue
         self.__amountDue = amountDue
+        self.__notify("setAmountDue", previousAmount)
 
     def setPaymentStatus(self, paymentStatus: str) :
         """Updates the payment status (e.g., 'Paid', 'Pending', 'Cancelled')."""
         validStatuses = ["Paid", "Pending", "Cancelled"]
         if paymentStatus in validStatuses:
+            previousStatus = self.__paymentStatus
             self.__paymentStatus = paymentStatus
+            self.__notify("setPaymentStatus", previousStatus)
+
+    def setHotel(self, hotel):
+        """Links the invoice to the hotel it was added to so the hotel's listeners hear about its changes."""
+        self.__hotel = hotel
 
     # Methods
+    def __notify(self, event: str, *details):
+        """Reports a change of this invoice to the owning hotel's listeners."""
+        if self.__hotel is not None:
+            self.__hotel.notifyListeners(event, self, *details)
+
     def markAsPaid(self) :
         """Marks the invoice as paid."""
+        previousStatus = self.__paymentStatus
         self.__paymentStatus = "Paid"
+        self.__notify("markAsPaid", previousStatus)
 
     def __str__(self):
         """Returns a string representation of the invoice."""
@@ -509,6 +1415,8 @@ class Invoice:
 class LoyaltyProgram:
     """Represents a hotel's loyalty program for returning guests."""
 
+    __slots__ = ("__guest", "__points", "__hotel")
+
     def __init__(self, guest: Guest):
         """Initializes a loyalty program with a guest and their reward points."""
         try:
@@ -517,24 +1425,48 @@ class LoyaltyProgram:
 
             self.__guest = guest
             self.__points = 0
+            self.__hotel = None  # Hotel the program was registered with
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("LoyaltyProgram.__init__", e)
 
     # Getters
     def getGuest(self):
         return self.__guest
 
     def getPoints(self) :
-        return self.__points
+        """Returns the program's points; with a loyalty ledger on the program's hotel, this is the guest's ledger balance."""
+        ledger = self.__ledger()
+        return self.__points if ledger is None else ledger.getBalance(self.__guest)
+
+    def getHotel(self):
+        return self.__hotel
 
     # Setters
     def setPoints(self, points: int):
         """Sets the guest's points (ensures non-negative values)."""
         if points >= 0:
-            self.__points = points
+            ledger = self.__ledger()
+            if ledger is None:
+                self.__points = points
+            else:
+                ledger.setBalance(self.__guest, points, notify=False)
+            self.__notify("setPoints")
+
+    def setHotel(self, hotel):
+        """Links the program to the hotel it was registered with so the hotel's listeners hear about its changes."""
+        self.__hotel = hotel
 
     # Methods
+    def __ledger(self):
+        """Returns the loyalty ledger of the program's hotel, or None while the program keeps its own points."""
+        return None if self.__hotel is None else self.__hotel.getLoyaltyLedger()
+
+    def __notify(self, event: str, *details):
+        """Reports a change of this program to the owning hotel's listeners."""
+        if self.__hotel is not None:
+            self.__hotel.notifyListeners(event, self, *details)
+
     def addPoints(self, amount: int) :
         """Adds points to the guest's loyalty balance."""
         try:
@@ -542,10 +1474,15 @@ class LoyaltyProgram:
                 raise TypeError("Amount of points must be an integer!")
 
             if amount > 0:
-                self.__points += amount
+                ledger = self.__ledger()
+                if ledger is None:
+                    self.__points += amount
+                else:
+                    ledger.earn(self.__guest, amount, notify=False)
+                self.__notify("addPoints", amount)
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("LoyaltyProgram.addPoints", e)
 
     def redeemPoints(self, amount: int) :
         """Redeems points for discounts if enough points are available."""
@@ -553,15 +1490,22 @@ class LoyaltyProgram:
             if not isinstance(amount, int):
                 raise TypeError("Amount of points must be an integer!")
 
-            if 0 < amount <= self.__points:
+            ledger = self.__ledger()
+            if ledger is not None:
+                redeemed = amount > 0 and ledger.redeem(self.__guest, amount, notify=False)
+            elif 0 < amount <= self.__points:
                 self.__points -= amount
-                return True  # Successful redemption
+                redeemed = True
+            else:
+                redeemed = False
 
-            return False  # Not enough points
+            if redeemed:
+                self.__notify("redeemPoints", amount)
+            return redeemed  # False when there are not enough points
 
         except TypeError as e:
-            print(f"Error: {e}")
+            _reportError("LoyaltyProgram.redeemPoints", e)
 
     def __str__(self) :
         """Returns a string representation of the loyalty program details."""
-        return f"{self.__guest.getName()} - Loyalty Points: {self.__points}"
+        return f"{self.__guest.getName()} - Loyalty Points: {self.getPoints()}"
@@ -0,0 +1,139 @@
+import functools
+import threading
+import time
+from collections import deque
+
+from hotel_system import Hotel, Guest, Booking, Invoice, LoyaltyProgram, errorLog
+from loyalty_ledger import LoyaltyLedger
+
+# (class, method) pairs timed while instrumentation is enabled, labelled "Class.method"
+TARGETS = [
+    (Hotel, "addRoom"), (Hotel, "addGuest"), (Hotel, "addBooking"),
+    (Booking, "__init__"), (Booking, "cancelBooking"),
+    (Invoice, "markAsPaid"),
+    (Guest, "redeemLoyaltyPoints"),
+    (LoyaltyProgram, "addPoints"), (LoyaltyProgram, "redeemPoints"), (LoyaltyProgram, "setPoints"),
+    (LoyaltyLedger, "earn"), (LoyaltyLedger, "redeem"), (LoyaltyLedger, "transfer"),
+    (LoyaltyLedger, "accrueCompletedStays"), (LoyaltyLedger, "expirePoints"),
+]
+
+_lock = threading.Lock()
+_originals = {}  # (class, method name) -> the method replaced while enabled; empty while disabled
+_metrics = {}  # Label -> [calls, total nanoseconds, raised errors, deque of recent latencies in nanoseconds]
+_errorBaselines = {}  # Label -> errorLog count when the metrics were last reset
+_sampleSize = 4096
+
+
+def isEnabled():
+    return bool(_originals)
+
+
+def enable(sampleSize: int = 4096):
+    """Starts timing every target method; percentiles are taken over each method's last sampleSize calls.
+
+    The methods are replaced by timed wrappers only while enabled, so disabled instrumentation costs nothing.
+    """
+    global _sampleSize
+    with _lock:
+        if _originals:
+            return
+
+        _sampleSize = sampleSize
+        for cls, name in TARGETS:
+            method = cls.__dict__[name]
+            _originals[(cls, name)] = method
+            setattr(cls, name, _timed(f"{cls.__name__}.{name}", method))
+    reset()
+
+
+def disable():
+    """Puts the original methods back. The metrics recorded so far stay readable until the next enable or reset."""
+    with _lock:
+        for (cls, name), method in _originals.items():
+            setattr(cls, name, method)
+        _originals.clear()
+
+
+def reset():
+    """Clears the metrics and counts errors reported from now on only."""
+    with _lock:
+        _metrics.clear()
+        _errorBaselines.clear()
+        for cls, name in TARGETS:
+            label = f"{cls.__name__}.{name}"
+            _metrics[label] = [0, 0, 0, deque(maxlen=_sampleSize)]
+            _errorBaselines[label] = errorLog.getCount(label)
+
+
+def snapshot():
+    """Returns label -> calls, errors, totalSeconds, meanMicros and p50/p95/p99Micros for every target method.
+
+    Errors count both exceptions raised out of a method and errors it handled and reported to the error log.
+    """
+    with _lock:
+        metrics = {label: (calls, total, raised, sorted(latencies))
+                   for label, (calls, total, raised, latencies) in _metrics.items()}
+        reported = {label: errorLog.getCount(label) - baseline for label, baseline in _errorBaselines.items()}
+
+    result = {}
+    for label, (calls, total, raised, latencies) in metrics.items():
+        result[label] = {"calls": calls, "errors": raised + reported[label], "totalSeconds": total / 1e9,
+                         "meanMicros": total / calls / 1000 if calls else 0.0,
+                         "p50Micros": percentile(latencies, 0.50) / 1000,
+                         "p95Micros": percentile(latencies, 0.95) / 1000,
+                         "p99Micros": percentile(latencies, 0.99) / 1000}
+    return result
+
+
+def prometheusText(prefix: str = "hotel"):
+    """Returns the snapshot in the Prometheus text exposition format, as summaries plus error counters."""
+    lines = [f"# HELP {prefix}_call_seconds Latency of instrumented hotel methods.",
+             f"# TYPE {prefix}_call_seconds summary"]
+    metrics = snapshot()
+    for label, metric in metrics.items():
+        for quantile in ("0.5", "0.95", "0.99"):
+            micros = metric[{"0.5": "p50Micros", "0.95": "p95Micros", "0.99": "p99Micros"}[quantile]]
+            lines.append(f'{prefix}_call_seconds{{method="{label}",quantile="{quantile}"}} {micros / 1e6:.9f}')
+        lines.append(f'{prefix}_call_seconds_sum{{method="{label}"}} {metric["totalSeconds"]:.9f}')
+        lines.append(f'{prefix}_call_seconds_count{{method="{label}"}} {metric["calls"]}')
+
+    lines += [f"# HELP {prefix}_errors_total Errors raised or reported by instrumented hotel methods.",
+              f"# TYPE {prefix}_errors_total counter"]
+    lines += [f'{prefix}_errors_total{{method="{label}"}} {metric["errors"]}' for label, metric in metrics.items()]
+    lines += [f"# HELP {prefix}_error_records_suppressed_total Error records dropped by the error log's rate limit.",
+              f"# TYPE {prefix}_error_records_suppressed_total counter",
+              f"{prefix}_error_records_suppressed_total {errorLog.getSuppressedCount()}"]
+    return "\n".join(lines) + "\n"
+
+
+def percentile(sortedValues: list, fraction: float):
+    """Returns the value at the given fraction (0.0-1.0) of an already sorted list, or 0.0 if it is empty."""
+    if not sortedValues:
+        return 0.0
+
+    return sortedValues[min(len(sortedValues) - 1, int(fraction * len(sortedValues)))]
+
+
+def _timed(label: str, method):
+    """Returns method wrapped to record its latency, and whether it raised, under label."""
+    clock = time.perf_counter_ns
+
+    @functools.wraps(method)
+    def timedMethod(*args, **kwargs):
+        started = clock()
+        raised = True
+        try:
+            result = method(*args, **kwargs)
+            raised = False
+            return result
+        finally:
+            elapsed = clock() - started
+            with _lock:
+                metric = _metrics.get(label)
+                if metric is not None:
+                    metric[0] += 1
+                    metric[1] += elapsed
+                    metric[2] += raised
+                    metric[3].append(elapsed)
+
+    return timedMethod
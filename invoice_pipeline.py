@@ -0,0 +1,140 @@
+import csv
+from datetime import date
+from itertools import islice
+
+from hotel_system import Hotel, Invoice, BulkLoadReport, _toOrdinal
+
+
+class InvoicePipeline:
+    """Represents a hotel's billing run: invoices checked-out stays and settles payment files, batch by batch.
+
+    Bookings and payment rows are streamed, so only one batch is held at a time however large the hotel or file.
+    Invoices are found through the hotel's invoice ID index, never by scanning. Reports keep the first
+    maxRejected rejected entries and only count the rest, so a bad file cannot fill memory with them.
+    """
+
+    def __init__(self, hotel: Hotel, batchSize: int = 10000, tolerance: float = 0.005, maxRejected: int = 1000):
+        """Initializes the pipeline; payments within tolerance of the amount due settle an invoice."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__batchSize = batchSize
+        self.__tolerance = tolerance
+        self.__maxRejected = maxRejected
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getBatchSize(self):
+        return self.__batchSize
+
+    def getMaxRejected(self):
+        return self.__maxRejected
+
+    # Methods
+    def generateInvoices(self, asOf=None):
+        """Invoices every active booking checked out by asOf (default today) that has no invoice yet.
+
+        The amount due is nights x the room's rate. New invoice IDs continue after the hotel's highest one.
+        """
+        hotel = self.__hotel
+        lastDay = date.today().toordinal() if asOf is None else _toOrdinal(asOf)
+        due = (booking for booking in hotel.iterBookings(active=True)
+               if booking.getCheckOutDay() <= lastDay and hotel.getBookingInvoice(booking.getBookingID()) is None)
+        rejected = []
+        rejectedCount = 0
+        added = 0
+
+        while True:
+            nextID = hotel.getLastInvoiceID() + 1
+            batch = [Invoice(nextID + i, booking, float(booking.getNights() * booking.getRoom().getPricePerNight()))
+                     for i, booking in enumerate(islice(due, self.__batchSize))]
+            if not batch:
+                break
+
+            report = hotel.addInvoices(batch)
+            for position, invoice, reason in report.getRejected():
+                rejectedCount = self.__reject(rejected, rejectedCount, (position + added, invoice, reason))
+            added += report.getAddedCount()
+
+        return BulkLoadReport(added, rejected, rejectedCount)
+
+    def reconcile(self, path: str):
+        """Settles pending invoices from a CSV payment file of invoice ID, amount rows (an optional header is skipped).
+
+        Returns a report of the invoices marked paid; rejected entries are (line number, row, reason).
+        """
+        rejected = []
+        rejectedCount = 0
+        settled = 0
+
+        with open(path, newline="") as paymentFile:
+            rows = enumerate(csv.reader(paymentFile), start=1)
+            while True:
+                batch = list(islice(rows, self.__batchSize))
+                if not batch:
+                    break
+
+                matched = {}  # Invoice ID -> Invoice paid by this batch
+                for line, row in batch:
+                    reason = self.__matchPayment(row, matched)
+                    if reason is not None and not (line == 1 and reason == "Malformed row."):
+                        rejectedCount = self.__reject(rejected, rejectedCount, (line, row, reason))
+
+                for invoice in matched.values():
+                    invoice.markAsPaid()
+                settled += len(matched)
+
+        return BulkLoadReport(settled, rejected, rejectedCount)
+
+    def setPaymentStatuses(self, invoiceIDs, paymentStatus: str):
+        """Sets the payment status of many invoices by ID; rejected entries are (position, invoice ID, reason)."""
+        if paymentStatus not in ("Paid", "Pending", "Cancelled"):
+            raise ValueError(f"Unknown payment status: {paymentStatus}")
+
+        rejected = []
+        rejectedCount = 0
+        updated = 0
+        for position, invoiceID in enumerate(invoiceIDs):
+            invoice = self.__hotel.getInvoice(invoiceID)
+            if invoice is None:
+                rejectedCount = self.__reject(rejected, rejectedCount,
+                                              (position, invoiceID, f"Invoice {invoiceID} does not exist."))
+                continue
+
+            invoice.setPaymentStatus(paymentStatus)
+            updated += 1
+
+        return BulkLoadReport(updated, rejected, rejectedCount)
+
+    def __reject(self, rejected: list, rejectedCount: int, entry: tuple):
+        """Keeps a rejected entry while fewer than maxRejected are kept. Returns the new rejected count."""
+        if len(rejected) < self.__maxRejected:
+            rejected.append(entry)
+        return rejectedCount + 1
+
+    def __matchPayment(self, row: list, matched: dict):
+        """Adds the invoice a payment row settles to matched, or returns why the row settles nothing."""
+        try:
+            invoiceID, amount = int(row[0]), float(row[1])
+        except (IndexError, ValueError):
+            return "Malformed row."
+
+        invoice = self.__hotel.getInvoice(invoiceID)
+        if invoice is None:
+            return f"Invoice {invoiceID} does not exist."
+
+        if invoiceID in matched or invoice.getPaymentStatus() != "Pending":
+            return f"Invoice {invoiceID} is not pending."
+
+        if abs(amount - invoice.getAmountDue()) > self.__tolerance:
+            return f"Paid {amount:.2f} but {invoice.getAmountDue():.2f} is due."
+
+        matched[invoiceID] = invoice
+        return None
+
+    def __str__(self):
+        """Returns a string representation of the invoice pipeline."""
+        return f"InvoicePipeline for {self.__hotel.getName()} | Batch size: {self.__batchSize}"
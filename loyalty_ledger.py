@@ -0,0 +1,343 @@
+import heapq
+import threading
+from array import array
+from datetime import date
+
+from hotel_system import Hotel, Guest, Booking, _toOrdinal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the bulk expiry needs it
+    np = None
+
+# Entry kinds
+EARN = 0
+REDEEM = 1
+EXPIRE = 2
+ADJUST = 3
+TRANSFER = 4
+
+
+class LoyaltyLedger:
+    """Represents the single record of a hotel's loyalty points: an append-only ledger of entries per guest.
+
+    Once a ledger is created for a hotel, the points shown by its guests (getLoyaltyPoints) and their loyalty
+    programs (getPoints) are both views of the guest's ledger balance, and every change made through them is
+    posted here. The balances a hotel's guests and programs held before are carried over as opening entries
+    dated openingDay (default: the day they are carried over). Balances are running totals, so reads are O(1);
+    posting is atomic and thread-safe. Entries are kept in compact columns so expiry can process every member in
+    one vectorized pass. The ledger listens to the hotel to queue stays for accrual by check-out day.
+    """
+
+    def __init__(self, hotel: Hotel, pointsPerCurrency: float = 1.0, expiryDays: int = 365, openingDay=None,
+                 carryOver: bool = True):
+        """Creates the ledger of a hotel and, unless carryOver is False, carries over the points already held."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__pointsPerCurrency = pointsPerCurrency
+        self.__expiryDays = expiryDays
+        self.__openingDay = None if openingDay is None else _toOrdinal(openingDay)
+        self.__lock = threading.RLock()
+        self.__members = {}  # Guest -> member number
+        self.__guests = []  # Member number -> Guest
+        self.__balances = array("q")  # Member number -> running balance
+        self.__memberEntries = []  # Member number -> positions of its entries
+        self.__entryMembers = array("q")  # The ledger's columns, one row per entry
+        self.__entryDays = array("q")
+        self.__entryPoints = array("q")  # Positive credits, negative debits
+        self.__entryKinds = array("b")
+        self.__entryListeners = []  # Callables run as listener(guest, day, kind, points, bookingID) per entry
+        self.__accruedBookings = set()  # IDs of bookings that already earned points
+        self.__dueStays = []  # Heap of (check-out day, booking ID) of stays waiting to earn points
+
+        for guest in hotel.iterGuests():
+            if carryOver:
+                self.open(guest)
+            else:
+                self.__join(guest)
+        if carryOver:
+            for program in hotel.getLoyaltyPrograms():
+                self.adjust(program.getGuest(), program.getPoints(), notify=False, day=self.__openingDay)
+        for booking in hotel.iterBookings(active=True):
+            self.__queueStay(booking)
+        hotel.addListener(self.__onChange)
+        hotel.setLoyaltyLedger(self)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getPointsPerCurrency(self):
+        return self.__pointsPerCurrency
+
+    def getExpiryDays(self):
+        return self.__expiryDays
+
+    def getOpeningDay(self):
+        """Returns the ordinal day opening entries are dated, or None if they are dated the day they are posted."""
+        return self.__openingDay
+
+    def getAccruedBookings(self):
+        """Returns the IDs of the bookings whose stays already earned points."""
+        with self.__lock:
+            return set(self.__accruedBookings)
+
+    def getBalance(self, guest: Guest):
+        """Returns a guest's balance in O(1); guests without entries have none."""
+        member = self.__members.get(guest)
+        return 0 if member is None else self.__balances[member]
+
+    def getMemberCount(self):
+        return len(self.__guests)
+
+    def getEntryCount(self):
+        return len(self.__entryMembers)
+
+    # Methods
+    def addEntryListener(self, listener):
+        """Registers a callable run as listener(guest, day, kind, points, bookingID) for every entry, in posting order.
+
+        bookingID is the booking whose stay earned an accrual entry, or None.
+        """
+        self.__entryListeners.append(listener)
+
+    def removeEntryListener(self, listener):
+        """Unregisters a listener added with addEntryListener."""
+        if listener in self.__entryListeners:
+            self.__entryListeners.remove(listener)
+
+    def open(self, guest: Guest):
+        """Makes a guest a member, carrying over the points the guest holds. Does nothing for existing members."""
+        with self.__lock:
+            if guest in self.__members:
+                return
+
+            points = guest.getLoyaltyPoints()  # Still the guest's own points, since it is not a member yet
+            self.__join(guest)
+            self.__post(guest, points, ADJUST, self.__openingDay)
+
+    def restore(self, entries, accruedBookings=()):
+        """Posts (guest, day, kind, points) entries exactly as recorded, e.g. by a journal, without notifying the hotel.
+
+        accruedBookings are the IDs of bookings whose stays already earned points.
+        """
+        with self.__lock:
+            for guest, day, kind, points in entries:
+                self.__join(guest)
+                self.__post(guest, points, kind, day)
+            self.__accruedBookings.update(accruedBookings)
+
+    def earn(self, guest: Guest, points: int, day=None, notify: bool = True):
+        """Credits points to a guest."""
+        if not isinstance(points, int) or points < 0:
+            raise ValueError("Points must be a non-negative integer.")
+
+        with self.__lock:
+            self.open(guest)
+            self.__post(guest, points, EARN, day)
+        if notify:
+            self.__notify("earn", guest, points)
+
+    def redeem(self, guest: Guest, points: int, day=None, notify: bool = True):
+        """Debits points if the guest's balance covers them, as one atomic check-and-debit. Returns True if it did."""
+        if not isinstance(points, int) or points < 0:
+            raise ValueError("Points must be a non-negative integer.")
+
+        with self.__lock:
+            self.open(guest)
+            if self.__balances[self.__members[guest]] < points:
+                return False
+            self.__post(guest, -points, REDEEM, day)
+        if notify:
+            self.__notify("redeem", guest, points)
+        return True
+
+    def adjust(self, guest: Guest, points: int, notify: bool = True, day=None):
+        """Posts a correction of points (positive or negative) to a guest's balance."""
+        with self.__lock:
+            self.open(guest)
+            self.__post(guest, points, ADJUST, day)
+        if notify:
+            self.__notify("adjust", guest, points)
+
+    def setBalance(self, guest: Guest, points: int, notify: bool = True):
+        """Posts the adjustment that brings a guest's balance to points."""
+        with self.__lock:
+            self.open(guest)
+            self.__post(guest, points - self.__balances[self.__members[guest]], ADJUST)
+        if notify:
+            self.__notify("setBalance", guest, points)
+
+    def transfer(self, fromGuest: Guest, toGuest: Guest, notify: bool = True):
+        """Moves a guest's whole balance to another guest, e.g. when duplicates are merged. Returns the points moved.
+
+        The points arrive dated on the days they were earned, so moving them does not postpone their expiry.
+        """
+        with self.__lock:
+            self.open(fromGuest)
+            self.open(toGuest)
+            points = self.__balances[self.__members[fromGuest]]
+            lots = self.__unusedCredits(self.__members[fromGuest])
+            self.__post(fromGuest, -points, TRANSFER)
+            for day, lotPoints in lots:
+                self.__post(toGuest, lotPoints, TRANSFER, day)
+        if notify:
+            self.__notify("transferOut", fromGuest, toGuest, points)
+            self.__notify("transferIn", toGuest, fromGuest, points)
+        return points
+
+    def iterEntries(self, guest: Guest = None):
+        """Yields (guest, day, kind, points) for every entry in the order posted, optionally for one guest only."""
+        if guest is None:
+            positions = range(len(self.__entryMembers))
+        else:
+            member = self.__members.get(guest)
+            positions = () if member is None else self.__memberEntries[member]
+        for position in positions:
+            yield (self.__guests[self.__entryMembers[position]], self.__entryDays[position],
+                   self.__entryKinds[position], self.__entryPoints[position])
+
+    def accrueCompletedStays(self, asOf=None):
+        """Credits pointsPerCurrency x totalPrice for every active booking checked out by asOf (default today).
+
+        Stays are queued by check-out day as the hotel adds or moves bookings, so a run only visits the stays
+        that came due. Each booking earns once, dated on its check-out day. Returns the number of bookings that
+        earned points.
+        """
+        lastDay = date.today().toordinal() if asOf is None else _toOrdinal(asOf)
+        earned = []
+        with self.__lock:
+            while self.__dueStays and self.__dueStays[0][0] <= lastDay:
+                day, bookingID = heapq.heappop(self.__dueStays)
+                booking = self.__hotel.getBooking(bookingID)
+                if (booking is None or not booking.isActive() or booking.getCheckOutDay() != day
+                        or bookingID in self.__accruedBookings):
+                    continue  # Cancelled, moved to another day or already earned
+
+                self.__accruedBookings.add(bookingID)
+                guest = booking.getGuest()
+                points = int(booking.getTotalPrice() * self.__pointsPerCurrency)
+                self.open(guest)
+                self.__post(guest, points, EARN, day, bookingID)
+                earned.append((guest, points))
+
+        for guest, points in earned:
+            self.__notify("earn", guest, points)
+        return len(earned)
+
+    def expirePoints(self, asOf=None):
+        """Expires, first in first out, the points credited more than expiryDays before asOf, for all members at once.
+
+        Returns the number of members who lost points.
+        """
+        if np is None:
+            raise ImportError("expirePoints requires NumPy to be installed.")
+
+        today = date.today().toordinal() if asOf is None else _toOrdinal(asOf)
+        cutoff = today - self.__expiryDays
+        with self.__lock:
+            members = np.frombuffer(self.__entryMembers, dtype=np.int64)
+            days = np.frombuffer(self.__entryDays, dtype=np.int64)
+            points = np.frombuffer(self.__entryPoints, dtype=np.int64)
+            balances = np.frombuffer(self.__balances, dtype=np.int64)
+
+            # Debits use up the oldest credits first, so whatever old credit they have not used up expires
+            oldCredits = (points > 0) & (days <= cutoff)
+            debits = points < 0
+            expiring = (np.bincount(members[oldCredits], weights=points[oldCredits], minlength=len(balances))
+                        - np.bincount(members[debits], weights=-points[debits], minlength=len(balances)))
+            expiring = np.minimum(np.maximum(expiring, 0).astype(np.int64), balances)
+            affected = np.flatnonzero(expiring)
+            balances[affected] -= expiring[affected]
+
+            newMembers = affected.astype(np.int64).tobytes()
+            newPoints = (-expiring[affected]).tobytes()
+            del members, days, points, balances  # Release the views so the columns can grow
+            self.__entryMembers.frombytes(newMembers)
+            self.__entryDays.frombytes(np.full(len(affected), today, dtype=np.int64).tobytes())
+            self.__entryPoints.frombytes(newPoints)
+            self.__entryKinds.frombytes(np.full(len(affected), EXPIRE, dtype=np.int8).tobytes())
+            start = len(self.__entryMembers) - len(affected)
+            expiredGuests = []
+            for offset, (member, points) in enumerate(zip(affected.tolist(), expiring[affected].tolist())):
+                self.__memberEntries[member].append(start + offset)
+                expiredGuests.append(self.__guests[member])
+                for listener in self.__entryListeners:
+                    listener(self.__guests[member], today, EXPIRE, -points, None)
+
+        for guest in expiredGuests:
+            self.__notify("expirePoints", guest)
+        return len(expiredGuests)
+
+    def close(self):
+        """Stops listening to the hotel; stays booked afterwards are no longer queued for accrual."""
+        self.__hotel.removeListener(self.__onChange)
+
+    def __join(self, guest: Guest):
+        """Makes a guest a member with no entries. The caller holds the lock."""
+        if guest not in self.__members:
+            self.__members[guest] = len(self.__guests)
+            self.__guests.append(guest)
+            self.__balances.append(0)
+            self.__memberEntries.append(array("q"))
+
+    def __post(self, guest: Guest, points: int, kind: int, day=None, bookingID: int = None):
+        """Appends one entry and updates the running balance. The caller holds the lock and opened the member."""
+        if points == 0:
+            return
+
+        member = self.__members[guest]
+        day = date.today().toordinal() if day is None else _toOrdinal(day)
+        self.__memberEntries[member].append(len(self.__entryMembers))
+        self.__entryMembers.append(member)
+        self.__entryDays.append(day)
+        self.__entryPoints.append(points)
+        self.__entryKinds.append(kind)
+        self.__balances[member] += points
+        for listener in self.__entryListeners:
+            listener(guest, day, kind, points, bookingID)
+
+    def __unusedCredits(self, member: int):
+        """Returns (day, points) of a member's credits not yet used up, oldest first; debits use the oldest credits."""
+        positions = self.__memberEntries[member]
+        credits = sorted((self.__entryDays[position], self.__entryPoints[position]) for position in positions
+                         if self.__entryPoints[position] > 0)
+        used = -sum(self.__entryPoints[position] for position in positions if self.__entryPoints[position] < 0)
+        unused = []
+        for day, points in credits:
+            if used >= points:
+                used -= points
+            else:
+                unused.append((day, points - used))
+                used = 0
+        return unused
+
+    def __queueStay(self, booking: Booking):
+        with self.__lock:
+            heapq.heappush(self.__dueStays, (booking.getCheckOutDay(), booking.getBookingID()))
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: queues stays for accrual when bookings are added or their check-out day moves."""
+        if isinstance(subject, Booking) and event in ("addBooking", "setCheckOutDate") and subject.isActive():
+            self.__queueStay(subject)
+
+    def __notify(self, event: str, guest: Guest, *details):
+        """Reports a balance change to the hotel's listeners, with the guest as the subject."""
+        self.__hotel.notifyListeners(event, guest, *details)
+
+    def __getstate__(self):
+        """Pickles the ledger without its lock and entry listeners."""
+        state = self.__dict__.copy()
+        del state["_LoyaltyLedger__lock"]
+        state["_LoyaltyLedger__entryListeners"] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.RLock()
+
+    def __str__(self):
+        """Returns a string representation of the loyalty ledger."""
+        return f"LoyaltyLedger for {self.__hotel.getName()} | Members: {len(self.__guests)} | Entries: {len(self.__entryMembers)}"
@@ -0,0 +1,234 @@
+import mmap
+import struct
+from datetime import date
+
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+
+_MAGIC = b"HOTELMAP"
+_VERSION = 1
+
+# Header: magic, version, hotel rating, hotel name/location/contact string refs, then per section (offset, count)
+_HEADER = struct.Struct("<8sIdIIIIII" + "QQ" * 6)
+_ROOM = struct.Struct("<qIIdB?")  # Room number, room type ref, price per night, amenity flags, available
+_GUEST = struct.Struct("<IIIIq?")  # Name ref, contact info ref, loyalty points, registered with the hotel
+_BOOKING = struct.Struct("<qIIiid?")  # Booking ID, room row, guest row, check-in day, check-out day, price, active
+_KEY = struct.Struct("<qI")  # Sorted lookup entry: room number or booking ID, row
+
+
+def exportHotel(hotel: Hotel, path: str):
+    """Writes a hotel's rooms, guests and bookings to a fixed-record binary file that MappedHotel can open."""
+    strings = bytearray()
+    stringRefs = {}
+
+    def ref(text: str):
+        if text not in stringRefs:
+            encoded = text.encode("utf-8")
+            stringRefs[text] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return stringRefs[text]
+
+    rooms = list(hotel.getRooms())
+    roomRows = {id(room): row for row, room in enumerate(rooms)}
+    guests = list(hotel.getGuests())
+    guestRows = {id(guest): row for row, guest in enumerate(guests)}
+    registeredGuests = len(guests)
+    bookings = hotel.getBookings()
+
+    bookingRecords = []
+    for booking in bookings:
+        room, guest = booking.getRoom(), booking.getGuest()
+        if id(room) not in roomRows:  # Rooms and guests the hotel never registered still need a row
+            roomRows[id(room)] = len(rooms)
+            rooms.append(room)
+        if id(guest) not in guestRows:
+            guestRows[id(guest)] = len(guests)
+            guests.append(guest)
+        bookingRecords.append(_BOOKING.pack(booking.getBookingID(), roomRows[id(room)], guestRows[id(guest)],
+                                            booking.getCheckInDay(), booking.getCheckOutDay(),
+                                            booking.getTotalPrice(), booking.isActive()))
+
+    roomRecords = []
+    for room in rooms:
+        flags = 0
+        for amenities in room.getAmenities():
+            flags |= amenities.getFlags()
+        roomRecords.append(_ROOM.pack(room.getRoomNumber(), *ref(room.getRoomType()), room.getPricePerNight(),
+                                      flags, room.isAvailable()))
+
+    guestRecords = [_GUEST.pack(*ref(guest.getName()), *ref(guest.getContactInfo()), guest.getLoyaltyPoints(),
+                                row < registeredGuests) for row, guest in enumerate(guests)]
+
+    roomKeys = sorted((room.getRoomNumber(), row) for row, room in enumerate(hotel.getRooms()))
+    bookingKeys = sorted((booking.getBookingID(), row) for row, booking in enumerate(bookings))
+    hotelRefs = ref(hotel.getName()) + ref(hotel.getLocation()) + ref(hotel.getContactInfo())
+
+    sections = [b"".join(roomRecords), b"".join(guestRecords), b"".join(bookingRecords),
+                b"".join(_KEY.pack(*key) for key in roomKeys), b"".join(_KEY.pack(*key) for key in bookingKeys),
+                bytes(strings)]
+    counts = [len(roomRecords), len(guestRecords), len(bookingRecords), len(roomKeys), len(bookingKeys), len(strings)]
+
+    offset = _HEADER.size
+    layout = []
+    for section, sectionCount in zip(sections, counts):
+        layout.extend((offset, sectionCount))
+        offset += len(section)
+
+    with open(path, "wb") as exportFile:
+        exportFile.write(_HEADER.pack(_MAGIC, _VERSION, hotel.getRating(), *hotelRefs, *layout))
+        for section in sections:
+            exportFile.write(section)
+
+
+class MappedHotel:
+    """Represents a read-only view of an exported hotel, memory-mapped so processes share its pages.
+
+    Records are decoded into Room, Guest and Booking objects only when they are accessed, and each is materialized
+    once. Materialized objects are detached copies: they are not added to a Hotel and changing them does not touch
+    the file. A room's amenities come back as a single Amenities object holding all of its flags.
+    """
+
+    def __init__(self, path: str):
+        """Opens an exported hotel file."""
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self.__map, 0)
+        if header[0] != _MAGIC or header[1] != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a hotel export this version can read.")
+
+        self.__rating = header[2]
+        self.__nameRef, self.__locationRef, self.__contactRef = header[3:5], header[5:7], header[7:9]
+        layout = header[9:]
+        (self.__roomOffset, self.__roomCount), (self.__guestOffset, self.__guestCount) = layout[0:2], layout[2:4]
+        (self.__bookingOffset, self.__bookingCount), (self.__roomKeyOffset, self.__roomKeyCount) = layout[4:6], layout[6:8]
+        self.__bookingKeyOffset, self.__stringOffset = layout[8], layout[10]
+        self.__rooms = {}  # Row -> materialized Room
+        self.__guests = {}  # Row -> materialized Guest
+        self.__bookings = {}  # Row -> materialized Booking
+
+    # Getters
+    def getName(self):
+        return self.__string(self.__nameRef)
+
+    def getLocation(self):
+        return self.__string(self.__locationRef)
+
+    def getRating(self):
+        return self.__rating
+
+    def getContactInfo(self):
+        return self.__string(self.__contactRef)
+
+    def getRoomCount(self):
+        return self.__roomKeyCount
+
+    def getBookingCount(self):
+        return self.__bookingCount
+
+    def getRoom(self, roomNumber: int):
+        """Returns the room with the given number, or None. Found by binary search over the sorted room keys."""
+        row = self.__findRow(self.__roomKeyOffset, self.__roomKeyCount, roomNumber)
+        return None if row is None else self.__roomAt(row)
+
+    def getBooking(self, bookingID: int):
+        """Returns the booking with the given ID, or None. Found by binary search over the sorted booking IDs."""
+        row = self.__findRow(self.__bookingKeyOffset, self.__bookingCount, bookingID)
+        return None if row is None else self.__bookingAt(row)
+
+    def getBookingAt(self, row: int):
+        """Returns the booking at a position in the hotel's original booking order."""
+        if not 0 <= row < self.__bookingCount:
+            raise IndexError("Booking row out of range.")
+        return self.__bookingAt(row)
+
+    # Methods
+    def iterRooms(self):
+        """Yields the hotel's rooms in their original order, materializing each on demand."""
+        for row in range(self.__roomKeyCount):
+            yield self.__roomAt(row)
+
+    def iterGuests(self):
+        """Yields the guests registered with the hotel in their original order."""
+        for row in range(self.__guestCount):
+            guestRecord = _GUEST.unpack_from(self.__map, self.__guestOffset + row * _GUEST.size)
+            if guestRecord[5]:
+                yield self.__guestAt(row)
+
+    def iterBookings(self):
+        """Yields the hotel's bookings in their original order, materializing each on demand."""
+        for row in range(self.__bookingCount):
+            yield self.__bookingAt(row)
+
+    def close(self):
+        """Unmaps the file. Objects already materialized stay usable."""
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exceptionInfo):
+        self.close()
+
+    def __string(self, stringRef):
+        offset, length = stringRef
+        start = self.__stringOffset + offset
+        return self.__map[start:start + length].decode("utf-8")
+
+    def __findRow(self, keyOffset: int, keyCount: int, key: int):
+        """Binary-searches a sorted key section and returns the matching row, or None."""
+        low, high = 0, keyCount
+        while low < high:
+            middle = (low + high) // 2
+            middleKey, row = _KEY.unpack_from(self.__map, keyOffset + middle * _KEY.size)
+            if middleKey == key:
+                return row
+            if middleKey < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def __roomAt(self, row: int):
+        room = self.__rooms.get(row)
+        if room is None:
+            roomNumber, typeOffset, typeLength, pricePerNight, flags, isAvailable = _ROOM.unpack_from(
+                self.__map, self.__roomOffset + row * _ROOM.size)
+            room = Room(roomNumber, self.__string((typeOffset, typeLength)), pricePerNight,
+                        [Amenities.fromFlags(flags)])
+            if not isAvailable:
+                room.bookRoom()
+            self.__rooms[row] = room
+        return room
+
+    def __guestAt(self, row: int):
+        guest = self.__guests.get(row)
+        if guest is None:
+            nameOffset, nameLength, contactOffset, contactLength, points, _ = _GUEST.unpack_from(
+                self.__map, self.__guestOffset + row * _GUEST.size)
+            guest = Guest(self.__string((nameOffset, nameLength)), self.__string((contactOffset, contactLength)))
+            guest.setLoyaltyPoints(points)
+            self.__guests[row] = guest
+        return guest
+
+    def __bookingAt(self, row: int):
+        booking = self.__bookings.get(row)
+        if booking is None:
+            bookingID, roomRow, guestRow, checkInDay, checkOutDay, totalPrice, isActive = _BOOKING.unpack_from(
+                self.__map, self.__bookingOffset + row * _BOOKING.size)
+            room = self.__roomAt(roomRow)
+            wasAvailable = room.isAvailable()
+            booking = Booking(bookingID, self.__guestAt(guestRow), room, date.fromordinal(checkInDay),
+                              date.fromordinal(checkOutDay), totalPrice)
+            if not isActive:
+                booking.cancelBooking()
+            if wasAvailable:  # Creating and cancelling the booking must not change the room's exported status
+                room.releaseRoom()
+            else:
+                room.bookRoom()
+            self.__bookings[row] = booking
+        return booking
+
+    def __str__(self):
+        """Returns a string representation of the mapped hotel."""
+        return f"MappedHotel: {self.getName()}, {self.getLocation()} | Rooms: {self.getRoomCount()} | Bookings: {self.__bookingCount}"
@@ -0,0 +1,412 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+from hotel_system import Hotel, Amenities, Invoice, Feedback, GuestServiceRequest
+from booking_engine import BookingEngine
+from loyalty_ledger import LoyaltyLedger
+from async_hotel import AsyncHotel
+from hotel_journal import HotelJournal
+from sqlite_hotel import SQLiteHotel
+from pricing_engine import PricingEngine, np
+from hotel_chain import HotelChain
+from guest_directory import GuestDirectory
+from service_dispatcher import ServiceDispatcher
+from feedback_store import FeedbackStore
+from room_index import RoomIndex
+from change_feed import ChangeFeed
+import instrumentation
+from instrumentation import percentile
+from workload import WorkloadGenerator
+
+_SERVICE_TYPES = ("Housekeeping", "Room Service", "Maintenance", "Concierge", "Laundry")
+_COMMENTS = ("clean and friendly", "slow wifi", "noisy at night", "great breakfast", "lovely view, slow wifi",
+             "comfortable bed", "dirty bathroom", "helpful staff")
+
+
+# Operation setups: each builds its state from a generator and returns step(i), run for i in range(size), or
+# (step, close) when the state holds files, processes or threads that close() releases after the run
+def _setupAddRoom(generator: WorkloadGenerator, size: int):
+    hotel = Hotel("Suite Hotel", "Benchmark", 4.0, "suite@example.com")
+    rooms = list(generator.iterRooms(size))
+    return lambda i: hotel.addRoom(rooms[i])
+
+
+def _setupAddGuest(generator: WorkloadGenerator, size: int):
+    hotel = Hotel("Suite Hotel", "Benchmark", 4.0, "suite@example.com")
+    guests = list(generator.iterGuests(size))
+    return lambda i: hotel.addGuest(guests[i])
+
+
+def _setupReserve(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), 0)
+    rooms, guests = hotel.getRooms(), hotel.getGuests()
+    stays = [(booking.getGuest(), booking.getRoom().getRoomNumber(), booking.getCheckInDay(), booking.getCheckOutDay())
+             for booking in generator.iterBookings(size, guests, rooms)]
+    engine = BookingEngine(hotel)
+    return lambda i: engine.reserve(*stays[i])
+
+
+def _setupAsyncReserve(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), 0)
+    rooms, guests = hotel.getRooms(), hotel.getGuests()
+    stays = [(booking.getGuest(), booking.getRoom().getRoomNumber(), booking.getCheckInDay(), booking.getCheckOutDay())
+             for booking in generator.iterBookings(size, guests, rooms)]
+    asyncHotel = AsyncHotel(hotel)
+    loop = asyncio.new_event_loop()
+
+    def close():
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+    return lambda i: loop.run_until_complete(asyncHotel.reserve(*stays[i])), close
+
+
+def _setupAddBooking(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), 0)
+    bookings = list(generator.iterBookings(size, hotel.getGuests(), hotel.getRooms()))
+    return lambda i: hotel.addBooking(bookings[i])
+
+
+def _setupAddBookingInstrumented(generator: WorkloadGenerator, size: int):
+    step = _setupAddBooking(generator, size)
+    instrumentation.enable()
+    return step, instrumentation.disable
+
+
+def _setupReportError(generator: WorkloadGenerator, size: int):
+    hotel = Hotel("Suite Hotel", "Benchmark", 4.0, "suite@example.com")
+    return lambda i: hotel.addRoom(None)  # Handled and reported to the rate-limited error log
+
+
+def _setupJournalMutation(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    bookings = hotel.getBookings()
+    directory = tempfile.mkdtemp()
+    journal = HotelJournal(directory)
+    journal.attach(hotel)
+
+    def close():
+        journal.close()
+        shutil.rmtree(directory)
+
+    return lambda i: bookings[i].setTotalPrice(bookings[i].getTotalPrice() + 1.0), close
+
+
+def _openSQLiteHotel(generator: WorkloadGenerator, size: int, bookingCount: int):
+    """Returns an SQLiteHotel in a new directory loaded like generator.buildHotel, its bookings and a close()."""
+    directory = tempfile.mkdtemp()
+    hotel = SQLiteHotel(os.path.join(directory, "hotel.db"), "Suite Hotel", "Benchmark", 4.0, "suite@example.com")
+    rooms, guests = list(generator.iterRooms(max(50, size // 20))), list(generator.iterGuests(max(50, size // 4)))
+    hotel.addRooms(rooms)
+    hotel.addGuests(guests)
+    bookings = list(generator.iterBookings(bookingCount, guests, rooms))
+
+    def close():
+        hotel.close()
+        shutil.rmtree(directory)
+
+    return hotel, bookings, close
+
+
+def _setupSQLiteAddBooking(generator: WorkloadGenerator, size: int):
+    hotel, bookings, close = _openSQLiteHotel(generator, size, size)
+    return lambda i: hotel.addBooking(bookings[i]), close
+
+
+def _staySearches(generator: WorkloadGenerator, bookings: list, size: int):
+    """Returns size check-in days spread over the booked period, for three-night availability searches."""
+    lastDay = max(booking.getCheckOutDay() for booking in bookings)
+    firstDay = generator.getStartDate().toordinal()
+    return [firstDay + (i * 7919) % max(1, lastDay - firstDay) for i in range(size)]
+
+
+def _setupFindAvailableRooms(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    starts = _staySearches(generator, hotel.getBookings(), size)
+    return lambda i: hotel.findAvailableRooms(starts[i], starts[i] + 3)
+
+
+def _setupSQLiteFindAvailableRooms(generator: WorkloadGenerator, size: int):
+    hotel, bookings, close = _openSQLiteHotel(generator, size, size)
+    hotel.addBookings(bookings)
+    starts = _staySearches(generator, bookings, size)
+    return lambda i: hotel.findAvailableRooms(starts[i], starts[i] + 3), close
+
+
+def _setupRoomIndexSearch(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    starts = _staySearches(generator, hotel.getBookings(), size)
+    index = RoomIndex(hotel)
+    wanted = Amenities.WIFI | Amenities.AIR_CONDITIONING
+    return lambda i: index.search(starts[i], starts[i] + 3, "Double", wanted, Amenities.MINIBAR, limit=20), index.close
+
+
+def _setupChainSearch(generator: WorkloadGenerator, size: int):
+    hotels = [generator.buildHotel(max(50, size // 80), max(50, size // 16), size // 4, f"Chain Hotel {n}")
+              for n in range(4)]
+    starts = _staySearches(generator, [booking for hotel in hotels for booking in hotel.getBookings()], size)
+    chain = HotelChain(hotels, 2)
+    chain.warmUp()
+    return lambda i: chain.search(starts[i], starts[i] + 3, limit=20), chain.close
+
+
+def _setupQuoteRooms(generator: WorkloadGenerator, size: int):
+    rooms = list(generator.iterRooms(100))
+    engine = PricingEngine({"Deluxe": 1.2, "Suite": 1.5}, [1.0, 1.0, 1.0, 1.0, 1.2, 1.2, 1.0],
+                           [1.0] * 5 + [1.5, 1.5, 1.5] + [1.0] * 4)
+    firstDay = generator.getStartDate().toordinal()
+    return lambda i: engine.quoteRooms(rooms, firstDay + i % 365, firstDay + i % 365 + 7)
+
+
+def _setupCreateInvoice(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    bookings = hotel.getBookings()
+    return lambda i: hotel.addInvoice(Invoice(i + 1, bookings[i], bookings[i].getTotalPrice()))
+
+
+def _setupResolveGuest(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    guests = hotel.getGuests()
+    contacts = [guests[(i * 7919) % len(guests)].getContactInfo().upper() for i in range(size)]
+    directory = GuestDirectory(hotel)
+    return lambda i: directory.resolve(contacts[i]), directory.close
+
+
+def _setupCheckInGuest(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    guests = hotel.getGuests()
+    arrivals = [(guest.getName(), guest.getContactInfo()) for guest in (guests[i % len(guests)] for i in range(size))]
+    arrivals[1::2] = [(f"Walk In {i}", f"walkin{i}@example.com") for i in range(1, size, 2)]  # Every other one is new
+    directory = GuestDirectory(hotel)
+    return lambda i: directory.checkIn(*arrivals[i]), directory.close
+
+
+def _setupSubmitServiceRequest(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    guests = hotel.getGuests()
+    requests = [GuestServiceRequest(_SERVICE_TYPES[i % len(_SERVICE_TYPES)]) for i in range(size)]
+    dispatcher = ServiceDispatcher(hotel, priorities={"Maintenance": 1, "Room Service": 2})
+    return lambda i: guests[i % len(guests)].submitServiceRequest(requests[i]), dispatcher.close
+
+
+def _setupCompleteServiceRequest(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    guests = hotel.getGuests()
+    dispatcher = ServiceDispatcher(hotel, priorities={"Maintenance": 1, "Room Service": 2})
+    for i in range(size):
+        guests[i % len(guests)].submitServiceRequest(GuestServiceRequest(_SERVICE_TYPES[i % len(_SERVICE_TYPES)]))
+    return lambda i: dispatcher.complete(dispatcher.claim(i % 50)), dispatcher.close  # 50 staff take turns
+
+
+def _setupSubmitFeedback(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    feedback = [Feedback(float(1 + i % 5), _COMMENTS[i % len(_COMMENTS)], booking)
+                for i, booking in enumerate(hotel.getBookings())]
+    store = FeedbackStore(hotel)
+    return lambda i: feedback[i].getBooking().getGuest().submitFeedback(feedback[i]), store.close
+
+
+def _setupSearchFeedback(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), max(50, size // 4), size)
+    store = FeedbackStore(hotel)
+    for i, booking in enumerate(hotel.getBookings()):
+        booking.getGuest().submitFeedback(Feedback(float(1 + i % 5), _COMMENTS[i % len(_COMMENTS)], booking))
+    searches = [("slow", "wifi"), ("breakfast",), ("noisy",), ("friendly", "clean")]
+    return lambda i: store.search(*searches[i % len(searches)], roomType="Double"), store.close
+
+
+def _setupPublishChange(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(max(50, size // 20), 0, 0)
+    rooms = hotel.getRooms()
+    feed = ChangeFeed(hotel, capacity=4096, batchSize=256)
+    feed.subscribe(lambda events: None)
+
+    def step(i):
+        room = rooms[(i * 7919) % len(rooms)]
+        if room.isAvailable():
+            room.bookRoom()
+        else:
+            room.releaseRoom()
+
+    return step, feed.close
+
+
+def _setupLoyaltyEarn(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    ledger = LoyaltyLedger(hotel)
+    guests = hotel.getGuests()
+    return lambda i: ledger.earn(guests[i % len(guests)], 100, notify=False)
+
+
+def _setupLoyaltyRedeem(generator: WorkloadGenerator, size: int):
+    hotel = generator.buildHotel(0, max(50, size // 4), 0)
+    ledger = LoyaltyLedger(hotel)
+    guests = hotel.getGuests()
+    for guest in guests:
+        ledger.earn(guest, 1000, notify=False)
+    return lambda i: ledger.redeem(guests[i % len(guests)], 50, notify=False)
+
+
+OPERATIONS = {
+    "addRoom": _setupAddRoom,
+    "addGuest": _setupAddGuest,
+    "addBooking": _setupAddBooking,
+    "reserve": _setupReserve,
+    "asyncReserve": _setupAsyncReserve,
+    "findAvailableRooms": _setupFindAvailableRooms,
+    "roomIndexSearch": _setupRoomIndexSearch,
+    "chainSearch": _setupChainSearch,
+    "createInvoice": _setupCreateInvoice,
+    "loyaltyEarn": _setupLoyaltyEarn,
+    "loyaltyRedeem": _setupLoyaltyRedeem,
+    "resolveGuest": _setupResolveGuest,
+    "checkInGuest": _setupCheckInGuest,
+    "submitServiceRequest": _setupSubmitServiceRequest,
+    "completeServiceRequest": _setupCompleteServiceRequest,
+    "submitFeedback": _setupSubmitFeedback,
+    "searchFeedback": _setupSearchFeedback,
+    "publishChange": _setupPublishChange,
+    "journalMutation": _setupJournalMutation,
+    "sqliteAddBooking": _setupSQLiteAddBooking,
+    "sqliteFindAvailableRooms": _setupSQLiteFindAvailableRooms,
+    "addBookingInstrumented": _setupAddBookingInstrumented,
+    "reportError": _setupReportError,
+}
+if np is not None:  # PricingEngine needs NumPy
+    OPERATIONS["quoteRooms"] = _setupQuoteRooms
+
+
+def _prepare(name: str, size: int, seed: int):
+    """Runs an operation's setup on fresh generated data. Returns its step and a close() to call after the run."""
+    prepared = OPERATIONS[name](WorkloadGenerator(seed), size)
+    return prepared if isinstance(prepared, tuple) else (prepared, lambda: None)
+
+
+def measureOperation(name: str, size: int = 10000, seed: int = 0, memory: bool = True):
+    """Runs one operation size times on fresh generated data and returns its throughput, latency and memory.
+
+    Latency is timed per call. Peak memory is traced in a second run on the same data, so tracing does not slow
+    the timed one; it is the highest memory in use during the calls above what the setup left allocated.
+    """
+    step, close = _prepare(name, size, seed)
+    latencies = []
+    clock = time.perf_counter_ns
+    try:
+        started = clock()
+        for i in range(size):
+            callStarted = clock()
+            step(i)
+            latencies.append(clock() - callStarted)
+        elapsed = (clock() - started) / 1e9
+    finally:
+        close()
+    latencies.sort()
+
+    result = {"count": size, "opsPerSecond": size / elapsed, "p50Micros": percentile(latencies, 0.50) / 1000,
+              "p95Micros": percentile(latencies, 0.95) / 1000, "p99Micros": percentile(latencies, 0.99) / 1000}
+
+    if memory:
+        tracemalloc.start()
+        try:
+            step, close = _prepare(name, size, seed)
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                for i in range(size):
+                    step(i)
+                result["peakBytes"] = tracemalloc.get_traced_memory()[1] - before
+            finally:
+                close()
+        finally:
+            tracemalloc.stop()
+        result["bytesPerOp"] = result["peakBytes"] / size
+
+    return result
+
+
+def runSuite(size: int = 10000, seed: int = 0, operations=None, memory: bool = True):
+    """Measures every operation (or the named ones) at one size. Returns operation name -> result."""
+    return {name: measureOperation(name, size, seed, memory) for name in (operations or OPERATIONS)}
+
+
+def saveBaseline(results: dict, path: str, size: int, seed: int):
+    """Writes suite results and the settings they were measured with to a JSON baseline file."""
+    baseline = {"size": size, "seed": seed, "python": platform.python_version(),
+                "recorded": date.today().isoformat(), "results": results}
+    with open(path, "w") as baselineFile:
+        json.dump(baseline, baselineFile, indent=2, sort_keys=True)
+
+
+def loadBaseline(path: str):
+    with open(path) as baselineFile:
+        return json.load(baselineFile)
+
+
+def compareResults(baseline: dict, results: dict, tolerance: float = 0.25, memoryTolerance: float = 0.10):
+    """Returns a message for every regression of results against a baseline's results; none means the run passes.
+
+    Throughput may drop, and p95 latency rise, by up to tolerance; peak memory may rise by up to memoryTolerance.
+    Operations missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline["results"].get(name)
+        if expected is None:
+            continue
+
+        if result["opsPerSecond"] < expected["opsPerSecond"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['opsPerSecond']:,.0f} ops/sec, baseline {expected['opsPerSecond']:,.0f}")
+        if result["p95Micros"] > expected["p95Micros"] * (1 + tolerance) + 1.0:  # 1 us of timer noise is allowed
+            regressions.append(f"{name}: p95 {result['p95Micros']:.1f} us, baseline {expected['p95Micros']:.1f} us")
+        if "peakBytes" in result and "peakBytes" in expected \
+                and result["peakBytes"] > expected["peakBytes"] * (1 + memoryTolerance):
+            regressions.append(f"{name}: peak {result['peakBytes']:,} bytes, baseline {expected['peakBytes']:,}")
+
+    return regressions
+
+
+def main(argv=None):
+    """Runs the suite from the command line. Returns 1 when a comparison finds regressions, else 0."""
+    parser = argparse.ArgumentParser(description="Benchmark the hotel model on synthetic workloads.")
+    parser.add_argument("--size", type=int, default=10000, help="operations per benchmark (1000 to 10000000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ops", nargs="+", choices=list(OPERATIONS), help="operations to run (default: all)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak memory run")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail on regressions against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = loadBaseline(args.compare)
+        if (baseline["size"], baseline["seed"]) != (args.size, args.seed):
+            parser.error(f"the baseline was recorded with --size {baseline['size']} --seed {baseline['seed']}")
+
+    results = runSuite(args.size, args.seed, args.ops, not args.no_memory)
+    for name, result in results.items():
+        memory = f" | {result['bytesPerOp']:8.1f} B/op" if "bytesPerOp" in result else ""
+        print(f"{name:<24} {result['opsPerSecond']:12,.0f} ops/sec | p50 {result['p50Micros']:8.1f} us | "
+              f"p95 {result['p95Micros']:8.1f} us | p99 {result['p99Micros']:8.1f} us{memory}")
+
+    if args.save:
+        saveBaseline(results, args.save, args.size, args.seed)
+    if baseline is not None:
+        regressions = compareResults(baseline, results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
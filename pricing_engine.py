@@ -0,0 +1,137 @@
+from datetime import date
+
+from hotel_system import Room, Guest, _toOrdinal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized pricing needs it
+    np = None
+
+_EPOCH_DAY = date(1970, 1, 1).toordinal()  # datetime64[D] counts days from the Unix epoch
+
+
+class PricingEngine:
+    """Represents a dynamic price calculator that quotes many rooms over many nights at once with NumPy.
+
+    A night's rate is the room's base price times its room type, day-of-week and month multipliers, raised by an
+    occupancy surge once occupancy passes surgeThreshold (reaching 1 + maxSurge when the hotel is full). A stay's
+    total is the sum of its nightly rates less the guest's loyalty discount, rounded to cents.
+    """
+
+    def __init__(self, roomTypeMultipliers: dict = None, dayOfWeekMultipliers=None, monthMultipliers=None,
+                 surgeThreshold: float = 0.7, maxSurge: float = 0.5, loyaltyTiers=None):
+        """Initializes the engine. Day-of-week multipliers run Monday to Sunday, month multipliers January to
+        December; loyalty tiers are (minimum points, discount fraction) pairs."""
+        if np is None:
+            raise ImportError("PricingEngine requires NumPy to be installed.")
+
+        self.__roomTypeMultipliers = dict(roomTypeMultipliers or {})  # Room type -> multiplier, 1.0 if missing
+        self.setDayOfWeekMultipliers([1.0] * 7 if dayOfWeekMultipliers is None else dayOfWeekMultipliers)
+        self.setMonthMultipliers([1.0] * 12 if monthMultipliers is None else monthMultipliers)
+        self.__surgeThreshold = surgeThreshold
+        self.__maxSurge = maxSurge
+        self.setLoyaltyTiers([(0, 0.0), (1000, 0.05), (5000, 0.10)] if loyaltyTiers is None else loyaltyTiers)
+
+    # Getters
+    def getRoomTypeMultipliers(self):
+        return dict(self.__roomTypeMultipliers)
+
+    def getDayOfWeekMultipliers(self):
+        return self.__dayOfWeekMultipliers.tolist()
+
+    def getMonthMultipliers(self):
+        return self.__monthMultipliers.tolist()
+
+    def getSurgeThreshold(self):
+        return self.__surgeThreshold
+
+    def getMaxSurge(self):
+        return self.__maxSurge
+
+    def getLoyaltyTiers(self):
+        return list(zip(self.__tierPoints.tolist(), self.__tierDiscounts.tolist()))
+
+    # Setters
+    def setRoomTypeMultiplier(self, roomType: str, multiplier: float):
+        self.__roomTypeMultipliers[roomType] = multiplier
+
+    def setDayOfWeekMultipliers(self, multipliers):
+        multipliers = np.asarray(multipliers, dtype=np.float64)
+        if multipliers.shape != (7,):
+            raise ValueError("Expected 7 day-of-week multipliers, Monday to Sunday.")
+        self.__dayOfWeekMultipliers = multipliers
+
+    def setMonthMultipliers(self, multipliers):
+        multipliers = np.asarray(multipliers, dtype=np.float64)
+        if multipliers.shape != (12,):
+            raise ValueError("Expected 12 month multipliers, January to December.")
+        self.__monthMultipliers = multipliers
+
+    def setSurge(self, surgeThreshold: float, maxSurge: float):
+        """Sets the occupancy (0.0-1.0) where surge pricing starts and the extra fraction charged at full occupancy."""
+        if not 0.0 <= surgeThreshold < 1.0:
+            raise ValueError("Surge threshold must be at least 0.0 and below 1.0.")
+        self.__surgeThreshold = surgeThreshold
+        self.__maxSurge = maxSurge
+
+    def setLoyaltyTiers(self, tiers):
+        """Sets the (minimum points, discount fraction) tiers; a guest gets the discount of the highest tier reached."""
+        tiers = sorted(tiers)
+        self.__tierPoints = np.array([points for points, _ in tiers], dtype=np.int64)
+        self.__tierDiscounts = np.array([discount for _, discount in tiers], dtype=np.float64)
+
+    # Methods
+    def nightMultipliers(self, checkIn, checkOut, occupancy=None):
+        """Returns the combined day-of-week, month and surge multiplier of every night from checkIn up to checkOut.
+
+        occupancy is a fraction for the whole stay or one fraction per night.
+        """
+        start, end = _toOrdinal(checkIn), _toOrdinal(checkOut)
+        if end <= start:
+            raise ValueError("Check-out date must be after check-in date.")
+
+        nights = np.arange(start, end, dtype=np.int64)
+        months = (nights - _EPOCH_DAY).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) % 12
+        multipliers = self.__dayOfWeekMultipliers[(nights - 1) % 7] * self.__monthMultipliers[months]
+        if occupancy is not None:
+            multipliers = multipliers * self.surgeMultipliers(occupancy)
+        return multipliers
+
+    def surgeMultipliers(self, occupancy):
+        """Returns the surge multiplier for an occupancy fraction, or for an array of them."""
+        pressure = (np.asarray(occupancy, dtype=np.float64) - self.__surgeThreshold) / (1.0 - self.__surgeThreshold)
+        return 1.0 + self.__maxSurge * np.clip(pressure, 0.0, 1.0)
+
+    def loyaltyDiscounts(self, loyaltyPoints):
+        """Returns the discount fraction for a points balance, or for an array of balances."""
+        tier = np.searchsorted(self.__tierPoints, np.asarray(loyaltyPoints, dtype=np.int64), side="right") - 1
+        return np.where(tier >= 0, self.__tierDiscounts[np.maximum(tier, 0)], 0.0)
+
+    def nightlyRates(self, basePrices, roomTypes, checkIn, checkOut, occupancy=None):
+        """Returns a (rooms x nights) array of nightly rates for parallel lists of base prices and room types."""
+        basePrices = np.asarray(basePrices, dtype=np.float64)
+        typeMultipliers = np.fromiter((self.__roomTypeMultipliers.get(roomType, 1.0) for roomType in roomTypes),
+                                      dtype=np.float64, count=len(basePrices))
+        return np.outer(basePrices * typeMultipliers, self.nightMultipliers(checkIn, checkOut, occupancy))
+
+    def quoteRooms(self, rooms: list, checkIn, checkOut, occupancy=None, loyaltyPoints: int = 0):
+        """Returns the total price of the stay in each room as an array, in the order of rooms."""
+        basePrices = np.fromiter((room.getPricePerNight() for room in rooms), dtype=np.float64, count=len(rooms))
+        rates = self.nightlyRates(basePrices, [room.getRoomType() for room in rooms], checkIn, checkOut, occupancy)
+        return np.round(rates.sum(axis=1) * (1.0 - self.loyaltyDiscounts(loyaltyPoints)), 2)
+
+    def quoteStay(self, room: Room, checkIn, checkOut, guest: Guest = None, occupancy=None):
+        """Returns the total price of one stay, ready to pass to Booking as totalPrice."""
+        loyaltyPoints = 0 if guest is None else guest.getLoyaltyPoints()
+        return float(self.quoteRooms([room], checkIn, checkOut, occupancy, loyaltyPoints)[0])
+
+    @staticmethod
+    def occupancyFromTable(table, roomCount: int, checkIn, checkOut):
+        """Returns the fraction of roomCount rooms occupied on each night, from a BookingTable of the hotel."""
+        start, end = _toOrdinal(checkIn), _toOrdinal(checkOut)
+        _, occupied = table.occupancyPerNight(np.datetime64(start - _EPOCH_DAY, "D"), np.datetime64(end - _EPOCH_DAY, "D"))
+        return occupied / max(roomCount, 1)
+
+    def __str__(self):
+        """Returns a string representation of the pricing engine."""
+        return f"PricingEngine | Room types priced: {len(self.__roomTypeMultipliers)} | Surge from {self.__surgeThreshold:.0%} up to +{self.__maxSurge:.0%} | Loyalty tiers: {len(self.__tierPoints)}"
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import OrderedDict
+
+from hotel_system import Hotel, Guest, _toOrdinal
+from pricing_engine import PricingEngine
+
+
+class QuoteCache:
+    """Represents a bounded LRU + TTL cache of availability and price quotes for one hotel.
+
+    A quote is the list of (room, total price) pairs free for a stay, keyed by room type, dates and loyalty
+    discount. The cache listens to the hotel and drops only the quotes a change can affect: bookings added,
+    cancelled or moved drop the quotes of that room type overlapping the nights involved, and price or type
+    changes drop every quote of the room type. Quotes are priced without occupancy surge, since surge would tie
+    every quote to every booking.
+    """
+
+    def __init__(self, hotel: Hotel, pricingEngine: PricingEngine, maxSize: int = 4096, ttl: float = 60.0,
+                 clock=time.monotonic):
+        """Initializes the cache and starts listening to the hotel's changes."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__pricingEngine = pricingEngine
+        self.__maxSize = maxSize
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries = OrderedDict()  # (room type, check-in day, check-out day, discount) -> (expires at, quotes)
+        self.__keysByType = {}  # Room type (None for all types) -> keys of cached quotes for that type
+        self.__lock = threading.Lock()
+        self.__generation = 0  # Bumped by every invalidation so a quote computed meanwhile is not stored
+        self.__stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getMaxSize(self):
+        return self.__maxSize
+
+    def getTTL(self):
+        return self.__ttl
+
+    def getStats(self):
+        """Returns a copy of the hit, miss, eviction, expiration and invalidation counts plus the current size."""
+        with self.__lock:
+            return {**self.__stats, "size": len(self.__entries)}
+
+    # Methods
+    def quote(self, checkIn, checkOut, roomType: str = None, guest: Guest = None):
+        """Returns (room, total price) pairs for the rooms free for the whole stay, from the cache when possible."""
+        start, end = _toOrdinal(checkIn), _toOrdinal(checkOut)
+        loyaltyPoints = 0 if guest is None else guest.getLoyaltyPoints()
+        key = (roomType, start, end, float(self.__pricingEngine.loyaltyDiscounts(loyaltyPoints)))
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[0] > self.__clock():
+                    self.__entries.move_to_end(key)
+                    self.__stats["hits"] += 1
+                    return list(entry[1])
+
+                self.__remove(key)
+                self.__stats["expirations"] += 1
+            self.__stats["misses"] += 1
+            generation = self.__generation
+
+        rooms = self.__hotel.findAvailableRooms(start, end, roomType)
+        prices = self.__pricingEngine.quoteRooms(rooms, start, end, loyaltyPoints=loyaltyPoints) if rooms else []
+        quotes = tuple(zip(rooms, (float(price) for price in prices)))
+
+        with self.__lock:
+            if generation != self.__generation:
+                return list(quotes)
+
+            self.__entries[key] = (self.__clock() + self.__ttl, quotes)
+            self.__entries.move_to_end(key)
+            self.__keysByType.setdefault(roomType, set()).add(key)
+            while len(self.__entries) > self.__maxSize:
+                self.__remove(next(iter(self.__entries)))
+                self.__stats["evictions"] += 1
+
+        return list(quotes)
+
+    def invalidate(self, roomType: str, start=None, end=None):
+        """Drops the cached quotes of a room type (and of all types) overlapping start up to end, or all its dates."""
+        start = None if start is None else _toOrdinal(start)
+        end = None if end is None else _toOrdinal(end)
+        with self.__lock:
+            self.__generation += 1
+            for keyType in (roomType, None):
+                for key in list(self.__keysByType.get(keyType, ())):
+                    if start is None or (key[1] < end and key[2] > start):
+                        self.__remove(key)
+                        self.__stats["invalidations"] += 1
+
+    def clear(self):
+        """Drops every cached quote."""
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__keysByType.clear()
+
+    def close(self):
+        """Stops listening to the hotel and drops every cached quote."""
+        self.__hotel.removeListener(self.__onChange)
+        self.clear()
+
+    def __remove(self, key: tuple):
+        del self.__entries[key]
+        keys = self.__keysByType[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.__keysByType[key[0]]
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: invalidates the quotes a change can affect."""
+        if event in ("addBooking", "cancelBooking"):
+            if event == "cancelBooking" or subject.isActive():
+                self.invalidate(subject.getRoom().getRoomType(), subject.getCheckInDay(), subject.getCheckOutDay())
+        elif event in ("setCheckInDate", "setCheckOutDate"):
+            if subject.isActive():
+                # details[0] is the day the change replaced, so the stay before and after lies within these bounds
+                self.invalidate(subject.getRoom().getRoomType(), min(subject.getCheckInDay(), details[0]),
+                                max(subject.getCheckOutDay(), details[0]))
+        elif event in ("addRoom", "setPricePerNight"):
+            self.invalidate(subject.getRoomType())
+        elif event == "setRoomType":
+            self.invalidate(details[0])
+            self.invalidate(subject.getRoomType())
+
+    def __str__(self):
+        """Returns a string representation of the quote cache."""
+        return f"QuoteCache for {self.__hotel.getName()} | Quotes: {len(self.__entries)}/{self.__maxSize} | Hits: {self.__stats['hits']} | Misses: {self.__stats['misses']}"
@@ -0,0 +1,276 @@
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+from hotel_system import Hotel, Room, Amenities, _toOrdinal
+
+_FLAGS = (Amenities.WIFI, Amenities.TV, Amenities.MINIBAR, Amenities.AIR_CONDITIONING)
+_CHUNK_BITS = 4096
+_CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+
+
+def _bitmapOf(positions, size: int):
+    """Builds the bitmap with the given bit positions set, in one pass instead of one big-integer copy per bit."""
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+def _iterPositions(bitmap: int):
+    """Yields the positions of the set bits of a bitmap, lowest first.
+
+    The bitmap is unpacked _CHUNK_BITS at a time, so a caller that stops after a page never converts all of it.
+    """
+    offset = 0
+    while bitmap:
+        chunk = bitmap & _CHUNK_MASK
+        if chunk:
+            for index, word in enumerate(array("Q", chunk.to_bytes(_CHUNK_BITS // 8, sys.byteorder))):
+                while word:
+                    low = word & -word
+                    yield offset + (index << 6) + low.bit_length() - 1
+                    word ^= low
+        bitmap >>= _CHUNK_BITS
+        offset += _CHUNK_BITS
+
+
+def _without(bitmap: int, removed: int):
+    """Returns bitmap AND NOT removed; cheaper than inverting removed, which turns it into a negative number."""
+    return bitmap ^ (bitmap & removed)
+
+
+class RoomIndex:
+    """Represents bitmap indexes over a hotel's rooms for multi-criteria search.
+
+    Bit i of every bitmap stands for the hotel's i-th room. There is one bitmap per amenity flag, per room type,
+    per price bucket (priceStep wide, kept in sorted order) and one of rooms marked available, so a filter is a
+    handful of AND/OR operations on integers. Only rooms passing every filter have their booked nights checked
+    for a stay, and only until a page is full. The index listens to the hotel and follows addRoom, setAmenities,
+    setRoomType, setPricePerNight, bookRoom and releaseRoom; changes made directly on an Amenities object are
+    picked up the next time the room's amenities are set.
+    """
+
+    def __init__(self, hotel: Hotel, priceStep: float = 25.0):
+        """Indexes the hotel's rooms and starts listening to its changes."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        if priceStep <= 0:
+            raise ValueError("The price step must be positive.")
+
+        self.__hotel = hotel
+        self.__priceStep = priceStep
+        self.__lock = threading.RLock()
+        self.__rooms = list(hotel.getRooms())  # Bit position -> Room
+        self.__positions = {room: position for position, room in enumerate(self.__rooms)}
+        self.__byNumber = {room.getRoomNumber(): position for position, room in enumerate(self.__rooms)}
+        self.__types = [room.getRoomType() for room in self.__rooms]  # Bit position -> indexed room type
+        self.__prices = [room.getPricePerNight() for room in self.__rooms]  # Bit position -> indexed price
+        self.__flags = [self.__flagsOf(room) for room in self.__rooms]  # Bit position -> indexed amenity flags
+
+        size = len(self.__rooms)
+        self.__all = (1 << size) - 1
+        self.__byFlag = [_bitmapOf((position for position, flags in enumerate(self.__flags) if flags & flag), size)
+                         for flag in _FLAGS]
+        self.__available = _bitmapOf((position for position, room in enumerate(self.__rooms) if room.isAvailable()),
+                                     size)
+        self.__byType = self.__group(self.__types)
+        self.__byBucket = self.__group([self.__bucket(price) for price in self.__prices])
+        self.__buckets = sorted(self.__byBucket)  # Price buckets holding rooms, lowest first
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getPriceStep(self):
+        return self.__priceStep
+
+    def getRoomTypes(self):
+        return list(self.__byType)
+
+    # Methods
+    def search(self, checkIn=None, checkOut=None, roomType=None, withAmenities: int = 0, withoutAmenities: int = 0,
+               minPrice: float = None, maxPrice: float = None, available: bool = None, limit: int = None,
+               after: int = None):
+        """Returns rooms matching every criterion, in the order the hotel added them.
+
+        roomType is one type or a collection of types (any of them matches). withAmenities and withoutAmenities
+        are Amenities bit flags the room must all have or must all lack, e.g. Amenities.WIFI | Amenities.TV.
+        With checkIn and checkOut, only rooms free for every night of the stay are returned. Pages resume behind
+        room number `after`.
+        """
+        start = end = None
+        if checkIn is not None or checkOut is not None:
+            start, end = _toOrdinal(checkIn), _toOrdinal(checkOut)
+            if end <= start:
+                raise ValueError("Check-out date must be after check-in date.")
+
+        with self.__lock:
+            candidates = self.__match(roomType, withAmenities, withoutAmenities, minPrice, maxPrice, available)
+            if after is not None:
+                position = self.__byNumber.get(after)
+                if position is None:
+                    raise ValueError(f"Room {after} is not in the index.")
+                candidates = candidates >> (position + 1) << (position + 1)
+            rooms = self.__rooms
+
+        matches = []
+        if limit is not None and limit <= 0:
+            return matches
+        for position in _iterPositions(candidates):
+            room = rooms[position]
+            if start is None or room.isAvailableBetween(start, end):
+                matches.append(room)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def count(self, roomType=None, withAmenities: int = 0, withoutAmenities: int = 0, minPrice: float = None,
+              maxPrice: float = None, available: bool = None):
+        """Returns the number of rooms matching every criterion, without visiting any room."""
+        with self.__lock:
+            return self.__match(roomType, withAmenities, withoutAmenities, minPrice, maxPrice, available).bit_count()
+
+    def close(self):
+        """Stops listening to the hotel."""
+        self.__hotel.removeListener(self.__onChange)
+
+    def __match(self, roomType, withAmenities: int, withoutAmenities: int, minPrice: float, maxPrice: float,
+                available: bool):
+        """Returns the bitmap of the rooms matching every criterion. The caller holds the lock."""
+        bitmap = self.__all
+        for index, flag in enumerate(_FLAGS):
+            if withAmenities & flag:
+                bitmap &= self.__byFlag[index]
+            if withoutAmenities & flag:
+                bitmap = _without(bitmap, self.__byFlag[index])
+
+        if roomType is not None:
+            types = 0
+            for name in ((roomType,) if isinstance(roomType, str) else roomType):
+                types |= self.__byType.get(name, 0)
+            bitmap &= types
+
+        if available is not None:
+            bitmap = bitmap & self.__available if available else _without(bitmap, self.__available)
+
+        if bitmap and (minPrice is not None or maxPrice is not None):
+            bitmap &= self.__priceRange(bitmap, minPrice, maxPrice)
+        return bitmap
+
+    def __priceRange(self, candidates: int, minPrice: float, maxPrice: float):
+        """Returns the bitmap of candidate rooms priced within [minPrice, maxPrice].
+
+        Buckets wholly inside the range are ORed; only candidates in the two edge buckets have their price checked.
+        """
+        low = 0 if minPrice is None else bisect_left(self.__buckets, self.__bucket(minPrice))
+        high = len(self.__buckets) if maxPrice is None else bisect_right(self.__buckets, self.__bucket(maxPrice))
+        if low >= high:
+            return 0
+
+        inRange = 0
+        for bucket in self.__buckets[low:high]:
+            inRange |= self.__byBucket[bucket]
+
+        edges = 0
+        if minPrice is not None:
+            edges |= self.__byBucket[self.__buckets[low]]
+        if maxPrice is not None:
+            edges |= self.__byBucket[self.__buckets[high - 1]]
+        prices = self.__prices
+        outside = [position for position in _iterPositions(edges & candidates)
+                   if (minPrice is not None and prices[position] < minPrice)
+                   or (maxPrice is not None and prices[position] > maxPrice)]
+        return _without(inRange, _bitmapOf(outside, len(prices))) if outside else inRange
+
+    def __bucket(self, price: float):
+        return int(price // self.__priceStep)
+
+    @staticmethod
+    def __flagsOf(room: Room):
+        flags = 0
+        for amenities in room.getAmenities():
+            flags |= amenities.getFlags()
+        return flags
+
+    def __group(self, keys: list):
+        """Returns key -> bitmap of the positions holding that key."""
+        positions = {}
+        for position, key in enumerate(keys):
+            positions.setdefault(key, []).append(position)
+        return {key: _bitmapOf(keyPositions, len(keys)) for key, keyPositions in positions.items()}
+
+    def __move(self, bitmaps: dict, position: int, previousKey, key):
+        """Moves a room's bit from one keyed bitmap to another, dropping bitmaps that become empty."""
+        bit = 1 << position
+        remaining = _without(bitmaps[previousKey], bit)
+        if remaining:
+            bitmaps[previousKey] = remaining
+        else:
+            del bitmaps[previousKey]
+        bitmaps[key] = bitmaps.get(key, 0) | bit
+
+    def __addRoom(self, room: Room):
+        with self.__lock:
+            if room in self.__positions:
+                return
+
+            position = len(self.__rooms)
+            bit = 1 << position
+            self.__rooms.append(room)
+            self.__positions[room] = position
+            self.__byNumber[room.getRoomNumber()] = position
+            self.__types.append(room.getRoomType())
+            self.__prices.append(room.getPricePerNight())
+            self.__flags.append(self.__flagsOf(room))
+            self.__all |= bit
+            for index, flag in enumerate(_FLAGS):
+                if self.__flags[position] & flag:
+                    self.__byFlag[index] |= bit
+            if room.isAvailable():
+                self.__available |= bit
+            self.__byType[room.getRoomType()] = self.__byType.get(room.getRoomType(), 0) | bit
+            bucket = self.__bucket(room.getPricePerNight())
+            if bucket not in self.__byBucket:
+                insort(self.__buckets, bucket)
+            self.__byBucket[bucket] = self.__byBucket.get(bucket, 0) | bit
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: keeps the bitmaps in step with the hotel's rooms."""
+        if not isinstance(subject, Room):
+            return
+
+        if event == "addRoom":
+            self.__addRoom(subject)
+            return
+
+        with self.__lock:
+            position = self.__positions.get(subject)
+            if position is None:
+                return
+
+            bit = 1 << position
+            if event == "setRoomType":
+                self.__move(self.__byType, position, self.__types[position], subject.getRoomType())
+                self.__types[position] = subject.getRoomType()
+            elif event == "setPricePerNight":
+                previousBucket = self.__bucket(self.__prices[position])
+                bucket = self.__bucket(subject.getPricePerNight())
+                self.__prices[position] = subject.getPricePerNight()
+                if bucket != previousBucket:
+                    self.__move(self.__byBucket, position, previousBucket, bucket)
+                    self.__buckets = sorted(self.__byBucket)
+            elif event == "setAmenities":
+                flags = self.__flagsOf(subject)
+                self.__flags[position] = flags
+                for index, flag in enumerate(_FLAGS):
+                    self.__byFlag[index] = self.__byFlag[index] | bit if flags & flag else _without(self.__byFlag[index], bit)
+            elif event in ("bookRoom", "releaseRoom"):
+                self.__available = self.__available | bit if subject.isAvailable() else _without(self.__available, bit)
+
+    def __str__(self):
+        """Returns a string representation of the room index."""
+        return f"RoomIndex for {self.__hotel.getName()} | Rooms: {len(self.__rooms)} | Types: {len(self.__byType)} | Price buckets: {len(self.__buckets)}"
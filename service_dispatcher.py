@@ -0,0 +1,200 @@
+import heapq
+import threading
+from itertools import count
+
+from hotel_system import Hotel, Guest, GuestServiceRequest
+
+
+class ServiceDispatcher:
+    """Represents a hotel-wide queue of guest service requests that staff claim and complete.
+
+    Pending requests wait in heaps ordered by priority (lower is more urgent), then by age, with one heap for
+    the whole hotel and one per service type, so claiming the next request is O(log n). Every request is also
+    indexed by status and by service type. The dispatcher listens to the hotel, so requests submitted, completed,
+    cancelled or retyped through the requests themselves keep the queue and indexes in step. A claimed request
+    stays "Pending" until it is completed; releasing it puts it back in line at its original age.
+    """
+
+    def __init__(self, hotel: Hotel, priorities: dict = None, defaultPriority: int = 5):
+        """Queues the pending requests of the hotel's guests and starts listening to its changes."""
+        if not isinstance(hotel, Hotel):
+            raise TypeError("Invalid hotel object.")
+
+        self.__hotel = hotel
+        self.__priorities = dict(priorities or {})  # Service type -> priority of its new requests
+        self.__defaultPriority = defaultPriority
+        self.__lock = threading.RLock()
+        self.__arrivals = count()
+        self.__ages = {}  # GuestServiceRequest -> arrival number
+        self.__queue = []  # Heap of [priority, arrival number, request] entries
+        self.__queueByType = {}  # Service type -> heap of the same entries
+        self.__queued = {}  # GuestServiceRequest -> its current heap entry; older entries are skipped
+        self.__claimed = {}  # GuestServiceRequest -> worker who claimed it
+        self.__byStatus = {}  # Status -> {GuestServiceRequest: None}
+        self.__byType = {}  # Service type -> {GuestServiceRequest: None}
+        self.__indexed = {}  # GuestServiceRequest -> (status, service type) it is indexed under
+
+        for guest in hotel.iterGuests():
+            for request in guest.iterServiceRequests():
+                self.__register(request)
+        hotel.addListener(self.__onChange)
+
+    # Getters
+    def getHotel(self):
+        return self.__hotel
+
+    def getPriority(self, serviceType: str):
+        return self.__priorities.get(serviceType, self.__defaultPriority)
+
+    def getQueuedCount(self, serviceType: str = None):
+        """Returns the number of pending requests waiting to be claimed, optionally of one service type."""
+        with self.__lock:
+            if serviceType is None:
+                return len(self.__queued)
+            return sum(1 for request in self.__byType.get(serviceType, ()) if request in self.__queued)
+
+    def getClaimedBy(self, request: GuestServiceRequest):
+        """Returns the worker holding a claimed request, or None."""
+        return self.__claimed.get(request)
+
+    def getRequests(self, status: str = None, serviceType: str = None):
+        """Returns the requests with a status and/or service type from the indexes, oldest first."""
+        with self.__lock:
+            if status is None and serviceType is None:
+                requests = self.__indexed
+            elif status is None:
+                requests = self.__byType.get(serviceType, {})
+            elif serviceType is None:
+                requests = self.__byStatus.get(status, {})
+            else:
+                byStatus, byType = self.__byStatus.get(status, {}), self.__byType.get(serviceType, {})
+                smaller, larger = (byStatus, byType) if len(byStatus) <= len(byType) else (byType, byStatus)
+                requests = [request for request in smaller if request in larger]
+            return sorted(requests, key=self.__ages.get)
+
+    # Setters
+    def setPriority(self, request: GuestServiceRequest, priority: int):
+        """Changes the priority of a queued request, keeping its age."""
+        with self.__lock:
+            if request in self.__queued:
+                self.__enqueue(request, priority)
+
+    # Methods
+    def claim(self, worker=None, serviceType: str = None):
+        """Takes the most urgent, then oldest, queued request (optionally of one service type) for a worker.
+
+        Returns the request, or None when nothing is waiting.
+        """
+        with self.__lock:
+            heap = self.__queue if serviceType is None else self.__queueByType.get(serviceType, [])
+            while heap:
+                entry = heapq.heappop(heap)
+                request = entry[2]
+                if self.__queued.get(request) is entry:
+                    del self.__queued[request]
+                    self.__claimed[request] = worker
+                    return request
+            return None
+
+    def complete(self, request: GuestServiceRequest):
+        """Marks a request completed; the listener takes it out of the queue and moves it in the indexes."""
+        request.markAsCompleted()
+
+    def cancel(self, request: GuestServiceRequest):
+        """Cancels a request; the listener takes it out of the queue and moves it in the indexes."""
+        request.cancelRequest()
+
+    def release(self, request: GuestServiceRequest):
+        """Gives a claimed request back to the queue, at its original age."""
+        with self.__lock:
+            if request in self.__claimed:
+                del self.__claimed[request]
+                self.__enqueue(request, self.getPriority(request.getServiceType()))
+
+    def close(self):
+        """Stops listening to the hotel."""
+        self.__hotel.removeListener(self.__onChange)
+
+    def __register(self, request: GuestServiceRequest):
+        with self.__lock:
+            if request in self.__indexed:
+                return
+
+            self.__ages[request] = next(self.__arrivals)
+            self.__index(request)
+            if request.getStatus() == "Pending":
+                self.__enqueue(request, self.getPriority(request.getServiceType()))
+
+    def __unregister(self, request: GuestServiceRequest):
+        with self.__lock:
+            if request in self.__indexed:
+                self.__unindex(request)
+                del self.__ages[request]
+                self.__queued.pop(request, None)
+                self.__claimed.pop(request, None)
+                self.__compact()
+
+    def __enqueue(self, request: GuestServiceRequest, priority: int):
+        """Pushes a fresh heap entry for a request, which makes any older entry of it stale."""
+        entry = [priority, self.__ages[request], request]
+        self.__queued[request] = entry
+        heapq.heappush(self.__queue, entry)
+        heapq.heappush(self.__queueByType.setdefault(request.getServiceType(), []), entry)
+
+    def __compact(self):
+        """Rebuilds the heaps without their stale entries once those outnumber the queued requests."""
+        if len(self.__queue) <= 2 * len(self.__queued) + 64:
+            return
+
+        self.__queue = list(self.__queued.values())
+        heapq.heapify(self.__queue)
+        self.__queueByType = {}
+        for entry in self.__queue:
+            self.__queueByType.setdefault(entry[2].getServiceType(), []).append(entry)
+        for heap in self.__queueByType.values():
+            heapq.heapify(heap)
+
+    def __index(self, request: GuestServiceRequest):
+        status, serviceType = request.getStatus(), request.getServiceType()
+        self.__indexed[request] = (status, serviceType)
+        self.__byStatus.setdefault(status, {})[request] = None
+        self.__byType.setdefault(serviceType, {})[request] = None
+
+    def __unindex(self, request: GuestServiceRequest):
+        status, serviceType = self.__indexed.pop(request)
+        for index, key in ((self.__byStatus, status), (self.__byType, serviceType)):
+            requests = index[key]
+            del requests[request]
+            if not requests:
+                del index[key]
+
+    def __reindex(self, request: GuestServiceRequest):
+        """Moves a changed request in the indexes and the queue to match its current status and service type."""
+        with self.__lock:
+            if request not in self.__indexed:
+                return
+
+            self.__unindex(request)
+            self.__index(request)
+            if request.getStatus() != "Pending":
+                self.__queued.pop(request, None)
+                self.__claimed.pop(request, None)
+                self.__compact()
+            elif request in self.__queued:
+                self.__enqueue(request, self.__queued[request][0])  # Into the heap of its current service type
+            elif request not in self.__claimed:
+                self.__enqueue(request, self.getPriority(request.getServiceType()))
+
+    def __onChange(self, event: str, subject, *details):
+        """Hotel listener: keeps the queue and indexes in step with the guests' service requests."""
+        if event == "submitServiceRequest":
+            self.__register(details[0])
+        elif isinstance(subject, GuestServiceRequest):
+            self.__reindex(subject)
+        elif event == "removeGuest" and isinstance(subject, Guest):
+            for request in subject.iterServiceRequests():
+                self.__unregister(request)
+
+    def __str__(self):
+        """Returns a string representation of the service dispatcher."""
+        return f"ServiceDispatcher for {self.__hotel.getName()} | Queued: {len(self.__queued)} | Claimed: {len(self.__claimed)}"
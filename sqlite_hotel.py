@@ -0,0 +1,628 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import date
+from itertools import islice
+
+from hotel_system import Room, Amenities, Guest, Booking, Invoice, BulkLoadReport, _toOrdinal, _reportError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hotel (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    name TEXT NOT NULL, location TEXT NOT NULL, rating REAL NOT NULL, contactInfo TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rooms (
+    roomNumber INTEGER PRIMARY KEY,
+    roomType TEXT NOT NULL, pricePerNight REAL NOT NULL, amenityFlags TEXT NOT NULL, isAvailable INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS roomsByType ON rooms (roomType);
+CREATE TABLE IF NOT EXISTS guests (
+    guestID INTEGER PRIMARY KEY,
+    name TEXT NOT NULL, contactInfo TEXT NOT NULL, loyaltyPoints INTEGER NOT NULL, registered INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS guestsByContact ON guests (contactInfo);
+CREATE TABLE IF NOT EXISTS bookings (
+    bookingID INTEGER PRIMARY KEY,
+    guestID INTEGER NOT NULL REFERENCES guests, roomNumber INTEGER NOT NULL REFERENCES rooms,
+    checkInDay INTEGER NOT NULL, checkOutDay INTEGER NOT NULL, totalPrice REAL NOT NULL, isActive INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS activeBookingsByRoom ON bookings (roomNumber, checkInDay, checkOutDay) WHERE isActive = 1;
+CREATE INDEX IF NOT EXISTS bookingsByDates ON bookings (checkInDay, checkOutDay);
+CREATE TABLE IF NOT EXISTS invoices (
+    invoiceID INTEGER PRIMARY KEY,
+    bookingID INTEGER NOT NULL REFERENCES bookings, amountDue REAL NOT NULL, paymentStatus TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS invoicesByBooking ON invoices (bookingID);
+"""
+
+_ROOM_COLUMNS = "roomNumber, roomType, pricePerNight, amenityFlags, isAvailable"
+_BOOKING_COLUMNS = "bookingID, guestID, roomNumber, checkInDay, checkOutDay, totalPrice, isActive"
+_GUEST_COLUMNS = "guestID, name, contactInfo, loyaltyPoints"
+_INVOICE_COLUMNS = "invoiceID, bookingID, amountDue, paymentStatus"
+
+# A booking with its guest and room in one row, so loading bookings takes one query however many there are
+_BOOKING_QUERY = ("SELECT b.bookingID, b.checkInDay, b.checkOutDay, b.totalPrice, b.isActive, "
+                  "g.guestID, g.name, g.contactInfo, g.loyaltyPoints, "
+                  "r.roomNumber, r.roomType, r.pricePerNight, r.amenityFlags, r.isAvailable "
+                  "FROM bookings AS b JOIN guests AS g ON g.guestID = b.guestID "
+                  "JOIN rooms AS r ON r.roomNumber = b.roomNumber")
+_INVOICE_QUERY = ("SELECT i.invoiceID, i.amountDue, i.paymentStatus, " + _BOOKING_QUERY[len("SELECT "):]
+                  .replace("FROM bookings AS b", "FROM invoices AS i JOIN bookings AS b ON b.bookingID = i.bookingID"))
+
+
+class SQLiteHotel:
+    """Represents a hotel whose rooms, guests, bookings and invoices live in a SQLite file instead of in memory.
+
+    It offers Hotel's operations on rooms, guests, bookings and invoices; loyalty programs are not stored, and
+    counts and totals come from SQL aggregates instead of running counters. Objects it returns are built from rows on every call and are linked
+    back to it, so changes made through their setters (cancelBooking, markAsPaid, setPricePerNight, ...) are
+    written through to the database. Every thread gets its own pooled connection, closed once its thread has
+    exited; the file runs in WAL mode so readers never block the writer.
+
+    A guest is stamped with the key of its row (Guest.getStoreKey) when it is stored or loaded, so its changes
+    reach the right row however long ago it was seen. Loaded guests are reused from a cache of the guestCacheSize
+    most recently used ones; loading a row evicted from it builds a new object for the same row.
+    """
+
+    def __init__(self, path: str, name: str = "", location: str = "", rating: float = 0.0, contactInfo: str = "",
+                 batchSize: int = 10000, guestCacheSize: int = 10000):
+        """Opens (or creates) a hotel database. Stored hotel details take precedence over the arguments."""
+        self.__path = path
+        self.__store = self if path == ":memory:" else os.path.abspath(path)  # Scope of the guests' store keys
+        self.__batchSize = batchSize
+        self.__local = threading.local()
+        self.__connections = {}  # Thread -> its pooled connection, so close() can reach them all
+        self.__connectionsLock = threading.Lock()
+        self.__guestCacheSize = guestCacheSize
+        self.__guestsByID = OrderedDict()  # Guest ID -> Guest built or stored here, least recently used first
+        self.__guestIDsLock = threading.Lock()
+        self.__listeners = []
+
+        connection = self.__connection()
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.execute("INSERT OR IGNORE INTO hotel VALUES (1, ?, ?, ?, ?)",
+                               (name, location, float(rating), contactInfo))
+
+    # Getters
+    def __hotelField(self, column: str):
+        return self.__connection().execute(f"SELECT {column} FROM hotel WHERE id = 1").fetchone()[0]
+
+    def getName(self):
+        return self.__hotelField("name")
+
+    def getLocation(self):
+        return self.__hotelField("location")
+
+    def getRating(self):
+        return self.__hotelField("rating")
+
+    def getContactInfo(self):
+        return self.__hotelField("contactInfo")
+
+    def getRooms(self):
+        return [self.__buildRoom(row) for row in self.__connection().execute(
+            f"SELECT {_ROOM_COLUMNS} FROM rooms ORDER BY roomNumber")]
+
+    def getGuests(self):
+        return [self.__buildGuest(row) for row in self.__connection().execute(
+            f"SELECT {_GUEST_COLUMNS} FROM guests WHERE registered = 1 ORDER BY guestID")]
+
+    def getBookings(self):
+        return [self.__buildBooking(row) for row in self.__connection().execute(
+            f"{_BOOKING_QUERY} ORDER BY b.bookingID")]
+
+    def getInvoices(self):
+        return [self.__buildInvoice(row) for row in self.__connection().execute(
+            f"{_INVOICE_QUERY} ORDER BY i.invoiceID")]
+
+    def getBookingInvoice(self, bookingID: int):
+        """Returns the invoice of a booking with the lowest ID, or None if the booking has not been invoiced."""
+        row = self.__connection().execute(f"{_INVOICE_QUERY} WHERE i.bookingID = ? ORDER BY i.invoiceID LIMIT 1",
+                                          (bookingID,)).fetchone()
+        return None if row is None else self.__buildInvoice(row)
+
+    def getLastInvoiceID(self):
+        """Returns the highest invoice ID stored, or 0 if the hotel has no invoices."""
+        return self.__connection().execute("SELECT COALESCE(MAX(invoiceID), 0) FROM invoices").fetchone()[0]
+
+    def getAvailableRoomCount(self, roomType: str = None):
+        """Returns how many rooms (of one type, or in total) are marked available."""
+        return self.__connection().execute(
+            "SELECT COUNT(*) FROM rooms WHERE isAvailable = 1 AND (?1 IS NULL OR roomType = ?1)",
+            (roomType,)).fetchone()[0]
+
+    def getActiveBookingCount(self):
+        return self.__connection().execute("SELECT COUNT(*) FROM bookings WHERE isActive = 1").fetchone()[0]
+
+    def getBookedRevenue(self):
+        """Returns the total price of the active bookings."""
+        return self.__connection().execute(
+            "SELECT COALESCE(SUM(totalPrice), 0.0) FROM bookings WHERE isActive = 1").fetchone()[0]
+
+    def getInvoiceTotal(self, paymentStatus: str):
+        """Returns the total amount due of the invoices with a payment status ('Paid', 'Pending' or 'Cancelled')."""
+        return self.__connection().execute(
+            "SELECT COALESCE(SUM(amountDue), 0.0) FROM invoices WHERE paymentStatus = ?",
+            (paymentStatus,)).fetchone()[0]
+
+    def getLoyaltyLedger(self):
+        """Returns None: guests of a SQLiteHotel keep their points in the guests table."""
+        return None
+
+    def getRoom(self, roomNumber: int):
+        """Returns the room with the given number, or None if the hotel has no such room."""
+        row = self.__connection().execute(f"SELECT {_ROOM_COLUMNS} FROM rooms WHERE roomNumber = ?",
+                                          (roomNumber,)).fetchone()
+        return None if row is None else self.__buildRoom(row)
+
+    def getGuest(self, contactInfo: str):
+        """Returns the first guest registered with the given contact info, or None."""
+        row = self.__connection().execute(
+            f"SELECT {_GUEST_COLUMNS} FROM guests WHERE contactInfo = ? AND registered = 1 "
+            "ORDER BY guestID LIMIT 1", (contactInfo,)).fetchone()
+        return None if row is None else self.__buildGuest(row)
+
+    def getBooking(self, bookingID: int):
+        """Returns the booking with the given ID, or None if there is no such booking."""
+        row = self.__connection().execute(f"{_BOOKING_QUERY} WHERE b.bookingID = ?", (bookingID,)).fetchone()
+        return None if row is None else self.__buildBooking(row)
+
+    def getInvoice(self, invoiceID: int):
+        """Returns the invoice with the given ID, or None if there is no such invoice."""
+        row = self.__connection().execute(f"{_INVOICE_QUERY} WHERE i.invoiceID = ?", (invoiceID,)).fetchone()
+        return None if row is None else self.__buildInvoice(row)
+
+    # Setters
+    def __setHotelField(self, column: str, value):
+        connection = self.__connection()
+        with connection:
+            connection.execute(f"UPDATE hotel SET {column} = ? WHERE id = 1", (value,))
+
+    def setName(self, name: str):
+        self.__setHotelField("name", name)
+
+    def setLocation(self, location: str):
+        self.__setHotelField("location", location)
+
+    def setRating(self, rating: float):
+        self.__setHotelField("rating", rating)
+
+    def setContactInfo(self, contactInfo: str):
+        self.__setHotelField("contactInfo", contactInfo)
+
+    # Methods
+    def addListener(self, listener):
+        """Registers a callable run as listener(event, subject, *details) after every change written through."""
+        self.__listeners.append(listener)
+
+    def removeListener(self, listener):
+        """Unregisters a listener added with addListener."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def notifyListeners(self, event: str, subject, *details):
+        """Writes a change made through a linked object to the database, then passes it to the listeners."""
+        connection = self.__connection()
+        with connection:
+            if isinstance(subject, Room):
+                connection.execute(
+                    "UPDATE rooms SET roomType = ?, pricePerNight = ?, amenityFlags = ?, isAvailable = ? "
+                    "WHERE roomNumber = ?", self.__roomRow(subject)[1:] + (subject.getRoomNumber(),))
+            elif isinstance(subject, Booking):
+                connection.execute(
+                    "UPDATE bookings SET guestID = ?, checkInDay = ?, checkOutDay = ?, totalPrice = ?, isActive = ? "
+                    "WHERE bookingID = ?", (self.__guestID(connection, subject.getGuest()), subject.getCheckInDay(),
+                                            subject.getCheckOutDay(), subject.getTotalPrice(), subject.isActive(),
+                                            subject.getBookingID()))
+            elif isinstance(subject, Guest):
+                guestID = subject.getStoreKey(self.__store)
+                if guestID is not None:
+                    connection.execute("UPDATE guests SET name = ?, contactInfo = ?, loyaltyPoints = ? "
+                                       "WHERE guestID = ?", (subject.getName(), subject.getContactInfo(),
+                                                             subject.getLoyaltyPoints(), guestID))
+            elif isinstance(subject, Invoice):
+                connection.execute("UPDATE invoices SET amountDue = ?, paymentStatus = ? WHERE invoiceID = ?",
+                                   (subject.getAmountDue(), subject.getPaymentStatus(), subject.getInvoiceID()))
+
+        for listener in self.__listeners:
+            listener(event, subject, *details)
+
+    def addRoom(self, room):
+        """Adds a room to the hotel."""
+        try:
+            if not isinstance(room, Room):
+                raise TypeError("Invalid room object.")
+
+            connection = self.__connection()
+            try:
+                with connection:
+                    connection.execute(f"INSERT INTO rooms ({_ROOM_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                                       self.__roomRow(room))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Room {room.getRoomNumber()} already exists.")
+
+            room.setHotel(self)
+
+        except TypeError as e:
+            _reportError("SQLiteHotel.addRoom", e)
+
+    def addGuest(self, guest):
+        """Adds a guest to the hotel."""
+        try:
+            if not isinstance(guest, Guest):
+                raise TypeError("Invalid guest object.")
+
+            connection = self.__connection()
+            with connection:
+                self.__guestID(connection, guest, registered=True)
+            guest.setHotel(self)
+
+        except TypeError as e:
+            _reportError("SQLiteHotel.addGuest", e)
+
+    def addBooking(self, booking):
+        """Adds a booking to the hotel. Its guest is stored too if the hotel has not seen them yet."""
+        try:
+            if not isinstance(booking, Booking):
+                raise TypeError("Invalid booking object.")
+
+            connection = self.__connection()
+            roomNumber = booking.getRoom().getRoomNumber()
+            if not self.__existingKeys(connection, "rooms", "roomNumber", [roomNumber]):
+                raise ValueError(f"Room {roomNumber} does not exist.")
+
+            try:
+                with connection:
+                    connection.execute(f"INSERT INTO bookings ({_BOOKING_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                       self.__bookingRow(connection, booking))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Booking {booking.getBookingID()} already exists.")
+
+            booking.setHotel(self)
+
+        except TypeError as e:
+            _reportError("SQLiteHotel.addBooking", e)
+
+    def addInvoice(self, invoice):
+        """Adds an invoice to the hotel."""
+        try:
+            if not isinstance(invoice, Invoice):
+                raise TypeError("Invalid invoice object.")
+
+            connection = self.__connection()
+            try:
+                with connection:
+                    connection.execute(f"INSERT INTO invoices ({_INVOICE_COLUMNS}) VALUES (?, ?, ?, ?)",
+                                       self.__invoiceRow(invoice))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Invoice {invoice.getInvoiceID()} already exists.")
+
+            invoice.setHotel(self)
+
+        except TypeError as e:
+            _reportError("SQLiteHotel.addInvoice", e)
+
+    def addRooms(self, rooms):
+        """Adds every room from an iterable with batched executemany inserts and reports the rejected ones."""
+        return self.__bulkInsert(rooms, Room, "Invalid room object.", lambda room: room.getRoomNumber(),
+                                 "rooms", "roomNumber", _ROOM_COLUMNS, lambda connection, room: self.__roomRow(room),
+                                 "Room {} already exists.")
+
+    def addGuests(self, guests):
+        """Adds every guest from an iterable in batched transactions and reports the rejected ones."""
+        connection = self.__connection()
+        rejected = []
+        added = 0
+        iterator = enumerate(guests)
+        while True:
+            batch = list(islice(iterator, self.__batchSize))
+            if not batch:
+                break
+
+            with connection:
+                for position, guest in batch:
+                    if not isinstance(guest, Guest):
+                        rejected.append((position, guest, "Invalid guest object."))
+                        continue
+                    self.__guestID(connection, guest, registered=True)
+                    guest.setHotel(self)
+                    added += 1
+
+        return BulkLoadReport(added, rejected)
+
+    def addBookings(self, bookings):
+        """Adds every booking from an iterable with batched executemany inserts and reports the rejected ones."""
+        def unknownRoom(connection, batch: list):
+            rooms = self.__existingKeys(connection, "rooms", "roomNumber",
+                                        [booking.getRoom().getRoomNumber() for booking in batch])
+            return lambda booking: (None if booking.getRoom().getRoomNumber() in rooms
+                                    else f"Room {booking.getRoom().getRoomNumber()} does not exist.")
+
+        return self.__bulkInsert(bookings, Booking, "Invalid booking object.", lambda booking: booking.getBookingID(),
+                                 "bookings", "bookingID", _BOOKING_COLUMNS, self.__bookingRow,
+                                 "Booking {} already exists.", unknownRoom)
+
+    def addInvoices(self, invoices):
+        """Adds every invoice from an iterable with batched executemany inserts and reports the rejected ones."""
+        return self.__bulkInsert(invoices, Invoice, "Invalid invoice object.", lambda invoice: invoice.getInvoiceID(),
+                                 "invoices", "invoiceID", _INVOICE_COLUMNS,
+                                 lambda connection, invoice: self.__invoiceRow(invoice), "Invoice {} already exists.")
+
+    def removeGuests(self, guests):
+        """Unregisters guests (e.g. merged duplicates); their rows stay for their bookings. Returns how many were removed."""
+        removed = []
+        connection = self.__connection()
+        with connection:
+            for guest in guests:
+                guestID = guest.getStoreKey(self.__store) if isinstance(guest, Guest) else None
+                if guestID is not None and connection.execute(
+                        "UPDATE guests SET registered = 0 WHERE guestID = ? AND registered = 1", (guestID,)).rowcount:
+                    removed.append(guest)
+                    with self.__guestIDsLock:
+                        self.__guestsByID.pop(guestID, None)  # Rows loaded later get an object that writes through
+
+        for guest in removed:
+            self.notifyListeners("removeGuest", guest)
+            guest.setHotel(None)
+        return len(removed)
+
+    def findAvailableRooms(self, checkIn, checkOut, roomType: str = None):
+        """Returns the rooms that are free for every night from checkIn up to checkOut."""
+        try:
+            start = _toOrdinal(checkIn)
+            end = _toOrdinal(checkOut)
+            if end <= start:
+                raise ValueError("Check-out date must be after check-in date.")
+
+            rows = self.__connection().execute(
+                f"SELECT {_ROOM_COLUMNS} FROM rooms AS r WHERE (?1 IS NULL OR r.roomType = ?1) AND NOT EXISTS ("
+                "SELECT 1 FROM bookings AS b WHERE b.roomNumber = r.roomNumber AND b.isActive = 1 "
+                "AND b.checkInDay < ?3 AND b.checkOutDay > ?2) ORDER BY r.roomNumber", (roomType, start, end))
+            return [self.__buildRoom(row) for row in rows]
+
+        except (TypeError, ValueError) as e:
+            _reportError("SQLiteHotel.findAvailableRooms", e)
+            return []
+
+    def iterRooms(self, roomType: str = None, available: bool = None, limit: int = None, after: int = None):
+        """Yields rooms by room number, resuming behind room number `after` when it is given."""
+        self.__checkCursor("rooms", "roomNumber", after, after, "room")
+        return self.__iterRows(f"SELECT {_ROOM_COLUMNS} FROM rooms WHERE (?1 IS NULL OR roomType = ?1) "
+                               "AND (?2 IS NULL OR isAvailable = ?2)", (roomType, available), "roomNumber",
+                               after, limit, self.__buildRoom)
+
+    def iterGuests(self, name: str = None, contactInfo: str = None, minLoyaltyPoints: int = None, limit: int = None,
+                   after=None):
+        """Yields registered guests in the order they were stored, resuming behind the Guest object `after`."""
+        key = None if after is None else after.getStoreKey(self.__store)
+        self.__checkCursor("guests", "guestID", key, after, "guest")
+        return self.__iterRows(f"SELECT {_GUEST_COLUMNS} FROM guests WHERE registered = 1 "
+                               "AND (?1 IS NULL OR name = ?1) AND (?2 IS NULL OR contactInfo = ?2) "
+                               "AND (?3 IS NULL OR loyaltyPoints >= ?3)", (name, contactInfo, minLoyaltyPoints),
+                               "guestID", key, limit, self.__buildGuest)
+
+    def iterBookings(self, active: bool = None, since=None, until=None, roomType: str = None, limit: int = None,
+                     after: int = None):
+        """Yields bookings by booking ID, resuming behind booking ID `after` when it is given.
+
+        since and until keep the bookings whose stay overlaps that window; either may be left open.
+        """
+        self.__checkCursor("bookings", "bookingID", after, after, "booking")
+        sinceDay = None if since is None else _toOrdinal(since)
+        untilDay = None if until is None else _toOrdinal(until)
+        return self.__iterRows(f"{_BOOKING_QUERY} WHERE (?1 IS NULL OR b.isActive = ?1) "
+                               "AND (?2 IS NULL OR b.checkOutDay > ?2) AND (?3 IS NULL OR b.checkInDay < ?3) "
+                               "AND (?4 IS NULL OR r.roomType = ?4)", (active, sinceDay, untilDay, roomType),
+                               "b.bookingID", after, limit, self.__buildBooking)
+
+    def __checkCursor(self, table: str, keyColumn: str, key, after, kind: str):
+        """Raises a ValueError for a pagination cursor the hotel does not know, like Hotel does."""
+        if after is not None and (key is None or not self.__existingKeys(self.__connection(), table, keyColumn, [key])):
+            raise ValueError(f"Unknown {kind} cursor: {after}")
+
+    def __iterRows(self, query: str, params: tuple, keyColumn: str, after, limit: int, build):
+        """Lazily yields up to limit built rows in key order, a page of batchSize rows per query.
+
+        Each page is fetched completely before it is yielded, so callers may write to the hotel while iterating.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self.__batchSize if remaining is None else min(remaining, self.__batchSize)
+            rows = self.__connection().execute(
+                f"{query} AND (?{len(params) + 1} IS NULL OR {keyColumn} > ?{len(params) + 1}) "
+                f"ORDER BY {keyColumn} LIMIT ?{len(params) + 2}", params + (after, size)).fetchall()
+            for row in rows:
+                yield build(row)
+            if len(rows) < size:
+                return
+            after = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def close(self):
+        """Closes every pooled connection."""
+        with self.__connectionsLock:
+            for connection in self.__connections.values():
+                connection.close()
+            self.__connections.clear()
+        self.__local = threading.local()
+
+    def __connection(self):
+        """Returns this thread's connection, opening and configuring it on first use.
+
+        Opening one also closes the connections of threads that have exited since, so short-lived threads do not
+        leave connections behind until close().
+        """
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.__path, timeout=30.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self.__local.connection = connection
+            with self.__connectionsLock:
+                for thread in [thread for thread in self.__connections if not thread.is_alive()]:
+                    self.__connections.pop(thread).close()
+                self.__connections[threading.current_thread()] = connection
+        return connection
+
+    def getConnectionCount(self):
+        """Returns the number of pooled connections still open."""
+        with self.__connectionsLock:
+            return len(self.__connections)
+
+    def __bulkInsert(self, items, itemType, typeError: str, keyOf, table: str, keyColumn: str, columns: str,
+                     rowOf, duplicateError: str, checkerOf=None):
+        """Validates items in one pass and inserts them batch by batch with executemany.
+
+        checkerOf(connection, batch) may return a function giving the reason to reject an item, or None to keep it.
+        """
+        connection = self.__connection()
+        placeholders = ", ".join("?" * len(columns.split(",")))
+        rejected = []
+        added = 0
+        iterator = enumerate(items)
+
+        while True:
+            batch = list(islice(iterator, self.__batchSize))
+            if not batch:
+                break
+
+            typed = [item for _, item in batch if isinstance(item, itemType)]
+            existing = self.__existingKeys(connection, table, keyColumn, [keyOf(item) for item in typed])
+            check = None if checkerOf is None else checkerOf(connection, typed)
+
+            with connection:
+                accepted, rows = [], []
+                for position, item in batch:
+                    if not isinstance(item, itemType):
+                        rejected.append((position, item, typeError))
+                        continue
+
+                    key = keyOf(item)
+                    if key in existing:
+                        rejected.append((position, item, duplicateError.format(key)))
+                        continue
+
+                    reason = None if check is None else check(item)
+                    if reason is not None:
+                        rejected.append((position, item, reason))
+                        continue
+
+                    existing.add(key)
+                    accepted.append(item)
+                    rows.append(rowOf(connection, item))
+
+                connection.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows)
+
+            for item in accepted:
+                item.setHotel(self)
+            added += len(accepted)
+
+        return BulkLoadReport(added, rejected)
+
+    @staticmethod
+    def __existingKeys(connection, table: str, keyColumn: str, keys: list):
+        """Returns the set of keys that have a row in a table."""
+        existing = set()
+        for start in range(0, len(keys), 500):  # Stay below SQLite's bound-parameter limit
+            chunk = keys[start:start + 500]
+            existing.update(key for key, in connection.execute(
+                f"SELECT {keyColumn} FROM {table} WHERE {keyColumn} IN ({', '.join('?' * len(chunk))})", chunk))
+        return existing
+
+    def __guestID(self, connection, guest: Guest, registered: bool = False):
+        """Returns the row ID of a guest, inserting the guest the first time this hotel sees them."""
+        with self.__guestIDsLock:
+            guestID = guest.getStoreKey(self.__store)
+            if guestID is not None:
+                if registered:
+                    connection.execute("UPDATE guests SET registered = 1 WHERE guestID = ?", (guestID,))
+                return guestID
+
+            guestID = connection.execute(
+                "INSERT INTO guests (name, contactInfo, loyaltyPoints, registered) VALUES (?, ?, ?, ?)",
+                (guest.getName(), guest.getContactInfo(), guest.getLoyaltyPoints(), registered)).lastrowid
+            guest.setStoreKey(self.__store, guestID)
+            if guest.getHotel() is None:
+                guest.setHotel(self)  # Its setters then write through
+            self.__cacheGuest(guestID, guest)
+            return guestID
+
+    def __cacheGuest(self, guestID: int, guest: Guest):
+        """Caches the guest of a row, evicting the least recently used guest beyond the cache size."""
+        self.__guestsByID[guestID] = guest
+        self.__guestsByID.move_to_end(guestID)
+        while len(self.__guestsByID) > self.__guestCacheSize:
+            self.__guestsByID.popitem(last=False)
+
+    @staticmethod
+    def __roomRow(room: Room):
+        return (room.getRoomNumber(), room.getRoomType(), room.getPricePerNight(),
+                ",".join(str(amenities.getFlags()) for amenities in room.getAmenities()), room.isAvailable())
+
+    def __bookingRow(self, connection, booking: Booking):
+        return (booking.getBookingID(), self.__guestID(connection, booking.getGuest()),
+                booking.getRoom().getRoomNumber(), booking.getCheckInDay(), booking.getCheckOutDay(),
+                booking.getTotalPrice(), booking.isActive())
+
+    @staticmethod
+    def __invoiceRow(invoice: Invoice):
+        return (invoice.getInvoiceID(), invoice.getBooking().getBookingID(), invoice.getAmountDue(),
+                invoice.getPaymentStatus())
+
+    def __buildRoom(self, row: tuple, link: bool = True):
+        roomNumber, roomType, pricePerNight, amenityFlags, isAvailable = row
+        amenities = [Amenities.fromFlags(int(flags)) for flags in amenityFlags.split(",") if flags]
+        room = Room(roomNumber, roomType, pricePerNight, amenities)
+        if not isAvailable:
+            room.bookRoom()
+        if link:
+            room.setHotel(self)
+        return room
+
+    def __buildGuest(self, row: tuple):
+        """Returns the Guest for a row, reusing the object already built for that guest ID."""
+        guestID, name, contactInfo, loyaltyPoints = row
+        with self.__guestIDsLock:
+            guest = self.__guestsByID.get(guestID)
+            if guest is not None:
+                self.__guestsByID.move_to_end(guestID)
+                return guest
+
+            guest = Guest(name, contactInfo)
+            guest.setLoyaltyPoints(loyaltyPoints)
+            guest.setStoreKey(self.__store, guestID)
+            self.__cacheGuest(guestID, guest)
+            guest.setHotel(self)
+        return guest
+
+    def __buildBooking(self, row: tuple):
+        """Returns the Booking for a row of _BOOKING_QUERY: booking, guest and room columns in turn."""
+        bookingID, checkInDay, checkOutDay, totalPrice, isActive = row[:5]
+        guestRow, roomRow = row[5:9], row[9:]
+        room = self.__buildRoom(roomRow, link=False)  # Linked only after the booking stops changing it
+        booking = Booking(bookingID, self.__buildGuest(guestRow), room, date.fromordinal(checkInDay),
+                          date.fromordinal(checkOutDay), totalPrice)
+        if not isActive:
+            booking.cancelBooking()
+        if roomRow[4]:
+            room.releaseRoom()
+        else:
+            room.bookRoom()
+        room.setHotel(self)
+        booking.setHotel(self)
+        return booking
+
+    def __buildInvoice(self, row: tuple):
+        """Returns the Invoice for a row of _INVOICE_QUERY: invoice columns, then those of its booking."""
+        invoiceID, amountDue, paymentStatus = row[:3]
+        invoice = Invoice(invoiceID, self.__buildBooking(row[3:]), amountDue)
+        invoice.setPaymentStatus(paymentStatus)
+        invoice.setHotel(self)
+        return invoice
+
+    def __str__(self):
+        """Returns a string representation of the hotel."""
+        return f"{self.getName()}, {self.getLocation()}, Rating: {self.getRating()}, Contact: {self.getContactInfo()} (SQLite: {self.__path})"
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice
+from async_hotel import AsyncHotel
+from booking_engine import BookingConflictError
+
+
+class TestAsyncHotel(unittest.TestCase):
+    def setUp(self):
+        self.hotel = hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        hotel.addRooms([Room(101, "Deluxe", 150.0, [amenities]), Room(102, "Standard", 90.0, [amenities])])
+        self.asyncHotel = AsyncHotel(hotel)
+        self.guest = Guest("John Doe", "johndoe@example.com")
+
+    def testReserveSearchCancelAndInvoice(self):
+        async def scenario():
+            booking = await self.asyncHotel.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+            rooms = await self.asyncHotel.search("2025-04-02", "2025-04-03")
+            invoice = await self.asyncHotel.invoice(booking.getBookingID())
+            cancelled = await self.asyncHotel.cancel(booking.getBookingID())
+            return rooms, invoice, cancelled
+
+        rooms, invoice, cancelled = asyncio.run(scenario())
+        self.assertEqual([room.getRoomNumber() for room in rooms], [102])
+        self.assertEqual(invoice.getAmountDue(), 600.0)
+        self.assertTrue(cancelled)
+
+    def testInvoicesAreAddedToTheHotel(self):
+        room = self.hotel.getRoom(102)
+        earlier = Booking(100, self.guest, room, "2025-03-01", "2025-03-02", 90.0)
+        self.hotel.addBooking(earlier)
+        self.hotel.addInvoice(Invoice(1, earlier, 90.0))
+
+        async def scenario():
+            booking = await self.asyncHotel.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+            invoice = await self.asyncHotel.invoice(booking.getBookingID())
+            again = await self.asyncHotel.invoice(booking.getBookingID())
+            cancelled = await self.asyncHotel.reserve(self.guest, 101, "2025-05-01", "2025-05-02")
+            await self.asyncHotel.cancel(cancelled.getBookingID())
+            return booking, invoice, again, await self.asyncHotel.invoice(cancelled.getBookingID())
+
+        booking, invoice, again, cancelledInvoice = asyncio.run(scenario())
+        self.assertEqual(invoice.getInvoiceID(), 2)
+        self.assertIs(self.hotel.getBookingInvoice(booking.getBookingID()), invoice)
+        self.assertEqual(self.hotel.getInvoiceTotal("Pending"), 690.0)
+        self.assertIsNone(again)
+        self.assertIsNone(cancelledInvoice)
+
+    def testConcurrentClientsGetOneBookingPerRoom(self):
+        async def client():
+            try:
+                return await self.asyncHotel.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+            except BookingConflictError:
+                return None
+
+        async def scenario():
+            return await asyncio.gather(*(client() for _ in range(50)))
+
+        threads = set()
+        self.hotel.addListener(lambda event, subject, *details: threads.add(threading.current_thread()))
+        results = asyncio.run(scenario())
+        self.assertEqual(sum(result is not None for result in results), 1)
+        self.assertNotIn(threading.main_thread(), threads)  # The booking was made off the event loop
+
+
+if __name__ == '__main__':
+    unittest.main()
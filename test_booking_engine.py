@@ -0,0 +1,57 @@
+import threading
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest
+from booking_engine import BookingEngine, BookingConflictError
+
+
+class TestBookingEngine(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.hotel.addRoom(Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)]))
+        self.guest = Guest("John Doe", "johndoe@example.com")
+        self.engine = BookingEngine(self.hotel)
+
+    def testReserveComputesPriceAndRecordsBooking(self):
+        booking = self.engine.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+        self.assertEqual(booking.getTotalPrice(), 600.0)
+        self.assertIs(self.hotel.getBooking(booking.getBookingID()), booking)
+        self.assertEqual(self.guest.getReservations(), [booking])
+
+    def testOverlappingReservationConflicts(self):
+        self.engine.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+        with self.assertRaises(BookingConflictError):
+            self.engine.reserve(self.guest, 101, "2025-04-04", "2025-04-06")
+        self.engine.reserve(self.guest, 101, "2025-04-05", "2025-04-06")
+
+    def testCancelFreesNights(self):
+        booking = self.engine.reserve(self.guest, 101, "2025-04-01", "2025-04-05")
+        self.assertTrue(self.engine.cancel(booking.getBookingID()))
+        self.engine.reserve(self.guest, 101, "2025-04-02", "2025-04-03")
+
+    def testWholeNumberPrice(self):
+        booking = self.engine.reserve(self.guest, 101, "2025-04-01", "2025-04-03", 100)
+        self.assertEqual(booking.getTotalPrice(), 100.0)
+        with self.assertRaises(TypeError):
+            self.engine.reserve(self.guest, 101, "2025-04-05", "2025-04-06", "100")
+        self.assertEqual(self.engine.reserve(self.guest, 101, "2025-04-05", "2025-04-06").getBookingID(),
+                         booking.getBookingID() + 1)  # The rejected call drew no ID
+
+    def testConcurrentReservationsDoNotDoubleBook(self):
+        results = []
+
+        def attempt():
+            try:
+                results.append(self.engine.reserve(self.guest, 101, "2025-04-01", "2025-04-05"))
+            except BookingConflictError:
+                pass
+
+        threads = [threading.Thread(target=attempt) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
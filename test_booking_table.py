@@ -0,0 +1,49 @@
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from booking_table import BookingTable, np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBookingTable(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        self.deluxe = Room(101, "Deluxe", 150.0, [amenities])
+        self.standard = Room(102, "Standard", 90.0, [amenities])
+        self.guest = Guest("John Doe", "johndoe@example.com")
+        self.hotel.addRooms([self.deluxe, self.standard])
+        self.hotel.addGuest(self.guest)
+        self.hotel.addBookings([
+            Booking(1, self.guest, self.deluxe, "2025-04-01", "2025-04-05", 600.0),
+            Booking(2, self.guest, self.standard, "2025-04-03", "2025-04-04", 90.0),
+            Booking(3, self.guest, self.standard, "2025-04-10", "2025-04-12", 180.0),
+        ])
+        self.hotel.getBooking(3).cancelBooking()
+        self.table = BookingTable.fromHotel(self.hotel)
+
+    def testColumnsMirrorBookings(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.getBookingIDs().tolist(), [1, 2, 3])
+        self.assertEqual(self.table.getGuestIndexes().tolist(), [0, 0, 0])
+        self.assertEqual(self.table.getNights().tolist(), [4, 1, 2])
+        self.assertEqual(self.table.getActiveFlags().tolist(), [True, True, False])
+
+    def testRevenueByRoomType(self):
+        self.assertEqual(self.table.revenueByRoomType(), {"Deluxe": 600.0, "Standard": 90.0})
+        self.assertEqual(self.table.totalRevenue(activeOnly=False), 870.0)
+
+    def testOccupancyPerNight(self):
+        nights, occupied = self.table.occupancyPerNight("2025-04-02", "2025-04-06")
+        self.assertEqual(str(nights[0]), "2025-04-02")
+        self.assertEqual(occupied.tolist(), [1, 2, 1, 0])
+
+    def testAverageDailyRate(self):
+        self.assertAlmostEqual(self.table.averageDailyRate("2025-04-03", "2025-04-05"), (150.0 * 2 + 90.0) / 3)
+
+    def testFilter(self):
+        deluxeOnly = self.table.filter(self.table.roomTypeMask("Deluxe"))
+        self.assertEqual(deluxeOnly.getRoomNumbers().tolist(), [101])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import threading
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, GuestServiceRequest, errorLog
+from change_feed import (ChangeFeed, ChangeEvent, RoomBooked, RoomReleased, BookingAdded, BookingCancelled,
+                         InvoicePaid, ServiceRequestStatusChanged)
+
+
+class TestChangeFeed(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.room = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        self.hotel.addRoom(self.room)
+        self.guest = Guest("John Doe", "john@example.com")
+        self.hotel.addGuest(self.guest)
+        self.batches = []
+
+    def testTypedEventsInBatches(self):
+        feed = ChangeFeed(self.hotel, capacity=8, batchSize=2)
+        feed.subscribe(self.batches.append)
+        booking = Booking(1, self.guest, self.room, "2025-04-01", "2025-04-03", 300.0)
+        self.hotel.addBooking(booking)  # Books the room first
+        self.room.bookRoom()  # Already booked: nothing changed
+        invoice = Invoice(1, booking, 300.0)
+        self.hotel.addInvoice(invoice)
+        invoice.markAsPaid()
+        self.assertEqual([len(batch) for batch in self.batches], [2])  # The third event waits for a full batch
+
+        request = GuestServiceRequest("Housekeeping")
+        self.guest.submitServiceRequest(request)
+        request.markAsCompleted()
+        booking.cancelBooking()  # Releases the room first
+        feed.flush()
+
+        events = [event for batch in self.batches for event in batch]
+        self.assertEqual([type(event) for event in events],
+                         [RoomBooked, BookingAdded, InvoicePaid, ServiceRequestStatusChanged, RoomReleased,
+                          BookingCancelled])
+        self.assertEqual([event.getSequence() for event in events], list(range(1, 7)))
+        self.assertEqual((events[2].getPreviousStatus(), events[3].getPreviousStatus(), events[3].getStatus()),
+                         ("Pending", "Pending", "Completed"))
+        self.assertEqual(feed.getStats(), {"published": 6, "delivered": 6, "dropped": 0, "pending": 0})
+
+        feed.close()
+        self.room.bookRoom()
+        self.assertEqual(feed.getStats()["published"], 6)
+
+    def testFilteredSubscribersAndErrors(self):
+        feed = ChangeFeed(self.hotel, batchSize=1)
+        rooms = []
+        feed.subscribe(rooms.append, (RoomBooked, RoomReleased))
+        feed.subscribe(lambda events: 1 / 0)
+        errors = errorLog.getCount("ChangeFeed.deliver")
+        self.room.bookRoom()
+        self.hotel.addBooking(Booking(1, self.guest, self.room, "2025-04-01", "2025-04-03", 300.0))
+        self.assertEqual([[type(event) for event in batch] for batch in rooms], [[RoomBooked]])
+        self.assertEqual(errorLog.getCount("ChangeFeed.deliver") - errors, 2)
+
+        feed.unsubscribe(rooms.append)
+        self.room.releaseRoom()
+        self.assertEqual(len(rooms), 1)
+        with self.assertRaises(TypeError):
+            feed.subscribe(rooms.append, Room)
+
+    def testOverflowPolicies(self):
+        for overflow, sequences, accepted in (("dropOldest", [1, 4, 5, 6], [True] * 5),
+                                              ("dropNewest", [1, 2, 3, 4], [True] * 3 + [False] * 2),
+                                              ("block", [1, 4, 5, 6], [True] * 5)):
+            feed = ChangeFeed(self.hotel, capacity=3, batchSize=1, overflow=overflow)
+            received, results = [], []
+
+            def burst(events):
+                received.extend(events)
+                if len(received) == 1:  # Publishing while delivering: nobody else can make room
+                    results.extend(feed.publish(ChangeEvent(self.room)) for _ in range(5))
+
+            feed.subscribe(burst)
+            self.room.bookRoom()
+            self.assertEqual([event.getSequence() for event in received], sequences)
+            self.assertEqual(results, accepted)
+            self.assertEqual(feed.getDroppedCount(), 2)
+            feed.close()
+            self.room.releaseRoom()
+
+    def testBackgroundDeliveryBlocksProducers(self):
+        release = threading.Event()
+        received = []
+
+        def slowSubscriber(events):
+            release.wait()
+            received.extend(events)
+
+        feed = ChangeFeed(self.hotel, capacity=4, batchSize=2, background=True, maxDelay=0.01)
+        feed.subscribe(slowSubscriber)
+        producer = threading.Thread(target=lambda: [feed.publish(ChangeEvent(self.room)) for _ in range(12)])
+        producer.start()
+        producer.join(0.3)
+        self.assertTrue(producer.is_alive())  # Waiting for the stuck subscriber to make room
+        self.assertEqual(feed.getPendingCount(), 4)
+
+        release.set()
+        producer.join()
+        feed.close()
+        self.assertEqual([event.getSequence() for event in received], list(range(1, 13)))
+        self.assertEqual(feed.getStats()["dropped"], 0)
+        self.assertEqual(feed.getPendingCount(), 0)
+
+    def testBlockedProducerGivesUpOnLockedSubscriber(self):
+        self.assertIsNotNone(ChangeFeed(Hotel("Annex", "1 Side St", 4.0, "annex@example.com")).getBlockTimeout())
+        engineLock = threading.Lock()  # Stands in for a lock held around hotel changes
+        received = []
+
+        def lockingSubscriber(events):
+            with engineLock:
+                received.extend(events)
+
+        feed = ChangeFeed(self.hotel, capacity=2, batchSize=1, background=True, blockTimeout=0.05)
+        feed.subscribe(lockingSubscriber)
+        with engineLock:
+            results = [feed.publish(ChangeEvent(self.room)) for _ in range(6)]  # Fills the ring, then times out
+        feed.close()
+        self.assertEqual(results, [True] * 6)
+        self.assertGreater(feed.getDroppedCount(), 0)
+        self.assertEqual(len(received) + feed.getDroppedCount(), 6)
+        sequences = [event.getSequence() for event in received]
+        self.assertEqual(sequences, sorted(sequences))
+
+
+if __name__ == '__main__':
+    unittest.main()
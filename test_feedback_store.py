@@ -0,0 +1,83 @@
+import shutil
+import tempfile
+import unittest
+from statistics import mean, pvariance
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Feedback
+from feedback_store import FeedbackStore, tokenize
+from hotel_journal import HotelJournal
+
+
+class TestFeedbackStore(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.deluxe = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        self.single = Room(102, "Single", 80.0, [Amenities(True, False, False, False)])
+        self.hotel.addRooms([self.deluxe, self.single])
+        self.guest = Guest("John Doe", "john@example.com")
+        self.other = Guest("Jane Roe", "jane@example.com")
+        self.hotel.addGuests([self.guest, self.other])
+        self.deluxeStay = Booking(1, self.guest, self.deluxe, "2025-04-01", "2025-04-03", 300.0)
+        self.singleStay = Booking(2, self.other, self.single, "2025-04-01", "2025-04-02", 80.0)
+        self.hotel.addBookings([self.deluxeStay, self.singleStay])
+        self.guest.submitFeedback(Feedback(4.0, "Great view, but the Wi-Fi was slow.", self.deluxeStay))
+        self.store = FeedbackStore(self.hotel)
+
+    def testStreamingAggregates(self):
+        self.other.submitFeedback(Feedback(2.0, "Slow check-in and noisy room.", self.singleStay))
+        self.other.submitFeedback(Feedback(5.0, "Lovely staff."))
+        stats = self.store.getStats()
+        self.assertEqual(stats["count"], 3)
+        self.assertAlmostEqual(stats["mean"], mean([4.0, 2.0, 5.0]))
+        self.assertAlmostEqual(stats["variance"], pvariance([4.0, 2.0, 5.0]))
+        self.assertEqual(stats["histogram"], [0, 1, 0, 1, 1])
+        self.assertEqual(self.store.getStats("Single")["count"], 1)
+        self.assertEqual(self.hotel.getRating(), 3.67)
+
+        self.guest.getFeedbacks()[0].setRating(1.0)
+        self.assertAlmostEqual(self.store.getStats()["variance"], pvariance([1.0, 2.0, 5.0]))
+        self.assertEqual(self.store.getStats("Deluxe")["histogram"], [1, 0, 0, 0, 0])
+        self.hotel.removeGuests([self.other])
+        self.assertEqual((self.store.getStats()["count"], self.hotel.getRating()), (1, 1.0))
+        self.assertIsNone(self.store.getStats("Single")["mean"])
+
+    def testKeywordSearch(self):
+        noisy = Feedback(2.0, "Slow check-in and noisy room.", self.singleStay)
+        self.other.submitFeedback(noisy)
+        self.assertEqual(tokenize("WiFi, wi-fi!"), {"wifi"})
+        self.assertEqual(len(self.store.search("slow")), 2)
+        self.assertEqual(self.store.search("wifi", "slow"), [self.guest.getFeedbacks()[0]])
+        self.assertEqual(self.store.search("slow", roomType="Single"), [noisy])
+        self.assertEqual(self.store.search("slow", maxRating=3.0), [noisy])
+        noisy.setComment("Quiet room.")
+        self.assertEqual(self.store.search("noisy"), [])
+        self.assertEqual(self.store.search("quiet"), [noisy])
+
+    def testRoomTypeChangesMoveRatings(self):
+        self.other.submitFeedback(Feedback(2.0, "Cramped.", self.singleStay))
+        self.single.setRoomType("Deluxe")
+        self.assertEqual(self.store.getStats("Deluxe")["count"], 2)
+        self.assertAlmostEqual(self.store.getStats("Deluxe")["mean"], 3.0)
+        self.assertEqual(self.store.getRoomTypes(), ["Deluxe"])
+        self.assertEqual(self.store.search("cramped", roomType="Deluxe"), self.other.getFeedbacks())
+        self.single.setRoomType("Single")
+        self.hotel.removeGuests([self.other])
+        self.assertEqual(self.store.getStats("Deluxe")["count"], 1)
+        self.assertEqual(self.store.getStats("Single")["count"], 0)
+
+    def testJournalKeepsStays(self):
+        directory = tempfile.mkdtemp()
+        try:
+            journal = HotelJournal(directory)
+            journal.attach(self.hotel)
+            self.other.submitFeedback(Feedback(3.0, "Fine.", self.singleStay))
+            journal.close()
+
+            recovered = HotelJournal(directory).recover()
+            store = FeedbackStore(recovered, updateRating=False)
+            self.assertEqual((store.getStats("Deluxe")["count"], store.getStats("Single")["count"]), (1, 1))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
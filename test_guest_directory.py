@@ -0,0 +1,101 @@
+import shutil
+import tempfile
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, LoyaltyProgram, GuestServiceRequest, Feedback
+from guest_directory import GuestDirectory, normalizeContact, normalizeName
+from hotel_journal import HotelJournal
+
+
+class TestGuestDirectory(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.room = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        self.hotel.addRoom(self.room)
+        self.guest = Guest("John Doe", "John.Doe@Gmail.com")
+        self.duplicate = Guest("john  doe", " johndoe+spa@gmail.com")
+        self.hotel.addGuests([self.guest, Guest("Jane Roe", "+1 (555) 010-2030"), self.duplicate])
+        self.directory = GuestDirectory(self.hotel, fuzzy=True)
+
+    def testNormalization(self):
+        self.assertEqual(normalizeContact(" J.Doe+hotel@GoogleMail.com"), "jdoe@gmail.com")
+        self.assertEqual(normalizeContact("+1 (555) 010-2030"), "15550102030")
+        self.assertEqual(normalizeName("  José   ÁLVAREZ "), "jose alvarez")
+
+    def testGuestsWithoutContactAreNotMerged(self):
+        first, second = Guest("Walk In", ""), Guest("Other Walk In", "   ")
+        self.hotel.addGuests([first, second])
+        self.assertIsNone(normalizeContact("  "))
+        self.assertIsNone(self.directory.resolve(""))
+        self.assertIsNot(self.directory.checkIn("Third Walk In", ""), first)
+        self.assertEqual(self.directory.mergeDuplicates(), 1)  # Only the gmail duplicate
+        self.assertIn(first, self.hotel.getGuests())
+        self.assertIn(second, self.hotel.getGuests())
+
+    def testResolveAndCheckIn(self):
+        self.assertIs(self.directory.resolve("johndoe@gmail.com"), self.guest)
+        self.assertEqual(self.directory.checkIn("Jane", "15550102030").getName(), "Jane Roe")
+        walkIn = self.directory.checkIn("Walk In", "walkin@example.com")
+        self.assertIs(self.directory.resolve("WALKIN@example.com"), walkIn)
+        walkIn.setContactInfo("walk.in@example.com")
+        self.assertIsNone(self.directory.resolve("walkin@example.com"))
+        self.assertIs(self.directory.resolve("walk.in@example.com"), walkIn)
+
+    def testNextGuestBecomesPrimary(self):
+        third = Guest("J. Doe", "JOHNDOE@gmail.com")
+        self.hotel.addGuest(third)
+        self.guest.setContactInfo("john@example.com")
+        self.assertIs(self.directory.resolve("johndoe@gmail.com"), self.duplicate)
+        self.guest.setContactInfo("johndoe@gmail.com")
+        self.assertIs(self.directory.resolve("johndoe@gmail.com"), self.guest)  # Registered first, so primary again
+
+        self.hotel.removeGuests([self.guest])
+        self.assertIs(self.directory.resolve("johndoe@gmail.com"), self.duplicate)
+        self.assertEqual(self.directory.mergeDuplicates(), 1)
+        self.assertIn(self.duplicate, self.hotel.getGuests())
+        self.assertNotIn(third, self.hotel.getGuests())
+
+    def testFindSimilar(self):
+        matches = self.directory.findSimilar("Jon Doe")
+        self.assertEqual({guest.getName() for _, guest in matches}, {"John Doe", "john  doe"})
+        self.assertEqual(self.directory.findSimilar("Zebulon Quux"), [])
+
+    def testMergeDuplicates(self):
+        booking = Booking(1, self.duplicate, self.room, "2025-04-01", "2025-04-03", 300.0)
+        self.hotel.addBooking(booking)
+        self.duplicate.addReservation(booking)
+        self.duplicate.submitServiceRequest(GuestServiceRequest("Spa"))
+        self.duplicate.submitFeedback(Feedback(4.0, "Relaxing."))
+        self.duplicate.setLoyaltyPoints(40)
+        self.guest.setLoyaltyPoints(60)
+        program = LoyaltyProgram(self.duplicate)
+        self.hotel.addLoyaltyProgram(program)
+        program.addPoints(500)
+
+        directory = tempfile.mkdtemp()
+        journal = HotelJournal(directory)
+        journal.attach(self.hotel)
+        try:
+            self.assertEqual(self.directory.mergeDuplicates(), 1)
+            self.assertIs(booking.getGuest(), self.guest)
+            self.assertEqual(self.guest.getReservations(), [booking])
+            self.assertEqual(self.guest.getServiceRequests()[0].getGuest(), self.guest)
+            self.assertEqual((self.guest.getLoyaltyPoints(), len(self.guest.getFeedbacks())), (100, 1))
+            self.assertEqual(self.hotel.getLoyaltyProgram(self.guest).getPoints(), 500)
+            self.assertNotIn(self.duplicate, self.hotel.getGuests())
+            self.assertEqual(self.directory.mergeDuplicates(), 0)
+
+            journal.close()
+            journal = HotelJournal(directory)
+            recovered = journal.recover()
+            self.assertEqual(len(recovered.getGuests()), 2)
+            guest = recovered.getBooking(1).getGuest()
+            self.assertEqual((guest.getName(), guest.getLoyaltyPoints()), ("John Doe", 100))
+            self.assertEqual(len(guest.getServiceRequests()), 1)
+            self.assertEqual(recovered.getLoyaltyProgram(guest).getPoints(), 500)
+        finally:
+            journal.close()
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
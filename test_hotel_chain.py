@@ -0,0 +1,67 @@
+import pickle
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from hotel_chain import HotelChain
+
+
+class TestHotelChain(unittest.TestCase):
+    def setUp(self):
+        amenities = Amenities(True, True, False, True)
+        self.hotels = []
+        for index, (rating, price) in enumerate([(4.0, 120.0), (5.0, 120.0), (3.0, 80.0)]):
+            hotel = Hotel(f"Hotel {index}", "Main St", rating, f"hotel{index}@example.com")
+            hotel.addRooms([Room(101, "Deluxe", price, [amenities]), Room(102, "Standard", price - 30.0, [amenities])])
+            self.hotels.append(hotel)
+        guest = Guest("John Doe", "johndoe@example.com")
+        self.hotels[2].addBooking(Booking(1, guest, self.hotels[2].getRoom(102), "2025-04-01", "2025-04-03", 100.0))
+
+    def testHotelPicklesWithoutListeners(self):
+        self.hotels[0].addListener(lambda *change: None)
+        copy = pickle.loads(pickle.dumps(self.hotels[2]))
+        self.assertEqual(copy.getActiveBookingCount(), 1)
+        self.assertEqual([room.getRoomNumber() for room in copy.findAvailableRooms("2025-04-01", "2025-04-02")], [101])
+        pickle.dumps(self.hotels[0])
+
+    def testSearchMergesShardsByPriceThenRating(self):
+        with HotelChain(self.hotels, workers=2) as chain:
+            self.assertEqual(chain.getWorkerCount(), 2)
+            offers = chain.search("2025-04-01", "2025-04-02")
+            self.assertEqual([(offer.getHotelName(), offer.getRoomNumber()) for offer in offers],
+                             [("Hotel 2", 101), ("Hotel 1", 102), ("Hotel 0", 102), ("Hotel 1", 101), ("Hotel 0", 101)])
+            self.assertEqual(offers[0].getTotalPrice(), 80.0)
+
+            cheapest = chain.search("2025-04-05", "2025-04-07", "Deluxe", limit=2)
+            self.assertEqual([(offer.getHotelName(), offer.getTotalPrice()) for offer in cheapest],
+                             [("Hotel 2", 160.0), ("Hotel 1", 240.0)])
+            with self.assertRaises(ValueError):
+                chain.search("2025-04-02", "2025-04-01")
+
+    def testSearchFollowsChangedHotels(self):
+        with HotelChain(self.hotels, workers=2) as chain:
+            chain.warmUp()
+            guest = Guest("Jane Roe", "jane@example.com")
+            self.hotels[2].addBooking(Booking(2, guest, self.hotels[2].getRoom(101), "2025-04-01", "2025-04-03", 160.0))
+            self.hotels[1].getRoom(102).setPricePerNight(70.0)
+            offers = chain.search("2025-04-01", "2025-04-02")
+            self.assertEqual([(offer.getHotelName(), offer.getRoomNumber()) for offer in offers],
+                             [("Hotel 1", 102), ("Hotel 0", 102), ("Hotel 1", 101), ("Hotel 0", 101)])
+            self.assertEqual(offers[0].getTotalPrice(), 70.0)
+
+            self.hotels[2].getBooking(1).cancelBooking()
+            self.hotels[2].getBooking(2).setCheckOutDate("2025-04-10")
+            self.hotels[2].getBooking(2).setCheckInDate("2025-04-08")
+            self.hotels[0].addRoom(Room(103, "Standard", 60.0, [Amenities(True, False, False, False)]))
+            self.hotels[0].setName("Hotel Zero")
+            self.hotels[1].setRating(2.0)
+            offers = chain.search("2025-04-08", "2025-04-09", "Standard")
+            self.assertEqual([(offer.getHotelName(), offer.getRoomNumber(), offer.getRating()) for offer in offers],
+                             [("Hotel 2", 102, 3.0), ("Hotel Zero", 103, 4.0), ("Hotel 1", 102, 2.0),
+                              ("Hotel Zero", 102, 4.0)])
+            self.assertEqual(chain.getRoomCount(), 7)
+            self.assertNotIn(("Hotel 2", 101), [(offer.getHotelName(), offer.getRoomNumber())
+                                                for offer in chain.search("2025-04-08", "2025-04-09")])
+            self.assertIn("Hotel Zero", chain.getHotelNames())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import time
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, LoyaltyProgram, GuestServiceRequest, Feedback
+from hotel_journal import HotelJournal
+from loyalty_ledger import LoyaltyLedger
+
+
+class TestHotelJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.room = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        self.hotel.addRoom(self.room)
+        self.journal = HotelJournal(self.directory)
+        self.journal.attach(self.hotel)
+
+    def tearDown(self):
+        self.journal.close()
+
+    def recover(self):
+        self.journal.close()
+        self.journal = HotelJournal(self.directory)
+        return self.journal.recover()
+
+    def makeChanges(self):
+        guest = Guest("John Doe", "johndoe@example.com")
+        self.hotel.addGuest(guest)
+        self.hotel.addRoom(Room(102, "Standard", 90.0, [Amenities(False, True, False, False)]))
+        booking = Booking(1, guest, self.room, "2025-04-01", "2025-04-05", 600.0)
+        self.hotel.addBooking(booking)
+        guest.addReservation(booking)
+        walkIn = Booking(2, Guest("Walk In", "walkin@example.com"), self.hotel.getRoom(102), "2025-04-02", "2025-04-03", 90.0)
+        self.hotel.addBooking(walkIn)
+        walkIn.cancelBooking()
+        invoice = Invoice(1, booking, 600.0)
+        self.hotel.addInvoice(invoice)
+        invoice.markAsPaid()
+        program = LoyaltyProgram(guest)
+        self.hotel.addLoyaltyProgram(program)
+        program.addPoints(150)
+        program.redeemPoints(50)
+        request = GuestServiceRequest("Extra towels")
+        guest.submitServiceRequest(request)
+        request.markAsCompleted()
+        guest.submitFeedback(Feedback(4.5, "Great service"))
+        self.room.setPricePerNight(175.0)
+        booking.setCheckOutDate("2025-04-06")
+
+    def assertRecovered(self, hotel):
+        self.assertEqual(hotel.getName(), "Grand Hotel")
+        self.assertEqual([room.getRoomNumber() for room in hotel.getRooms()], [101, 102])
+        self.assertEqual(hotel.getRoom(101).getPricePerNight(), 175.0)
+        self.assertFalse(hotel.getRoom(101).isAvailable())
+        self.assertTrue(hotel.getRoom(101).getAmenities()[0].getHasWiFi())
+        booking = hotel.getBooking(1)
+        self.assertEqual(booking.getCheckOutDate(), "2025-04-06")
+        self.assertFalse(hotel.getRoom(101).isAvailableBetween("2025-04-05", "2025-04-06"))
+        self.assertFalse(hotel.getBooking(2).isActive())
+        self.assertEqual(hotel.getBooking(2).getGuest().getName(), "Walk In")
+        guest = hotel.getGuest("johndoe@example.com")
+        self.assertEqual(guest.getReservations(), [booking])
+        self.assertEqual(guest.getServiceRequests()[0].getStatus(), "Completed")
+        self.assertEqual(guest.getFeedbacks()[0].getComment(), "Great service")
+        self.assertEqual(hotel.getInvoice(1).getPaymentStatus(), "Paid")
+        self.assertEqual(hotel.getLoyaltyProgram(guest).getPoints(), 100)
+
+    def testIdleJournalSyncsWithinInterval(self):
+        self.journal.close()
+        self.journal = HotelJournal(self.directory, syncEvery=1000, syncInterval=0.05)
+        self.journal.attach(self.hotel)
+        journalPath = os.path.join(self.directory, f"journal-{self.journal.getSequence():08d}.log")
+        self.room.setPricePerNight(175.0)  # Then the hotel goes idle
+        deadline = time.monotonic() + 5.0
+        while "Unsynced records: 0" not in str(self.journal) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn("Unsynced records: 0", str(self.journal))
+        self.assertGreater(os.path.getsize(journalPath), 0)
+
+    def testRecoverReplaysJournal(self):
+        self.makeChanges()
+        self.assertRecovered(self.recover())
+
+    def testRecoverFromCheckpoint(self):
+        self.makeChanges()
+        self.journal.checkpoint()
+        self.assertEqual(sorted(os.listdir(self.directory)), ["journal-00000002.log", "snapshot-00000002.bin"])
+        hotel = self.recover()
+        self.assertRecovered(hotel)
+        hotel.getRoom(102).setRoomType("Suite")
+        self.assertEqual(self.recover().getRoom(102).getRoomType(), "Suite")
+
+    def testLoyaltyLedgerIsJournaled(self):
+        self.makeChanges()
+        guest = self.hotel.getGuest("johndoe@example.com")
+        ledger = LoyaltyLedger(self.hotel, openingDay="2025-01-01")
+        self.hotel.getLoyaltyProgram(guest).addPoints(25)
+        ledger.earn(guest, 40, day="2025-02-01")
+        self.assertEqual(ledger.accrueCompletedStays("2025-04-30"), 1)
+        entries = [entry[1:] for entry in ledger.iterEntries(guest)]
+
+        for checkpoint in (False, True):
+            if checkpoint:
+                self.journal.checkpoint()
+            hotel = self.recover()
+            recovered = hotel.getLoyaltyLedger()
+            guest = hotel.getGuest("johndoe@example.com")
+            self.assertEqual([entry[1:] for entry in recovered.iterEntries(guest)], entries)
+            self.assertEqual((guest.getLoyaltyPoints(), hotel.getLoyaltyProgram(guest).getPoints()), (765, 765))
+            self.assertEqual(recovered.accrueCompletedStays("2025-04-30"), 0)  # Booking 1 already earned
+            self.hotel = hotel
+
+    def testTornRecordIsDropped(self):
+        self.makeChanges()
+        self.journal.close()
+        path = os.path.join(self.directory, "journal-00000001.log")
+        with open(path, "ab") as journalFile:
+            journalFile.write(b"\x40\x00\x00\x00garbage")
+        self.assertRecovered(self.recover())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, LoyaltyProgram, GuestServiceRequest, Feedback
+from datetime import date
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, LoyaltyProgram, GuestServiceRequest, Feedback, ErrorLog
 
 class TestHotelSystem(unittest.TestCase):
     def setUp(self):
@@ -25,6 +26,15 @@ class TestHotelSystem(unittest.TestCase):
         self.assertFalse(self.amenities.getHasMinibar())
         self.assertTrue(self.amenities.getHasAirConditioning())
 
+    def testAmenitiesFlags(self):
+        self.assertEqual(self.amenities.getFlags(), Amenities.WIFI | Amenities.TV | Amenities.AIR_CONDITIONING)
+        self.amenities.setHasMinibar(True)
+        self.amenities.setHasTV(False)
+        self.assertTrue(self.amenities.getHasMinibar())
+        self.assertFalse(self.amenities.getHasTV())
+        self.assertEqual(Amenities.fromFlags(Amenities.WIFI).getHasWiFi(), True)
+        self.assertFalse(hasattr(self.amenities, "__dict__"))
+
     def testRoomInitialization(self):
         self.assertEqual(self.room.getRoomNumber(), 101)
         self.assertEqual(self.room.getRoomType(), "Deluxe")
@@ -43,6 +53,18 @@ class TestHotelSystem(unittest.TestCase):
         self.assertEqual(self.booking.getCheckOutDate(), "2025-04-05")
         self.assertEqual(self.booking.getTotalPrice(), 600.0)
 
+    def testBookingDates(self):
+        self.assertEqual(self.booking.getNights(), 4)
+        self.assertEqual(self.booking.getCheckInDay(), date(2025, 4, 1).toordinal())
+        later = Booking(2, self.guest, self.room, date(2025, 4, 4), date(2025, 4, 6), 300.0)
+        self.assertEqual(later.getCheckInDate(), "2025-04-04")
+        self.assertTrue(self.booking.overlaps(later))
+        self.assertTrue(self.booking < later)
+        self.assertTrue(self.booking.includesNight("2025-04-04"))
+        self.assertFalse(self.booking.includesNight("2025-04-05"))
+        later.setCheckInDate("2025-04-05")
+        self.assertFalse(self.booking.overlaps(later))
+
     def testInvoiceInitialization(self):
         self.assertEqual(self.invoice.getInvoiceID(), 1)
         self.assertEqual(self.invoice.getBooking(), self.booking)
@@ -59,5 +81,161 @@ class TestHotelSystem(unittest.TestCase):
         self.assertEqual(self.feedback.getRating(), 5.0)
         self.assertEqual(self.feedback.getComment(), "Great stay!")
 
+    def testLookupTables(self):
+        self.hotel.addRoom(self.room)
+        self.hotel.addGuest(self.guest)
+        self.hotel.addBooking(self.booking)
+        self.assertIs(self.hotel.getRoom(101), self.room)
+        self.assertIs(self.hotel.getGuest("johndoe@example.com"), self.guest)
+        self.assertIs(self.hotel.getBooking(1), self.booking)
+        self.assertIsNone(self.hotel.getRoom(999))
+        with self.assertRaises(ValueError):
+            self.hotel.addRoom(Room(101, "Standard", 90.0, [self.amenities]))
+
+    def testLookupFollowsContactChanges(self):
+        twin = Guest("Jane Doe", "johndoe@example.com")
+        self.hotel.addGuests([self.guest, twin])
+        self.guest.setContactInfo("john@example.com")
+        self.assertIs(self.hotel.getGuest("john@example.com"), self.guest)
+        self.assertIs(self.hotel.getGuest("johndoe@example.com"), twin)  # The next guest with the old contact
+        self.guest.setContactInfo("johndoe@example.com")
+        self.assertIs(self.hotel.getGuest("johndoe@example.com"), self.guest)  # Added first, so it wins again
+        self.assertIsNone(self.hotel.getGuest("john@example.com"))
+
+    def testBulkLoading(self):
+        rooms = (Room(number, "Standard", 90.0, [self.amenities]) for number in [201, 202, 201])
+        report = self.hotel.addRooms(rooms)
+        self.assertEqual(report.getAddedCount(), 2)
+        self.assertEqual(report.getRejectedCount(), 1)
+        self.assertEqual(report.getRejected()[0][0], 2)
+
+        report = self.hotel.addBookings([self.booking, "not a booking", self.booking])
+        self.assertEqual(report.getAddedCount(), 1)
+        self.assertEqual([position for position, _, _ in report.getRejected()], [1, 2])
+        self.assertFalse(self.room.isAvailableBetween("2025-04-01", "2025-04-02"))
+
+        report = self.hotel.addGuests([self.guest])
+        self.assertEqual(report.getAddedCount(), 1)
+        self.assertIs(self.hotel.getGuest("johndoe@example.com"), self.guest)
+
+    def testFindAvailableRooms(self):
+        otherRoom = Room(102, "Standard", 90.0, [self.amenities])
+        self.hotel.addRoom(self.room)
+        self.hotel.addRoom(otherRoom)
+        self.hotel.addBooking(self.booking)
+        self.assertEqual(self.hotel.findAvailableRooms("2025-04-03", "2025-04-07"), [otherRoom])
+        self.assertEqual(self.hotel.findAvailableRooms("2025-04-05", "2025-04-07"), [self.room, otherRoom])
+        self.assertEqual(self.hotel.findAvailableRooms("2025-03-28", "2025-04-01", "Deluxe"), [self.room])
+
+    def testCancelBookingReleasesDates(self):
+        self.hotel.addRoom(self.room)
+        self.hotel.addBooking(self.booking)
+        self.assertFalse(self.room.isAvailableBetween("2025-04-04", "2025-04-06"))
+        self.booking.cancelBooking()
+        self.assertTrue(self.room.isAvailableBetween("2025-04-04", "2025-04-06"))
+
+    def testChangingDatesMovesReservation(self):
+        self.hotel.addRoom(self.room)
+        self.hotel.addBooking(self.booking)
+        self.booking.setCheckOutDate("2025-04-03")
+        self.assertTrue(self.room.isAvailableBetween("2025-04-03", "2025-04-05"))
+        self.assertFalse(self.room.isAvailableBetween("2025-04-02", "2025-04-03"))
+
+    def testChangingDatesRejectsInvalidStays(self):
+        self.hotel.addRoom(self.room)
+        self.hotel.addBooking(self.booking)
+        later = Booking(2, self.guest, self.room, "2025-04-06", "2025-04-08", 300.0)
+        self.hotel.addBooking(later)
+        with self.assertRaises(ValueError):
+            self.booking.setCheckOutDate("2025-04-07")  # Would overlap the later booking
+        with self.assertRaises(ValueError):
+            self.booking.setCheckOutDate("2025-03-28")  # Before the check-in
+        self.assertEqual(self.booking.getNights(), 4)
+        self.assertFalse(self.room.isAvailableBetween("2025-04-04", "2025-04-05"))
+        self.booking.setCheckOutDate("2025-04-06")  # Up to the later check-in is fine
+        self.assertTrue(self.room.isAvailableBetween("2025-04-08", "2025-04-09"))
+
+    def testPaginatedIterators(self):
+        rooms = [Room(number, "Standard" if number % 2 else "Deluxe", 90.0, [self.amenities]) for number in range(1, 6)]
+        self.hotel.addRooms(rooms)
+        bookings = [Booking(i, self.guest, rooms[i % 5], date(2025, 4, i), date(2025, 4, i + 2), 180.0)
+                    for i in range(1, 11)]
+        self.hotel.addBookings(bookings)
+        bookings[2].cancelBooking()
+
+        firstPage = list(self.hotel.iterBookings(limit=4))
+        self.assertEqual([booking.getBookingID() for booking in firstPage], [1, 2, 3, 4])
+        nextPage = self.hotel.iterBookings(limit=4, after=firstPage[-1].getBookingID())
+        self.assertEqual([booking.getBookingID() for booking in nextPage], [5, 6, 7, 8])
+
+        self.assertNotIn(bookings[2], list(self.hotel.iterBookings(active=True)))
+        window = self.hotel.iterBookings(since="2025-04-05", until="2025-04-07")
+        self.assertEqual([booking.getBookingID() for booking in window], [4, 5, 6])
+        deluxe = self.hotel.iterBookings(roomType="Deluxe", limit=2, after=2)
+        self.assertEqual([booking.getBookingID() for booking in deluxe], [3, 6])
+        self.assertEqual([room.getRoomNumber() for room in self.hotel.iterRooms(roomType="Deluxe", after=2)], [4])
+        with self.assertRaises(ValueError):
+            self.hotel.iterBookings(after=99)
+
+        otherGuest = Guest("Jane Roe", "janeroe@example.com")
+        self.hotel.addGuests([self.guest, otherGuest])
+        self.assertEqual(list(self.hotel.iterGuests(after=self.guest)), [otherGuest])
+        self.assertEqual(list(self.hotel.iterGuests(name="Jane Roe")), [otherGuest])
+
+    def testGuestIterators(self):
+        self.guest.addReservation(self.booking)
+        cancelled = Booking(2, self.guest, self.room, "2025-05-01", "2025-05-02", 150.0)
+        cancelled.cancelBooking()
+        self.guest.addReservation(cancelled)
+        self.assertEqual(list(self.guest.iterReservations(active=False)), [cancelled])
+        self.assertEqual(list(self.guest.iterReservations(limit=1)), [self.booking])
+
+        self.guest.submitServiceRequest(self.service_request)
+        self.guest.submitServiceRequest(GuestServiceRequest("Laundry"))
+        self.service_request.markAsCompleted()
+        self.assertEqual(list(self.guest.iterServiceRequests(status="Completed")), [self.service_request])
+
+        self.guest.submitFeedback(self.feedback)
+        self.guest.submitFeedback(Feedback(2.0, "Noisy."))
+        self.assertEqual(list(self.guest.iterFeedbacks(minRating=4.0)), [self.feedback])
+
+    def testRunningTotals(self):
+        standardRoom = Room(102, "Standard", 90.0, [self.amenities])
+        self.hotel.addRooms([self.room, standardRoom])
+        self.assertEqual(self.hotel.getAvailableRoomCount(), 1)  # Creating the booking already booked room 101
+        self.assertEqual(self.hotel.getAvailableRoomCount("Standard"), 1)
+
+        self.hotel.addBooking(self.booking)
+        self.assertEqual(self.hotel.getActiveBookingCount(), 1)
+        self.booking.setTotalPrice(650.0)
+        self.assertEqual(self.hotel.getBookedRevenue(), 650.0)
+        self.booking.cancelBooking()
+        self.assertEqual((self.hotel.getActiveBookingCount(), self.hotel.getBookedRevenue()), (0, 0.0))
+        self.assertEqual(self.hotel.getAvailableRoomCount("Deluxe"), 1)
+
+        standardRoom.setRoomType("Suite")
+        standardRoom.bookRoom()
+        standardRoom.bookRoom()
+        self.assertEqual(self.hotel.getAvailableRoomCount("Suite"), 0)
+        self.assertEqual(self.hotel.getAvailableRoomCount(), 1)
+
+        self.hotel.addInvoice(self.invoice)
+        self.invoice.setAmountDue(650.0)
+        self.assertEqual(self.hotel.getInvoiceTotal("Pending"), 650.0)
+        self.invoice.markAsPaid()
+        self.assertEqual((self.hotel.getInvoiceTotal("Pending"), self.hotel.getInvoiceTotal("Paid")), (0.0, 650.0))
+
+    def testErrorLogIsRateLimited(self):
+        now = [0.0]
+        log = ErrorLog(capacity=3, ratePerSecond=2.0, clock=lambda: now[0])
+        stored = [log.record("Hotel.addRoom", TypeError("Invalid room object.")) for _ in range(5)]
+        self.assertEqual(stored, [True, True, False, False, False])
+        now[0] = 1.0
+        self.assertTrue(log.record("Hotel.addRoom", TypeError("Invalid room object.")))
+        self.assertTrue(log.record("Hotel.addGuest", TypeError("Invalid guest object.")))
+        self.assertEqual((log.getCount("Hotel.addRoom"), log.getSuppressedCount()), (6, 3))
+        self.assertEqual(len(log.getRecords()), 3)  # Only the newest capacity records are kept
+        self.assertEqual(log.getRecords("Hotel.addGuest")[0]["message"], "Invalid guest object.")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import instrumentation
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice, LoyaltyProgram, errorLog
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.originalAddRoom = Hotel.addRoom
+        errorLog.clear()
+        instrumentation.enable()
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+
+    def tearDown(self):
+        instrumentation.disable()
+        errorLog.clear()
+
+    def testCountsLatencyAndErrors(self):
+        room = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        guest = Guest("John Doe", "john@example.com")
+        self.hotel.addRoom(room)
+        self.hotel.addGuest(guest)
+        booking = Booking(1, guest, room, "2025-04-01", "2025-04-03", 300.0)
+        self.hotel.addBooking(booking)
+        Invoice(1, booking, 300.0).markAsPaid()
+        program = LoyaltyProgram(guest)
+        program.addPoints(100)
+        program.redeemPoints(40)
+
+        with self.assertRaises(ValueError):
+            self.hotel.addRoom(room)  # Raised
+        self.hotel.addGuest("not a guest")  # Reported to the error log
+
+        metrics = instrumentation.snapshot()
+        self.assertEqual((metrics["Hotel.addRoom"]["calls"], metrics["Hotel.addRoom"]["errors"]), (2, 1))
+        self.assertEqual((metrics["Hotel.addGuest"]["calls"], metrics["Hotel.addGuest"]["errors"]), (2, 1))
+        self.assertEqual(metrics["Booking.__init__"]["calls"], 1)
+        self.assertEqual(metrics["LoyaltyProgram.redeemPoints"]["calls"], 1)
+        self.assertGreater(metrics["Hotel.addBooking"]["p50Micros"], 0.0)
+        self.assertLessEqual(metrics["Hotel.addBooking"]["p50Micros"], metrics["Hotel.addBooking"]["p99Micros"])
+        self.assertEqual(errorLog.getRecords("Hotel.addGuest")[0]["type"], "TypeError")
+
+        text = instrumentation.prometheusText()
+        self.assertIn('hotel_call_seconds_count{method="Hotel.addRoom"} 2', text)
+        self.assertIn('hotel_errors_total{method="Hotel.addGuest"} 1', text)
+        self.assertIn("# TYPE hotel_call_seconds summary", text)
+
+    def testDisableRestoresMethods(self):
+        self.assertTrue(instrumentation.isEnabled())
+        self.assertIsNot(Hotel.addRoom, self.originalAddRoom)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.isEnabled())
+        self.assertIs(Hotel.addRoom, self.originalAddRoom)
+
+        self.hotel.addRoom(Room(102, "Single", 80.0, []))
+        self.assertEqual(instrumentation.snapshot()["Hotel.addRoom"]["calls"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, Invoice
+from invoice_pipeline import InvoicePipeline
+
+
+class TestInvoicePipeline(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        rooms = [Room(101, "Deluxe", 150.0, [amenities]), Room(102, "Standard", 90.0, [amenities])]
+        self.hotel.addRooms(rooms)
+        guest = Guest("John Doe", "johndoe@example.com")
+        self.hotel.addBookings([
+            Booking(1, guest, rooms[0], "2025-04-01", "2025-04-05", 500.0),
+            Booking(2, guest, rooms[1], "2025-04-02", "2025-04-04", 180.0),
+            Booking(3, guest, rooms[1], "2025-04-04", "2025-04-06", 180.0),
+            Booking(4, guest, rooms[0], "2025-04-10", "2025-04-12", 300.0),
+        ])
+        self.hotel.getBooking(3).cancelBooking()
+        self.hotel.addInvoice(Invoice(7, self.hotel.getBooking(2), 180.0))
+        self.pipeline = InvoicePipeline(self.hotel, batchSize=2)
+
+    def testGenerateInvoicesForCheckedOutBookings(self):
+        report = self.pipeline.generateInvoices("2025-04-06")
+        self.assertEqual(report.getAddedCount(), 1)
+        invoice = self.hotel.getBookingInvoice(1)
+        self.assertEqual((invoice.getInvoiceID(), invoice.getAmountDue()), (8, 600.0))
+        self.assertEqual(self.pipeline.generateInvoices("2025-04-06").getAddedCount(), 0)
+        self.assertEqual(self.pipeline.generateInvoices("2025-04-30").getAddedCount(), 1)
+        self.assertEqual(self.hotel.getInvoiceTotal("Pending"), 1080.0)
+
+    def testReconcilePaymentFile(self):
+        self.pipeline.generateInvoices("2025-04-30")
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as paymentFile:
+            paymentFile.write("invoiceID,amount\n7,180.00\n8,600.00\n8,600.00\n9,250.00\n42,10.00\noops\n")
+        try:
+            report = self.pipeline.reconcile(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(report.getAddedCount(), 2)
+        self.assertEqual([line for line, _, _ in report.getRejected()], [4, 5, 6, 7])
+        self.assertEqual(self.hotel.getInvoice(9).getPaymentStatus(), "Pending")
+        self.assertEqual(self.hotel.getInvoiceTotal("Paid"), 780.0)
+
+    def testRejectionsAreCapped(self):
+        pipeline = InvoicePipeline(self.hotel, batchSize=2, maxRejected=2)
+        report = pipeline.setPaymentStatuses(range(100, 110), "Paid")
+        self.assertEqual((report.getRejectedCount(), len(report.getRejected())), (10, 2))
+        self.assertEqual([invoiceID for _, invoiceID, _ in report.getRejected()], [100, 101])
+
+    def testInvoiceIDsFollowTheHotel(self):
+        self.assertEqual(self.hotel.getLastInvoiceID(), 7)
+        self.hotel.addInvoices([Invoice(20, self.hotel.getBooking(4), 300.0)])
+        self.assertEqual(self.hotel.getLastInvoiceID(), 20)
+        self.pipeline.generateInvoices("2025-04-06")
+        self.assertEqual(self.hotel.getBookingInvoice(1).getInvoiceID(), 21)
+
+    def testSetPaymentStatuses(self):
+        report = self.pipeline.setPaymentStatuses([7, 99], "Cancelled")
+        self.assertEqual((report.getAddedCount(), report.getRejectedCount()), (1, 1))
+        self.assertEqual(self.hotel.getInvoice(7).getPaymentStatus(), "Cancelled")
+        with self.assertRaises(ValueError):
+            self.pipeline.setPaymentStatuses([7], "Lost")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import threading
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking, LoyaltyProgram, _toOrdinal
+from guest_directory import GuestDirectory
+from loyalty_ledger import LoyaltyLedger, EARN, REDEEM, EXPIRE, ADJUST, TRANSFER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestLoyaltyLedger(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.room = Room(101, "Deluxe", 150.0, [Amenities(True, True, False, True)])
+        self.hotel.addRoom(self.room)
+        self.guest = Guest("John Doe", "john@example.com")
+        self.other = Guest("Jane Roe", "jane@example.com")
+        self.hotel.addGuests([self.guest, self.other])
+        self.guest.setLoyaltyPoints(100)
+        self.program = LoyaltyProgram(self.guest)
+        self.hotel.addLoyaltyProgram(self.program)
+        self.program.addPoints(50)
+        self.ledger = LoyaltyLedger(self.hotel)
+
+    def testOpeningBalances(self):
+        self.assertIs(self.hotel.getLoyaltyLedger(), self.ledger)
+        self.assertEqual(self.ledger.getBalance(self.guest), 150)
+        self.assertEqual(self.ledger.getMemberCount(), 2)
+        self.assertEqual([entry[2:] for entry in self.ledger.iterEntries(self.guest)], [(ADJUST, 100), (ADJUST, 50)])
+
+    def testViewsStayInSync(self):
+        self.program.addPoints(25)
+        self.assertEqual((self.guest.getLoyaltyPoints(), self.program.getPoints()), (175, 175))
+        self.assertTrue(self.guest.redeemLoyaltyPoints(75))
+        self.assertEqual(self.program.getPoints(), 100)
+        self.assertFalse(self.program.redeemPoints(101))
+        self.guest.setLoyaltyPoints(10)
+        self.assertEqual(self.ledger.getBalance(self.guest), 10)
+
+    def testStringsShowLedgerBalance(self):
+        self.ledger.earn(self.guest, 150)
+        self.assertTrue(str(self.guest).endswith("Points: 300"))
+        self.assertTrue(str(self.program).endswith("Loyalty Points: 300"))
+
+        newcomer = Guest("New Comer", "new@example.com")
+        newcomer.setLoyaltyPoints(30)
+        self.hotel.addGuest(newcomer)
+        self.assertEqual(self.ledger.getBalance(newcomer), 30)
+        self.hotel.removeGuests([newcomer])
+        self.assertEqual(newcomer.getLoyaltyPoints(), 30)
+
+    def testAtomicRedeem(self):
+        self.ledger.earn(self.other, 1000)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.ledger.redeem(self.other, 300)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 3)
+        self.assertEqual(self.ledger.getBalance(self.other), 100)
+        with self.assertRaises(ValueError):
+            self.ledger.redeem(self.other, -1)
+
+    def testAccrueCompletedStays(self):
+        self.hotel.addBooking(Booking(1, self.other, self.room, "2025-04-01", "2025-04-03", 300.0))
+        self.hotel.addBooking(Booking(2, self.other, self.room, "2025-05-01", "2025-05-02", 150.0))
+        self.hotel.addBooking(Booking(3, self.other, self.room, "2025-04-05", "2025-04-06", 100.0))
+        self.hotel.getBooking(3).cancelBooking()
+        self.hotel.getBooking(2).setCheckOutDate("2025-05-20")
+        self.assertEqual(self.ledger.accrueCompletedStays("2025-04-10"), 1)
+        self.assertEqual(self.ledger.accrueCompletedStays("2025-04-10"), 0)
+        self.assertEqual(self.other.getLoyaltyPoints(), 300)
+        self.assertEqual(list(self.ledger.iterEntries(self.other))[-1][2], EARN)
+        self.assertEqual(self.ledger.accrueCompletedStays("2025-05-10"), 0)  # Booking 2 now checks out later
+        self.assertEqual(self.ledger.accrueCompletedStays("2025-05-20"), 1)
+        self.assertEqual(self.ledger.getAccruedBookings(), {1, 2})
+
+    def testTransferKeepsEarnDates(self):
+        self.ledger.earn(self.other, 100, day="2024-01-01")
+        self.ledger.earn(self.other, 40, day="2025-03-01")
+        self.ledger.redeem(self.other, 30, day="2025-03-02")  # Uses up the oldest credit first
+        self.assertEqual(self.ledger.transfer(self.other, self.guest), 110)
+        moved = [(day, points) for _, day, kind, points in self.ledger.iterEntries(self.guest) if kind == TRANSFER]
+        self.assertEqual(moved, [(_toOrdinal("2024-01-01"), 70), (_toOrdinal("2025-03-01"), 40)])
+        self.assertEqual((self.guest.getLoyaltyPoints(), self.other.getLoyaltyPoints()), (260, 0))
+
+    def testOpeningDay(self):
+        hotel = Hotel("Annex", "1 Side St", 4.0, "annex@example.com")
+        guest = Guest("Jane Roe", "jane@example.com")
+        guest.setLoyaltyPoints(80)
+        hotel.addGuest(guest)
+        ledger = LoyaltyLedger(hotel, openingDay="2024-06-01")
+        self.assertEqual([entry[1:] for entry in ledger.iterEntries(guest)], [(_toOrdinal("2024-06-01"), ADJUST, 80)])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def testExpirePoints(self):
+        self.ledger.earn(self.other, 100, day="2024-01-01")
+        self.ledger.earn(self.other, 40, day="2025-03-01")
+        self.ledger.redeem(self.other, 30, day="2025-03-02")
+        self.assertEqual(self.ledger.expirePoints("2025-06-01"), 1)  # Opening balances are dated today, so they stay
+
+        self.assertEqual(self.other.getLoyaltyPoints(), 40)  # 70 of the old 100 were unused
+        self.assertEqual([entry[2:] for entry in self.ledger.iterEntries(self.other)][-2:],
+                         [(REDEEM, -30), (EXPIRE, -70)])
+        self.assertEqual(self.ledger.expirePoints("2025-06-01"), 0)
+
+    def testMergeDoesNotDoubleCount(self):
+        duplicate = Guest("John Doe", "JOHN@example.com")
+        self.hotel.addGuest(duplicate)
+        duplicateProgram = LoyaltyProgram(duplicate)
+        self.hotel.addLoyaltyProgram(duplicateProgram)
+        duplicateProgram.addPoints(20)
+
+        self.assertEqual(GuestDirectory(self.hotel).mergeDuplicates(), 1)
+        self.assertEqual((self.guest.getLoyaltyPoints(), self.program.getPoints()), (170, 170))
+        self.assertEqual(duplicate.getLoyaltyPoints(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from mapped_hotel import exportHotel, MappedHotel
+
+
+class TestMappedHotel(unittest.TestCase):
+    def setUp(self):
+        hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        hotel.addRooms([Room(102, "Standard", 90.0, [amenities]), Room(101, "Deluxe", 150.0, [amenities])])
+        guest = Guest("John Doe", "johndoe@example.com")
+        hotel.addGuest(guest)
+        hotel.addBooking(Booking(7, guest, hotel.getRoom(101), "2025-04-01", "2025-04-05", 600.0))
+        walkIn = Booking(3, Guest("Walk In", "walkin@example.com"), hotel.getRoom(102), "2025-04-02", "2025-04-03", 90.0)
+        hotel.addBooking(walkIn)
+        walkIn.cancelBooking()
+        self.path = os.path.join(tempfile.mkdtemp(), "hotel.map")
+        exportHotel(hotel, self.path)
+        self.mapped = MappedHotel(self.path)
+
+    def tearDown(self):
+        self.mapped.close()
+
+    def testHeaderAndCounts(self):
+        self.assertEqual(self.mapped.getName(), "Grand Hotel")
+        self.assertEqual(self.mapped.getRating(), 5.0)
+        self.assertEqual(self.mapped.getRoomCount(), 2)
+        self.assertEqual(self.mapped.getBookingCount(), 2)
+
+    def testLookupsMaterializeObjectsOnce(self):
+        room = self.mapped.getRoom(101)
+        self.assertEqual(room.getRoomType(), "Deluxe")
+        self.assertTrue(room.getAmenities()[0].getHasAirConditioning())
+        self.assertFalse(room.isAvailable())
+        self.assertIs(self.mapped.getRoom(101), room)
+        self.assertIsNone(self.mapped.getRoom(999))
+
+        booking = self.mapped.getBooking(7)
+        self.assertIs(booking.getRoom(), room)
+        self.assertEqual(booking.getCheckOutDate(), "2025-04-05")
+        self.assertFalse(self.mapped.getBooking(3).isActive())
+        self.assertTrue(self.mapped.getRoom(102).isAvailable())
+
+    def testIterationKeepsOriginalOrder(self):
+        self.assertEqual([room.getRoomNumber() for room in self.mapped.iterRooms()], [102, 101])
+        self.assertEqual([guest.getName() for guest in self.mapped.iterGuests()], ["John Doe"])
+        self.assertEqual([booking.getBookingID() for booking in self.mapped.iterBookings()], [7, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
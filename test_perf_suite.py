@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+import unittest
+import instrumentation
+from perf_suite import OPERATIONS, runSuite, saveBaseline, loadBaseline, compareResults, main
+
+
+class TestPerfSuite(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "baseline.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testRunAndBaseline(self):
+        results = runSuite(size=300, operations=["addRoom", "reserve"])
+        self.assertEqual(set(results), {"addRoom", "reserve"})
+        for result in results.values():
+            self.assertEqual(result["count"], 300)
+            self.assertGreater(result["opsPerSecond"], 0)
+            self.assertLessEqual(result["p50Micros"], result["p95Micros"])
+            self.assertLessEqual(result["p95Micros"], result["p99Micros"])
+            self.assertIn("peakBytes", result)
+
+        saveBaseline(results, self.path, 300, 0)
+        baseline = loadBaseline(self.path)
+        self.assertEqual((baseline["size"], baseline["seed"]), (300, 0))
+        self.assertEqual(compareResults(baseline, results), [])
+
+    def testFeatureOperationsReleaseTheirState(self):
+        before = set(os.listdir(tempfile.gettempdir()))
+        results = runSuite(size=200, operations=["journalMutation", "sqliteAddBooking", "addBookingInstrumented",
+                                                 "publishChange", "asyncReserve"])
+        self.assertTrue(all(result["count"] == 200 for result in results.values()))
+        self.assertFalse(instrumentation.isEnabled())
+        self.assertEqual(set(os.listdir(tempfile.gettempdir())) - before, set())
+
+    def testComparisonFlagsRegressions(self):
+        baseline = {"results": {"addRoom": {"opsPerSecond": 1000.0, "p95Micros": 10.0, "peakBytes": 1000}}}
+        slower = {"addRoom": {"opsPerSecond": 500.0, "p95Micros": 30.0, "peakBytes": 2000},
+                  "addGuest": {"opsPerSecond": 1.0, "p95Micros": 1.0}}
+        self.assertEqual(len(compareResults(baseline, slower)), 3)
+        self.assertEqual(compareResults(baseline, {"addRoom": {"opsPerSecond": 900.0, "p95Micros": 11.0}}), [])
+
+    def testCommandLine(self):
+        self.assertEqual(main(["--size", "200", "--ops", "addGuest", "--no-memory", "--save", self.path]), 0)
+        self.assertEqual(main(["--size", "200", "--ops", "addGuest", "--no-memory", "--compare", self.path,
+                               "--tolerance", "100"]), 0)
+        with self.assertRaises(SystemExit):
+            main(["--size", "300", "--compare", self.path])
+        self.assertTrue(set(OPERATIONS) >= {"addRoom", "reserve", "createInvoice", "loyaltyEarn"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from booking_engine import BookingEngine
+from booking_table import BookingTable
+from pricing_engine import PricingEngine, np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestPricingEngine(unittest.TestCase):
+    def setUp(self):
+        amenities = Amenities(True, True, False, True)
+        self.deluxe = Room(101, "Deluxe", 150.0, [amenities])
+        self.standard = Room(102, "Standard", 100.0, [amenities])
+        weekendRates = [1.0, 1.0, 1.0, 1.0, 1.2, 1.2, 1.0]  # Friday and Saturday nights cost more
+        summer = [1.0] * 5 + [1.5, 1.5, 1.5] + [1.0] * 4
+        self.engine = PricingEngine({"Deluxe": 1.1}, weekendRates, summer)
+
+    def testNightlyRatesApplyRoomTypeDayAndSeason(self):
+        # 2025-05-29 is a Thursday; the stay runs Thursday, Friday and Saturday nights into June
+        rates = self.engine.nightlyRates([150.0, 100.0], ["Deluxe", "Standard"], "2025-05-29", "2025-06-01")
+        self.assertEqual(rates.shape, (2, 3))
+        np.testing.assert_allclose(rates[1], [100.0, 120.0, 120.0])
+        np.testing.assert_allclose(rates[0], [165.0, 198.0, 198.0])
+        np.testing.assert_allclose(self.engine.nightMultipliers("2025-06-02", "2025-06-03"), [1.5])
+
+    def testSurgeAndLoyaltyDiscount(self):
+        np.testing.assert_allclose(self.engine.surgeMultipliers([0.5, 0.85, 1.0]), [1.0, 1.25, 1.5])
+        np.testing.assert_allclose(self.engine.loyaltyDiscounts([0, 999, 1000, 8000]), [0.0, 0.0, 0.05, 0.10])
+
+        guest = Guest("John Doe", "johndoe@example.com")
+        guest.setLoyaltyPoints(1200)
+        self.assertEqual(self.engine.quoteStay(self.standard, "2025-04-07", "2025-04-09", guest), 190.0)
+        self.assertEqual(self.engine.quoteStay(self.standard, "2025-04-07", "2025-04-09", occupancy=[0.85, 1.0]),
+                         275.0)
+        with self.assertRaises(ValueError):
+            self.engine.quoteStay(self.standard, "2025-04-09", "2025-04-07")
+
+    def testQuoteRoomsAndOccupancyFromTable(self):
+        hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        hotel.addRooms([self.deluxe, self.standard])
+        guest = Guest("John Doe", "johndoe@example.com")
+        hotel.addBooking(Booking(1, guest, self.deluxe, "2025-04-07", "2025-04-08", 165.0))
+        occupancy = PricingEngine.occupancyFromTable(BookingTable.fromHotel(hotel), 2, "2025-04-07", "2025-04-09")
+        np.testing.assert_allclose(occupancy, [0.5, 0.0])
+
+        quotes = self.engine.quoteRooms(hotel.findAvailableRooms("2025-04-08", "2025-04-10"), "2025-04-08",
+                                        "2025-04-10")
+        np.testing.assert_allclose(quotes, [330.0, 200.0])
+
+    def testBookingEngineUsesPricing(self):
+        hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        hotel.addRoom(self.standard)
+        booking = BookingEngine(hotel, self.engine).reserve(Guest("John Doe", "johndoe@example.com"), 102,
+                                                             "2025-04-10", "2025-04-12")
+        self.assertEqual(booking.getTotalPrice(), 220.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from pricing_engine import PricingEngine, np
+from quote_cache import QuoteCache
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestQuoteCache(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        self.deluxe = Room(101, "Deluxe", 150.0, [amenities])
+        self.standard = Room(102, "Standard", 100.0, [amenities])
+        self.hotel.addRooms([self.deluxe, self.standard])
+        self.guest = Guest("John Doe", "johndoe@example.com")
+        self.now = 0.0
+        self.cache = QuoteCache(self.hotel, PricingEngine(), maxSize=3, ttl=10.0, clock=lambda: self.now)
+
+    def testHitsMissesAndExpiry(self):
+        self.assertEqual(self.cache.quote("2025-04-01", "2025-04-03"), [(self.deluxe, 300.0), (self.standard, 200.0)])
+        self.cache.quote("2025-04-01", "2025-04-03")
+        self.now = 11.0
+        self.cache.quote("2025-04-01", "2025-04-03")
+        stats = self.cache.getStats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expirations"]), (1, 2, 1))
+
+    def testLeastRecentlyUsedQuoteIsEvicted(self):
+        for day in range(1, 4):
+            self.cache.quote(f"2025-04-0{day}", f"2025-04-0{day + 1}")
+        self.cache.quote("2025-04-01", "2025-04-02")  # Now the most recently used
+        self.cache.quote("2025-04-05", "2025-04-06")
+        self.assertEqual(self.cache.getStats()["evictions"], 1)
+        self.cache.quote("2025-04-01", "2025-04-02")
+        self.assertEqual(self.cache.getStats()["hits"], 2)
+
+    def testBookingChangesInvalidateOnlyAffectedQuotes(self):
+        self.cache.quote("2025-04-01", "2025-04-03", "Deluxe")
+        self.cache.quote("2025-04-10", "2025-04-12", "Deluxe")
+        self.cache.quote("2025-04-01", "2025-04-03", "Standard")
+
+        booking = Booking(1, self.guest, self.deluxe, "2025-04-02", "2025-04-04", 300.0)
+        self.hotel.addBooking(booking)
+        self.assertEqual(self.cache.getStats()["invalidations"], 1)
+        self.assertEqual(self.cache.quote("2025-04-01", "2025-04-03", "Deluxe"), [])
+
+        booking.setCheckOutDate("2025-04-11")
+        self.assertEqual(self.cache.quote("2025-04-10", "2025-04-12", "Deluxe"), [])
+        booking.cancelBooking()
+        self.assertEqual(self.cache.quote("2025-04-10", "2025-04-12", "Deluxe"), [(self.deluxe, 300.0)])
+        self.assertEqual(self.cache.getStats()["hits"], 0)
+
+    def testPriceChangeInvalidatesRoomType(self):
+        self.cache.quote("2025-04-01", "2025-04-03", "Standard")
+        self.standard.setPricePerNight(120.0)
+        self.assertEqual(self.cache.quote("2025-04-01", "2025-04-03", "Standard"), [(self.standard, 240.0)])
+        self.cache.close()
+        self.standard.setPricePerNight(130.0)
+        self.assertEqual(self.cache.getStats()["size"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
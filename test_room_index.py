@@ -0,0 +1,60 @@
+import unittest
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+from room_index import RoomIndex
+from workload import WorkloadGenerator
+
+
+class TestRoomIndex(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.rooms = [
+            Room(101, "Deluxe", 220.0, [Amenities(True, True, False, True)]),
+            Room(102, "Deluxe", 260.0, [Amenities(True, True, False, True)]),
+            Room(103, "Deluxe", 240.0, [Amenities(True, False, True, True)]),
+            Room(104, "Single", 90.0, [Amenities(True, False, False, False), Amenities(False, False, False, True)]),
+        ]
+        self.hotel.addRooms(self.rooms)
+        self.index = RoomIndex(self.hotel)
+
+    def testMultiCriteriaSearch(self):
+        wifiAndAir = Amenities.WIFI | Amenities.AIR_CONDITIONING
+        self.assertEqual(self.index.search(roomType="Deluxe", withAmenities=wifiAndAir,
+                                           withoutAmenities=Amenities.MINIBAR, maxPrice=250.0), [self.rooms[0]])
+        self.assertEqual(self.index.search(withAmenities=wifiAndAir), self.rooms)  # Room 104's amenities combine
+        self.assertEqual(self.index.search(roomType=("Single", "Suite")), [self.rooms[3]])
+        self.assertEqual(self.index.search(minPrice=230.0, maxPrice=260.0), [self.rooms[1], self.rooms[2]])
+        self.assertEqual(self.index.count(minPrice=100.0), 3)
+        self.assertEqual(self.index.search(limit=2, after=101), [self.rooms[1], self.rooms[2]])
+        with self.assertRaises(ValueError):
+            self.index.search(after=999)
+
+    def testFollowsRoomChanges(self):
+        self.rooms[2].setAmenities([Amenities(True, True, False, True)])
+        self.rooms[1].setPricePerNight(199.0)
+        self.rooms[3].setRoomType("Deluxe")
+        self.assertEqual(self.index.count(roomType="Deluxe", withoutAmenities=Amenities.MINIBAR, maxPrice=230.0), 3)
+        self.assertEqual(self.index.getRoomTypes(), ["Deluxe"])
+
+        suite = Room(105, "Suite", 400.0, [Amenities(True, True, True, True)])
+        self.hotel.addRoom(suite)
+        self.assertEqual(self.index.search(withAmenities=Amenities.MINIBAR, minPrice=300.0), [suite])
+        suite.bookRoom()
+        self.assertEqual(self.index.search(roomType="Suite", available=True), [])
+        self.assertEqual(self.index.search(roomType="Suite", available=False), [suite])
+
+    def testStaySearchMatchesScan(self):
+        hotel = WorkloadGenerator(seed=3).buildHotel(300, 100, 2000)
+        index = RoomIndex(hotel)
+        for checkIn, checkOut in (("2025-01-09", "2025-01-12"), ("2025-02-18", "2025-02-19"), ("2025-09-06", "2025-09-13")):
+            scanned = [room for room in hotel.findAvailableRooms(checkIn, checkOut)
+                       if room.getRoomType() == "Double" and room.getAmenities()[0].getFlags() & Amenities.TV
+                       and room.getPricePerNight() <= 150.0]
+            self.assertEqual(index.search(checkIn, checkOut, "Double", Amenities.TV, maxPrice=150.0), scanned)
+        guest = Guest("John Doe", "john@example.com")
+        room = index.search("2025-01-09", "2025-01-12", limit=1)[0]
+        hotel.addBooking(Booking(9999, guest, room, "2025-01-10", "2025-01-11", 100.0))
+        self.assertNotIn(room, index.search("2025-01-09", "2025-01-12"))
+
+
+if __name__ == '__main__':
+    unittest.main()
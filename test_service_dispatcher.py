@@ -0,0 +1,74 @@
+import threading
+import unittest
+from hotel_system import Hotel, Guest, GuestServiceRequest
+from service_dispatcher import ServiceDispatcher
+
+
+class TestServiceDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel("Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        self.guest = Guest("John Doe", "john@example.com")
+        self.other = Guest("Jane Roe", "jane@example.com")
+        self.hotel.addGuests([self.guest, self.other])
+        self.towels = GuestServiceRequest("Housekeeping")
+        self.guest.submitServiceRequest(self.towels)
+        self.dispatcher = ServiceDispatcher(self.hotel, priorities={"Maintenance": 1, "Housekeeping": 3})
+
+    def testClaimOrder(self):
+        leak = GuestServiceRequest("Maintenance")
+        spa = GuestServiceRequest("Spa")
+        sheets = GuestServiceRequest("Housekeeping")
+        for request in (spa, leak, sheets):
+            self.other.submitServiceRequest(request)
+
+        self.assertIs(self.dispatcher.claim("Ann"), leak)  # Most urgent first
+        self.assertIs(self.dispatcher.claim("Bob", serviceType="Housekeeping"), self.towels)  # Then oldest
+        self.assertEqual(self.dispatcher.getClaimedBy(self.towels), "Bob")
+        self.dispatcher.release(self.towels)
+        self.assertIs(self.dispatcher.claim("Cid"), self.towels)  # Released requests keep their age
+        self.assertEqual([self.dispatcher.claim() for _ in range(3)], [sheets, spa, None])
+
+    def testIndexesFollowStatusChanges(self):
+        spa = GuestServiceRequest("Spa")
+        self.other.submitServiceRequest(spa)
+        self.assertEqual(self.dispatcher.getRequests("Pending"), [self.towels, spa])
+
+        self.dispatcher.complete(self.dispatcher.claim())
+        spa.cancelRequest()
+        self.assertEqual(self.dispatcher.getRequests("Completed", "Housekeeping"), [self.towels])
+        self.assertEqual(self.dispatcher.getRequests("Cancelled"), [spa])
+        self.assertEqual(self.dispatcher.getQueuedCount(), 0)
+        self.assertIsNone(self.dispatcher.claim())
+
+        spa.setStatus("Pending")
+        spa.setServiceType("Massage")
+        self.assertEqual(self.dispatcher.getRequests(serviceType="Massage"), [spa])
+        self.assertIsNone(self.dispatcher.claim(serviceType="Spa"))
+        self.assertIs(self.dispatcher.claim(serviceType="Massage"), spa)
+
+        self.hotel.removeGuests([self.other])
+        self.assertEqual(self.dispatcher.getRequests(), [self.towels])
+
+    def testConcurrentWorkers(self):
+        requests = [GuestServiceRequest("Housekeeping") for _ in range(2000)]
+        for request in requests:
+            self.other.submitServiceRequest(request)
+
+        claimed = []
+
+        def work(worker):
+            while (request := self.dispatcher.claim(worker)) is not None:
+                claimed.append(request)
+                self.dispatcher.complete(request)
+
+        threads = [threading.Thread(target=work, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(claimed), len(set(claimed)))
+        self.assertEqual(len(self.dispatcher.getRequests("Completed")), 2001)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from hotel_system import Room, Amenities, Guest, Booking, Invoice
+from sqlite_hotel import SQLiteHotel
+
+
+class TestSQLiteHotel(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "hotel.db")
+        self.hotel = SQLiteHotel(self.path, "Grand Hotel", "123 Main St", 5.0, "hotel@example.com")
+        amenities = Amenities(True, True, False, True)
+        self.hotel.addRooms([Room(101, "Deluxe", 150.0, [amenities]), Room(102, "Standard", 90.0, [amenities])])
+        self.guest = Guest("John Doe", "johndoe@example.com")
+        self.hotel.addGuest(self.guest)
+
+    def tearDown(self):
+        self.hotel.close()
+
+    def testStoresAndLoadsObjects(self):
+        self.hotel.addBooking(Booking(1, self.guest, self.hotel.getRoom(101), "2025-04-01", "2025-04-05", 600.0))
+        reopened = SQLiteHotel(self.path)
+        self.assertEqual(reopened.getName(), "Grand Hotel")
+        booking = reopened.getBooking(1)
+        self.assertEqual(booking.getCheckOutDate(), "2025-04-05")
+        self.assertEqual(booking.getGuest().getName(), "John Doe")
+        self.assertFalse(booking.getRoom().isAvailable())
+        self.assertTrue(booking.getRoom().getAmenities()[0].getHasWiFi())
+        self.assertEqual(reopened.getGuest("johndoe@example.com").getName(), "John Doe")
+        reopened.close()
+
+    def testFindAvailableRoomsAndWriteThrough(self):
+        booking = Booking(1, self.guest, self.hotel.getRoom(101), "2025-04-01", "2025-04-05", 600.0)
+        self.hotel.addBooking(booking)
+        self.assertEqual([room.getRoomNumber() for room in self.hotel.findAvailableRooms("2025-04-02", "2025-04-03")],
+                         [102])
+        self.hotel.getBooking(1).cancelBooking()
+        self.assertEqual(len(self.hotel.findAvailableRooms("2025-04-02", "2025-04-03", "Deluxe")), 1)
+
+        self.hotel.getRoom(102).setPricePerNight(95.0)
+        self.assertEqual(self.hotel.getRoom(102).getPricePerNight(), 95.0)
+        self.hotel.addInvoice(Invoice(1, booking, 600.0))
+        self.hotel.getInvoice(1).markAsPaid()
+        self.assertEqual(self.hotel.getInvoice(1).getPaymentStatus(), "Paid")
+
+    def testBulkBookingsReportDuplicates(self):
+        room = self.hotel.getRoom(101)
+        bookings = (Booking(i, self.guest, room, "2025-04-01", "2025-04-02", 150.0) for i in [1, 2, 2, 3])
+        report = self.hotel.addBookings(bookings)
+        self.assertEqual(report.getAddedCount(), 3)
+        self.assertEqual(report.getRejected()[0][0], 2)
+        self.assertEqual(self.hotel.addRooms([Room(101, "Deluxe", 150.0, [])]).getRejectedCount(), 1)
+
+    def testEachThreadUsesItsOwnConnection(self):
+        errors = []
+
+        def reader():
+            try:
+                self.assertIsNotNone(self.hotel.getRoom(101))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        late = threading.Thread(target=reader)
+        late.start()
+        late.join()
+        self.assertEqual(self.hotel.getConnectionCount(), 2)  # Exited threads' connections were closed
+
+    def testGuestCacheIsBounded(self):
+        hotel = SQLiteHotel(self.path, guestCacheSize=2)
+        guests = [Guest(f"Guest {i}", f"guest{i}@example.com") for i in range(4)]
+        hotel.addGuests(guests)
+        hotel.addBooking(Booking(1, guests[0], hotel.getRoom(101), "2025-04-01", "2025-04-05", 600.0))
+        guests[0].setLoyaltyPoints(500)  # Evicted from the cache, still written through
+        hotel.close()
+
+        reopened = SQLiteHotel(self.path)
+        self.assertEqual(reopened.getGuest("guest0@example.com").getLoyaltyPoints(), 500)
+        self.assertIs(reopened.getBooking(1).getGuest(), reopened.getGuest("guest0@example.com"))
+        reopened.close()
+        with sqlite3.connect(self.path) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM guests").fetchone()[0], 5)
+
+    def testBookingsNeedAKnownRoom(self):
+        stray = Room(999, "Deluxe", 150.0, [])
+        with self.assertRaises(ValueError):
+            self.hotel.addBooking(Booking(5, self.guest, stray, "2025-04-01", "2025-04-02", 150.0))
+        report = self.hotel.addBookings([Booking(6, self.guest, stray, "2025-04-01", "2025-04-02", 150.0),
+                                         Booking(7, self.guest, self.hotel.getRoom(102), "2025-04-01", "2025-04-02", 90.0)])
+        self.assertEqual(report.getAddedCount(), 1)
+        self.assertEqual([reason for _, _, reason in report.getRejected()], ["Room 999 does not exist."])
+        self.assertEqual([booking.getBookingID() for booking in self.hotel.getBookings()], [7])
+
+    def testEvictedGuestsKeepTheirRows(self):
+        hotel = SQLiteHotel(self.path, guestCacheSize=1)
+        guests = [Guest(f"G{i}", "same@example.com") for i in range(3)]  # Same details, different guests
+        hotel.addGuests(guests)
+        guests[0].setName("Renamed")
+        guests[1].setContactInfo("other@example.com")
+        self.assertEqual([guest.getName() for guest in hotel.getGuests()], ["John Doe", "Renamed", "G1", "G2"])
+        self.assertEqual(hotel.getGuest("other@example.com").getName(), "G1")
+        hotel.close()
+
+    def testIteratorsCountersAndRemoval(self):
+        other = Guest("Jane Roe", "jane@example.com")
+        self.hotel.addGuest(other)
+        bookings = [Booking(i, self.guest, self.hotel.getRoom(101 + i % 2), f"2025-04-0{i}", f"2025-04-0{i + 1}", 100.0)
+                    for i in range(1, 6)]
+        self.hotel.addBookings(bookings)
+        self.hotel.getBooking(2).cancelBooking()
+        self.assertEqual((self.hotel.getActiveBookingCount(), self.hotel.getBookedRevenue()), (4, 400.0))
+        self.assertEqual((self.hotel.getAvailableRoomCount(), self.hotel.getAvailableRoomCount("Standard")), (1, 0))
+
+        firstPage = list(self.hotel.iterBookings(limit=2))
+        nextPage = self.hotel.iterBookings(active=True, after=firstPage[-1].getBookingID())
+        self.assertEqual([booking.getBookingID() for booking in nextPage], [3, 4, 5])
+        window = self.hotel.iterBookings(since="2025-04-03", until="2025-04-05", roomType="Deluxe")
+        self.assertEqual([booking.getBookingID() for booking in window], [4])
+        self.assertEqual([room.getRoomNumber() for room in self.hotel.iterRooms(after=101)], [102])
+        self.assertEqual(list(self.hotel.iterGuests(after=self.guest)), [other])
+        with self.assertRaises(ValueError):
+            self.hotel.iterGuests(after=Guest("Stranger", "stranger@example.com"))
+
+        report = self.hotel.addInvoices([Invoice(1, bookings[0], 100.0), Invoice(1, bookings[2], 100.0)])
+        self.assertEqual(report.getRejectedCount(), 1)
+        self.hotel.getBookingInvoice(1).markAsPaid()
+        self.assertEqual(self.hotel.getInvoiceTotal("Paid"), 100.0)
+
+        self.hotel.getBooking(3).setGuest(other)  # Written through, like a merge moving a stay
+        self.assertEqual(self.hotel.getBooking(3).getGuest().getName(), "Jane Roe")
+        self.assertEqual(self.hotel.removeGuests([self.guest, self.guest]), 1)
+        self.assertEqual(self.hotel.getGuests(), [other])
+        self.assertIsNone(self.guest.getHotel())
+
+    def testLoadsInvoicesWithTheirBookings(self):
+        booking = Booking(1, self.guest, self.hotel.getRoom(101), "2025-04-01", "2025-04-05", 600.0)
+        self.hotel.addBooking(booking)
+        self.hotel.addInvoice(Invoice(7, booking, 600.0))
+        invoice = self.hotel.getInvoices()[0]
+        self.assertEqual((invoice.getInvoiceID(), invoice.getBooking().getGuest().getName()), (7, "John Doe"))
+        self.assertIs(self.hotel.getInvoice(7).getBooking().getGuest(), self.hotel.getBookings()[0].getGuest())
+
+
+if __name__ == '__main__':
+    unittest.main()
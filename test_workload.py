@@ -0,0 +1,43 @@
+import unittest
+from hotel_system import Amenities
+from workload import WorkloadGenerator, ROOM_MIX
+
+
+class TestWorkloadGenerator(unittest.TestCase):
+    def testSeededAndRepeatable(self):
+        first, second = WorkloadGenerator(seed=42), WorkloadGenerator(seed=42)
+        describe = lambda hotel: ([(room.getRoomType(), room.getAmenities()[0].getFlags()) for room in hotel.getRooms()],
+                                  [(booking.getGuest().getName(), booking.getRoom().getRoomNumber(),
+                                    booking.getCheckInDay(), booking.getCheckOutDay()) for booking in hotel.getBookings()])
+        self.assertEqual(describe(first.buildHotel(50, 100, 500)), describe(second.buildHotel(50, 100, 500)))
+        self.assertNotEqual(describe(WorkloadGenerator(seed=7).buildHotel(50, 100, 500)),
+                            describe(WorkloadGenerator(seed=42).buildHotel(50, 100, 500)))
+
+    def testRealisticData(self):
+        generator = WorkloadGenerator(seed=1)
+        hotel = generator.buildHotel(200, 1000, 5000)
+        self.assertEqual((len(hotel.getRooms()), len(hotel.getGuests()), len(hotel.getBookings())), (200, 1000, 5000))
+        self.assertTrue({room.getRoomType() for room in hotel.getRooms()} <= set(ROOM_MIX))
+        self.assertTrue(all(room.getAmenities()[0].getFlags() & Amenities.WIFI for room in hotel.getRooms()
+                            if room.getRoomType() == "Suite"))
+
+        stays = {}
+        for booking in hotel.getBookings():
+            self.assertEqual(booking.getTotalPrice(), booking.getNights() * booking.getRoom().getPricePerNight())
+            stays.setdefault(booking.getRoom(), []).append((booking.getCheckInDay(), booking.getCheckOutDay()))
+        for roomStays in stays.values():
+            self.assertTrue(all(previous[1] <= following[0] for previous, following in zip(roomStays, roomStays[1:])))
+
+        regulars = sum(1 for booking in hotel.getBookings() if hotel.getGuests().index(booking.getGuest()) < 100)
+        self.assertGreater(regulars, 5000 * 0.25)  # The first tenth of the guests make about a third of the stays
+
+    def testStreamsLazily(self):
+        generator = WorkloadGenerator()
+        rooms = generator.iterRooms(10 ** 9)
+        self.assertEqual(next(rooms).getRoomNumber(), 1)
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(occupancy=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
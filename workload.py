@@ -0,0 +1,116 @@
+import random
+from datetime import date
+
+from hotel_system import Hotel, Room, Amenities, Guest, Booking
+
+# Room type -> (share of rooms, price per night, chance of WiFi, TV, minibar, air conditioning)
+ROOM_MIX = {
+    "Single": (0.35, 80.0, (0.95, 0.70, 0.05, 0.60)),
+    "Double": (0.40, 120.0, (0.95, 0.90, 0.30, 0.80)),
+    "Deluxe": (0.20, 180.0, (1.00, 1.00, 0.80, 1.00)),
+    "Suite": (0.05, 350.0, (1.00, 1.00, 1.00, 1.00)),
+}
+
+# Nights per stay -> share of stays: mostly short stays with a weekly tail
+STAY_LENGTHS = {1: 0.30, 2: 0.25, 3: 0.15, 4: 0.10, 5: 0.07, 6: 0.04, 7: 0.06, 10: 0.02, 14: 0.01}
+
+# Demand by month, January to December: a summer peak and a December bump
+MONTH_DEMAND = (0.55, 0.60, 0.70, 0.80, 0.90, 1.00, 1.00, 1.00, 0.85, 0.75, 0.60, 0.80)
+
+_FIRST_NAMES = ("Ava", "Ben", "Chloe", "David", "Emma", "Farid", "Grace", "Hiro", "Isabel", "Jonas", "Kemi", "Liam",
+                "Maya", "Noah", "Olga", "Pedro", "Quinn", "Rosa", "Sven", "Tara", "Umar", "Vera", "Wei", "Yara")
+_LAST_NAMES = ("Adams", "Brown", "Costa", "Dubois", "Evans", "Fischer", "Garcia", "Hansen", "Ito", "Jensen", "Khan",
+               "Lopez", "Muller", "Nowak", "Okafor", "Park", "Rossi", "Silva", "Tanaka", "Weber")
+
+
+class WorkloadGenerator:
+    """Represents a seeded source of synthetic hotels, rooms, guests and bookings at any size.
+
+    The same seed always yields the same data. Rooms follow ROOM_MIX for types, prices and amenities. Guests book
+    with a skew toward a core of regulars. Each room's bookings follow on from one another without overlapping,
+    with stays drawn from STAY_LENGTHS, gaps that shrink in high-demand months (MONTH_DEMAND) and a lean toward
+    Friday check-ins. Rooms, guests and bookings are yielded lazily, so sizes in the millions stream into a
+    hotel's bulk loaders without being held twice.
+    """
+
+    def __init__(self, seed: int = 0, startDate: date = date(2025, 1, 1), occupancy: float = 0.75):
+        """Initializes the generator; occupancy is the share of nights booked in the busiest months."""
+        if not 0.0 < occupancy < 1.0:
+            raise ValueError("Occupancy must be between 0 and 1.")
+
+        self.__seed = seed
+        self.__random = random.Random(seed)
+        self.__startDay = startDate.toordinal()
+        self.__occupancy = occupancy
+        self.__nextFree = {}  # Room -> first day its next booking can start
+
+    # Getters
+    def getSeed(self):
+        return self.__seed
+
+    def getStartDate(self):
+        return date.fromordinal(self.__startDay)
+
+    # Methods
+    def iterRooms(self, count: int, firstNumber: int = 1):
+        """Yields count rooms numbered from firstNumber, with types, prices and amenities drawn from ROOM_MIX."""
+        rng = self.__random
+        roomTypes = list(ROOM_MIX)
+        weights = [mix[0] for mix in ROOM_MIX.values()]
+        flags = (Amenities.WIFI, Amenities.TV, Amenities.MINIBAR, Amenities.AIR_CONDITIONING)
+        for roomNumber in range(firstNumber, firstNumber + count):
+            roomType = rng.choices(roomTypes, weights)[0]
+            _, price, chances = ROOM_MIX[roomType]
+            amenityFlags = sum(flag for flag, chance in zip(flags, chances) if rng.random() < chance)
+            yield Room(roomNumber, roomType, price, [Amenities.fromFlags(amenityFlags)])
+
+    def iterGuests(self, count: int, firstNumber: int = 1):
+        """Yields count guests with unique contact info; about a third hold loyalty points."""
+        rng = self.__random
+        for number in range(firstNumber, firstNumber + count):
+            guest = Guest(f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}", f"guest{number}@example.com")
+            if rng.random() < 0.3:
+                guest.setLoyaltyPoints(int(rng.expovariate(1 / 1500)))
+            yield guest
+
+    def iterBookings(self, count: int, guests: list, rooms: list, firstID: int = 1):
+        """Yields count bookings of the rooms by the guests, priced at nights x the room's rate.
+
+        Bookings of the same room never overlap, also across calls on the same generator.
+        """
+        if count > 0 and (not guests or not rooms):
+            raise ValueError("Bookings need at least one guest and one room.")
+
+        rng = self.__random
+        lengths = list(STAY_LENGTHS)
+        lengthWeights = list(STAY_LENGTHS.values())
+        meanStay = sum(nights * weight for nights, weight in STAY_LENGTHS.items()) / sum(lengthWeights)
+        for bookingID in range(firstID, firstID + count):
+            room = rooms[rng.randrange(len(rooms))]
+            guest = guests[int(len(guests) * rng.random() ** 2)]  # Low positions are the regulars
+            day = self.__nextFree.get(room, self.__startDay)
+
+            # Idle nights between stays: fewer when demand is high
+            demand = MONTH_DEMAND[date.fromordinal(day).month - 1] * self.__occupancy
+            checkIn = day + int(rng.expovariate(demand / (meanStay * (1 - demand))))
+            if date.fromordinal(checkIn).weekday() == 3 and rng.random() < 0.4:  # Thursday -> Friday
+                checkIn += 1
+            nights = rng.choices(lengths, lengthWeights)[0]
+            self.__nextFree[room] = checkIn + nights
+
+            yield Booking(bookingID, guest, room, date.fromordinal(checkIn), date.fromordinal(checkIn + nights),
+                          float(nights * room.getPricePerNight()))
+
+    def buildHotel(self, roomCount: int, guestCount: int, bookingCount: int, name: str = "Synthetic Hotel"):
+        """Returns a hotel loaded with generated rooms, guests and bookings through its bulk loaders."""
+        hotel = Hotel(name, "Synthetic", 4.0, f"{name.lower().replace(' ', '.')}@example.com")
+        rooms = list(self.iterRooms(roomCount))
+        guests = list(self.iterGuests(guestCount))
+        hotel.addRooms(rooms)
+        hotel.addGuests(guests)
+        hotel.addBookings(self.iterBookings(bookingCount, guests, rooms))
+        return hotel
+
+    def __str__(self):
+        """Returns a string representation of the workload generator."""
+        return f"WorkloadGenerator | Seed: {self.__seed} | Start: {date.fromordinal(self.__startDay)} | Occupancy: {self.__occupancy:.0%}"